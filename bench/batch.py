@@ -0,0 +1,31 @@
+"""Compare bulk parsing through `parse_many` against constructing URI instances one at a time.
+
+Run from the project root:
+
+	python bench/batch.py
+"""
+
+from collections import deque
+
+from common import measure, report
+from corpus import generate
+
+from uri import URI, parse_many
+
+
+def throughput(fn, corpus) -> float:
+	"""Express whole-batch timings in per-URI operations per second."""
+	
+	return measure(fn, [corpus]) * len(corpus)
+
+
+if __name__ == '__main__':
+	corpus = generate(50000)
+	exhaust = deque(maxlen=0).extend
+	
+	report(f"Bulk parsing, {len(corpus):,} representative URIs:", {
+			'[URI(s) for s in lines]': throughput(lambda c: [URI(s) for s in c], corpus),
+			'list(parse_many(lines))': throughput(lambda c: list(parse_many(c)), corpus),
+			'parse_many(lines), streamed': throughput(lambda c: exhaust(parse_many(c)), corpus),
+			'parse_many(lines, record=True)': throughput(lambda c: exhaust(parse_many(c, record=True)), corpus),
+		}, '[URI(s) for s in lines]')
@@ -0,0 +1,28 @@
+"""Compare decoding request targets from a binary buffer before construction against passing the buffer directly.
+
+Run from the project root:
+
+	python bench/binary.py
+"""
+
+from common import measure, report
+from corpus import generate
+
+from uri import LazyURI, URI
+
+if __name__ == '__main__':
+	corpus = generate()
+	
+	# Simulate request lines received into a socket buffer, with each target addressed by a memoryview slice.
+	buffers = []
+	
+	for string in corpus:
+		target = string.encode('utf-8')
+		line = b'GET ' + target + b' HTTP/1.1\r\n'
+		buffers.append(memoryview(line)[4:4 + len(target)])
+	
+	report(f"Construction and host access, {len(corpus):,} representative URIs:", {
+			'URI(bytes(b).decode()).host': measure(lambda b: URI(bytes(b).decode('utf-8')).host, buffers),
+			'URI(b).host': measure(lambda b: URI(b).host, buffers),
+			'LazyURI(b).host': measure(lambda b: LazyURI(b).host, buffers),
+		}, 'URI(bytes(b).decode()).host')
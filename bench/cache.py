@@ -0,0 +1,35 @@
+"""Measure URI construction from a skewed stream of repeated strings, with and without the parse cache.
+
+A web tier sees the same few thousand URIs over and over; the stream drawn here selects from a working set of 2,000
+distinct URIs with a Zipfian popularity distribution.
+
+Run from the project root:
+
+	python bench/cache.py
+"""
+
+from random import Random
+
+from common import measure, report
+from corpus import generate
+
+from uri import URI
+from uri.cache import ParseCache
+
+if __name__ == '__main__':
+	working = generate(2000)
+	weights = [1 / (rank + 1) for rank in range(len(working))]
+	stream = Random(2023).choices(working, weights, k=20000)
+	
+	results = {'URI(s), uncached': measure(URI, stream)}
+	
+	for size in (256, 1024, 4096):
+		cache = URI.__parse_cache__ = ParseCache(size)
+		results[f'URI(s), cache of {size:,}'] = measure(URI, stream)
+		info = cache.info()
+		print(f"  cache of {size:,}: {info.hits / (info.hits + info.misses):.1%} hit rate")
+	
+	URI.__parse_cache__ = None
+	
+	report(f"Construction from {len(stream):,} strings drawn from {len(working):,} distinct URIs:", results,
+			'URI(s), uncached')
@@ -0,0 +1,67 @@
+"""Compare the percent-encoding and decoding of `uri.codec` against `urllib.parse`.
+
+Inputs are drawn in three shapes: those needing no encoding at all, the common case; ASCII text with spaces and
+reserved characters; and non-ASCII text. Each codec operation is paired with its `urllib.parse` equivalent producing
+identical output.
+
+Run from the project root:
+
+	python bench/codec.py
+"""
+
+from urllib.parse import quote, quote_from_bytes, quote_plus, unquote_plus, unquote_to_bytes
+
+from common import measure, report
+
+from uri.codec import FORM, PATH
+
+INPUTS = {
+		'plain': [f'/path/to/resource-{i}.html' for i in range(1000)],
+		'reserved': [f'/search results/{i} & more?' for i in range(1000)],
+		'unicode': [f'/café/{i}/naïve résumé' for i in range(1000)],
+	}
+
+SAFE = PATH.safe.replace('%', '')  # Encoding already encoded text through urllib would encode the percent signs.
+
+
+def form(string:str) -> str:
+	return quote_plus(string.encode('utf8')).replace('%3F', '?').replace('%2F', '/')
+
+
+if __name__ == '__main__':
+	for shape, strings in INPUTS.items():
+		encoded = [FORM.encode(i) for i in strings]
+		binary = [i.encode('utf-8') for i in strings]
+		
+		report(f"Path encoding, {shape}:", {
+				'urllib.parse.quote': measure(lambda i: quote(i, SAFE), strings),
+				'PATH.encode': measure(PATH.encode, strings),
+			}, 'urllib.parse.quote')
+		
+		report(f"Form encoding, {shape}:", {
+				'urllib.parse.quote_plus': measure(form, strings),
+				'FORM.encode': measure(FORM.encode, strings),
+			}, 'urllib.parse.quote_plus')
+		
+		report(f"Form decoding, {shape}:", {
+				'urllib.parse.unquote_plus': measure(unquote_plus, encoded),
+				'FORM.decode': measure(FORM.decode, encoded),
+			}, 'urllib.parse.unquote_plus')
+		
+		report(f"Batch form encoding of 1000, {shape}:", {
+				'urllib.parse.quote_plus': measure(lambda i: [form(j) for j in i], [strings]),
+				'FORM.encode_many': measure(FORM.encode_many, [strings]),
+			}, 'urllib.parse.quote_plus')
+		
+		report(f"Binary path encoding, {shape}:", {
+				'urllib.parse.quote_from_bytes': measure(lambda i: quote_from_bytes(i, SAFE), binary),
+				'PATH.encode_bytes': measure(PATH.encode_bytes, binary),
+			}, 'urllib.parse.quote_from_bytes')
+		
+		report(f"Binary form decoding, {shape}:", {
+				'urllib.parse.unquote_to_bytes': measure(lambda i: unquote_to_bytes(i.replace(b'+', b' ')),
+						[i.encode('ascii') for i in encoded]),
+				'FORM.decode_bytes': measure(FORM.decode_bytes, [i.encode('ascii') for i in encoded]),
+			}, 'urllib.parse.unquote_to_bytes')
+		
+		print()
@@ -0,0 +1,63 @@
+"""Shared measurement helpers for the benchmark scripts within this directory."""
+
+from gc import collect
+from time import perf_counter
+from tracemalloc import clear_traces, get_traced_memory, is_tracing, start, stop
+
+try:
+	from tracemalloc import reset_peak
+except ImportError:  # Python 3.8; discarding the traces also resets the peak, and blocks freed later are not counted.
+	reset_peak = clear_traces
+
+
+def measure(fn, items, repeat:int=5) -> float:
+	"""Return the best observed throughput, in operations per second, of applying `fn` to each of `items`."""
+	
+	best = float('inf')
+	
+	for _ in range(repeat):
+		collect()
+		start = perf_counter()
+		for item in items: fn(item)
+		best = min(best, perf_counter() - start)
+	
+	return len(items) / best
+
+
+def allocations(fn, items) -> tuple:
+	"""Return the mean peak and retained memory, in bytes, allocated by a single application of `fn` to each item.
+	
+	Measured by `tracemalloc`, one item at a time; the peak captures temporary allocations freed before returning,
+	the retained figure those still referenced afterwards, such as the result.
+	"""
+	
+	tracing = is_tracing()
+	if not tracing: start()
+	
+	peak = retained = 0
+	
+	try:
+		for item in items:
+			collect()
+			before, _ = get_traced_memory()
+			reset_peak()
+			result = fn(item)
+			after, highest = get_traced_memory()
+			peak += highest - before
+			retained += after - before
+			del result
+	
+	finally:
+		if not tracing: stop()
+	
+	return peak / len(items), retained / len(items)
+
+
+def report(title:str, results:dict, baseline:str) -> None:
+	"""Print a table of named throughput results, relative to the named baseline."""
+	
+	print(title)
+	reference = results[baseline]
+	
+	for name, rate in results.items():
+		print(f"  {name:<32} {rate:>12,.0f} ops/s  {rate / reference:>6.2f}x")
@@ -0,0 +1,54 @@
+"""Compare URI equality against strings, as routing tables do, before and after introduction of the comparison key.
+
+Run from the project root:
+
+	python bench/compare.py
+"""
+
+from common import measure, report
+from corpus import generate
+
+from uri import URI
+
+
+class LegacyURI(URI):
+	"""Equality as implemented prior to the comparison key: construct a URI from the other side, then compare parts."""
+	
+	__slots__ = ()
+	
+	def __eq__(self, other):
+		if not isinstance(other, self.__class__):
+			other = self.__class__(other)
+		
+		for part in self.__parts__:
+			if getattr(self, part, None) != getattr(other, part, None):
+				return False
+		
+		return True
+
+
+if __name__ == '__main__':
+	corpus = generate()
+	routes = corpus[:16]  # A small table of constants, none of which match most requests.
+	
+	current = [URI(s) for s in corpus]
+	legacy = [LegacyURI(s) for s in corpus]
+	
+	def scan(uri):
+		for route in routes:
+			if uri == route: return route
+	
+	report(f"Scanning {len(routes)} string routes, {len(corpus):,} representative URIs:", {
+			'LegacyURI == str': measure(scan, legacy, repeat=3) * len(routes),
+			'URI == str': measure(scan, current, repeat=3) * len(routes),
+		}, 'LegacyURI == str')
+	
+	report("Comparing URI instances:", {
+			'LegacyURI == LegacyURI': measure(lambda uri: uri == uri, legacy),
+			'URI == URI': measure(lambda uri: uri == uri, current),
+		}, 'LegacyURI == LegacyURI')
+	
+	report("Comparing against an equal string:", {
+			'LegacyURI == str': measure(lambda pair: pair[0] == pair[1], list(zip(legacy, corpus))),
+			'URI == str': measure(lambda pair: pair[0] == pair[1], list(zip(current, corpus))),
+		}, 'LegacyURI == str')
@@ -0,0 +1,54 @@
+"""A deterministic, representative corpus of URI strings for benchmarking.
+
+The mix approximates what appears in web server access logs and crawl frontiers: mostly HTTP(S) with a long tail of
+other schemes, a skewed distribution of hosts, paths of varying depth, frequent query strings, occasional fragments,
+credentials, explicit ports, IP literals, and internationalized names.
+"""
+
+from random import Random
+
+SCHEMES = ['https'] * 12 + ['http'] * 6 + ['ftp', 'mailto', 'ws', 'postgres', 'redis', 'mongodb', 'file']
+
+HOSTS = [
+		'example.com', 'www.example.com', 'api.example.com', 'cdn.example.net', 'static.example.org',
+		'en.wikipedia.org', 'github.com', 'news.ycombinator.com', 'docs.python.org', 'pypi.org',
+		'img.example.co.uk', 'shop.example.de', 'login.example.jp', 'xn--ls8h.la', 'bücher.example',
+		'127.0.0.1', '10.0.0.12', '[::1]', '[2001:db8::7]', 'localhost',
+	]
+
+SEGMENTS = ['api', 'v1', 'v2', 'users', 'items', 'static', 'css', 'js', 'images', 'blog', '2023', 'search', 'about',
+		'wiki', 'Python_(programming_language)', 'index.html', 'app.js', 'logo.png', 'caf%C3%A9', 'a b']
+
+KEYS = ['id', 'page', 'q', 'sort', 'utm_source', 'utm_medium', 'ref', 'lang', 'limit', 'offset', 'tag', 'debug']
+VALUES = ['1', '42', 'true', 'hello+world', 'caf%C3%A9', 'a%2Fb', 'desc', 'newsletter', 'en-US', '', '100']
+
+
+def generate(count:int=10000, seed:int=2023) -> list:
+	"""Produce `count` distinct-enough URI strings, identical between runs for the same seed."""
+	
+	rng = Random(seed)
+	result = []
+	
+	for i in range(count):
+		scheme = rng.choice(SCHEMES)
+		
+		if scheme == 'mailto':
+			result.append(f"mailto:user{i}@{rng.choice(HOSTS[:10])}")
+			continue
+		
+		host = rng.choice(HOSTS[:5]) if rng.random() < 0.6 else rng.choice(HOSTS)  # Skewed host popularity.
+		auth = f"user{i % 50}:secret@" if rng.random() < 0.05 else ''
+		port = f":{rng.choice((8080, 8443, 5432, 6379, 27017))}" if rng.random() < 0.1 else ''
+		path = '/' + '/'.join(rng.choice(SEGMENTS) for _ in range(rng.randint(0, 5)))
+		if rng.random() < 0.2: path += '/'
+		
+		query = ''
+		if rng.random() < 0.6:
+			query = '?' + '&'.join(f"{rng.choice(KEYS)}={rng.choice(VALUES)}" for _ in range(rng.randint(1, 8)))
+			query += f"&n={i}"  # Defeat trivial result caching by ensuring each string is unique.
+		
+		fragment = '#' + rng.choice(SEGMENTS) if rng.random() < 0.1 else ''
+		
+		result.append(f"{scheme}://{auth}{host}{port}{path}{query}{fragment}")
+	
+	return result
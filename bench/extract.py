@@ -0,0 +1,39 @@
+"""Compare retrieval of one or two query string arguments with, and without, constructing a whole QSO.
+
+Run from the project root:
+
+	python bench/extract.py
+"""
+
+from urllib.parse import parse_qs, urlsplit
+
+from common import measure, report
+from corpus import KEYS, VALUES
+
+from uri import LazyURI, URI
+from uri.qso import QSO, extract
+
+QUERIES = ['&'.join(f'{KEYS[(i + j) % len(KEYS)]}={VALUES[(i * j) % len(VALUES)]}' for j in range(count))
+		for i, count in enumerate([4, 8, 12, 24] * 250)]
+
+URIS = ['https://example.com/search?' + query for query in QUERIES]
+
+
+def whole(query:str):
+	instance = QSO(query)
+	return instance.get('id'), instance.get('page')
+
+
+if __name__ == '__main__':
+	report(f"Two arguments from {len(QUERIES):,} query strings of 4 to 24 parameters:", {
+			'QSO(q).get': measure(whole, QUERIES),
+			'parse_qs(q).get': measure(lambda q: (lambda d: (d.get('id'), d.get('page')))(parse_qs(q)), QUERIES),
+			'extract(q, keys)': measure(lambda q: extract(q, ('id', 'page')), QUERIES),
+		}, 'QSO(q).get')
+	
+	report("One argument from a whole URI:", {
+			"URI(s).query.get": measure(lambda s: URI(s).query.get('id'), URIS),
+			"parse_qs(urlsplit(s).query)": measure(lambda s: parse_qs(urlsplit(s).query).get('id'), URIS),
+			"URI(s).query_get": measure(lambda s: URI(s).query_get('id'), URIS),
+			"LazyURI(s).query_get": measure(lambda s: LazyURI(s).query_get('id'), URIS),
+		}, 'URI(s).query.get')
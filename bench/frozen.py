@@ -0,0 +1,34 @@
+"""Compare dictionary lookup keyed on rendered strings against FrozenURI keys, and conversion between the two types.
+
+Run from the project root:
+
+	python bench/frozen.py
+"""
+
+from common import measure, report
+from corpus import generate
+
+from uri import FrozenURI, URI
+
+if __name__ == '__main__':
+	corpus = generate()
+	
+	uris = [URI(s) for s in corpus]
+	frozen = [FrozenURI(uri) for uri in uris]
+	by_string = {str(uri): True for uri in uris}
+	by_uri = dict.fromkeys(frozen, True)
+	
+	report(f"Repeated dictionary lookup, {len(corpus):,} representative URIs:", {
+			'table[str(uri)]': measure(lambda uri: by_string[str(uri)], uris),
+			'table[frozen]': measure(lambda uri: by_uri[uri], frozen),
+		}, 'table[str(uri)]')
+	
+	report("Conversion from URI:", {
+			'FrozenURI(str(uri))': measure(lambda uri: FrozenURI(str(uri)), uris),
+			'FrozenURI(uri)': measure(FrozenURI, uris),
+		}, 'FrozenURI(str(uri))')
+	
+	report("Conversion from FrozenURI:", {
+			'URI(str(frozen))': measure(lambda uri: URI(str(uri)), frozen),
+			'URI(frozen)': measure(URI, frozen),
+		}, 'URI(str(frozen))')
@@ -0,0 +1,35 @@
+"""Compare IDNA conversion by `uri.idna`, cached per label, against the standard library's `idna` codec.
+
+Hosts are drawn as in a crawl of internationalized sites: a few hundred distinct names, many sharing suffixes,
+repeated throughout.
+
+Run from the project root:
+
+	python bench/idna.py
+"""
+
+from random import Random
+
+from common import measure, report
+
+from uri.idna import to_ascii, to_unicode
+
+LABELS = ['bücher', 'münchen', 'köln', 'straße', 'españa', 'россия', '例え', 'テスト', '中国', 'ελλάδα', 'www', 'shop']
+SUFFIXES = ['de', 'example', 'xn--p1ai', 'jp', 'com', 'co.uk']
+
+rng = Random(2023)
+HOSTS = [f"{rng.choice(LABELS)}{rng.randrange(50)}.{rng.choice(LABELS)}.{rng.choice(SUFFIXES)}" for i in range(10000)]
+ENCODED = [host.encode('idna').decode('ascii') for host in HOSTS]
+
+
+if __name__ == '__main__':
+	report(f"Encoding {len(HOSTS):,} hosts, {len(set(HOSTS)):,} distinct:", {
+			"str.encode('idna')": measure(lambda host: host.encode('idna'), HOSTS),
+			'to_ascii': measure(to_ascii, HOSTS),
+		}, "str.encode('idna')")
+	
+	report("Decoding:", {
+			"bytes.decode('idna')": measure(lambda host: host.encode('ascii').decode('idna'), ENCODED),
+			'to_unicode': measure(to_unicode, ENCODED),
+		}, "bytes.decode('idna')")
+
@@ -0,0 +1,71 @@
+"""Measure the memory retained per URI held in bulk, with and without an intern pool sharing equal components.
+
+URIs are drawn as in a crawl or access log: hosts from a population of 20,000 with Zipfian popularity, so that a few
+hundred account for most references, a handful of user names, and paths from a skewed set of common routes. The
+source strings are allocated beforehand and excluded; the pool itself is created afresh for each measurement and
+included.
+
+Run from the project root:
+
+	python bench/intern.py
+"""
+
+from random import Random
+
+from common import allocations
+
+from uri import LazyURI, URI
+from uri.batch import parse_many
+from uri.intern import InternPool
+
+COUNT = 50000
+ROUTES = ['/', '/index.html', '/robots.txt', '/favicon.ico', '/login', '/search', '/static/css/site.css',
+		'/static/js/app.js', '/api/v1/items', '/api/v1/users', '/blog/', '/about/', '/contact/', '/feed.xml']
+USERS = ['', '', '', '', 'admin@', 'guest@', 'deploy:secret@']
+
+
+def stream(count:int) -> list:
+	rng = Random(2023)
+	hosts = [f"www.site{i}.example.{('com', 'org', 'net', 'io')[i % 4]}" for i in range(20000)]
+	weights = [1 / (rank + 1) for rank in range(len(hosts))]
+	paths = ROUTES + [f'/articles/{i}/' for i in range(500)]
+	path_weights = [1 / (rank + 1) for rank in range(len(paths))]
+	
+	return [f"https://{rng.choice(USERS)}{host}{path}" for host, path in zip(
+			rng.choices(hosts, weights, k=count), rng.choices(paths, path_weights, k=count))]
+
+
+def bulk(construct, populate:bool=False):
+	def fn(strings):
+		result = list(construct(strings))
+		
+		if populate:  # Materialize the components of lazy instances, as any consumer examining them would.
+			for uri in result: uri.user, uri.host, uri.path
+		
+		return result
+	
+	return fn
+
+
+if __name__ == '__main__':
+	strings = stream(COUNT)
+	operations = {
+			'URI': bulk(lambda strings: [URI(i) for i in strings]),
+			'LazyURI, examined': bulk(lambda strings: [LazyURI(i) for i in strings], True),
+			'parse_many': bulk(parse_many),
+		}
+	
+	print(f"{COUNT:,} URI; {len(set(strings)):,} distinct strings.")
+	print(f"{'retained bytes/URI':<28}{'unpooled':>14}{'pooled':>14}{'saving':>10}")
+	
+	for name, fn in operations.items():
+		URI.__intern_pool__ = None
+		_, unpooled = allocations(fn, [strings])
+		
+		pool = URI.__intern_pool__ = InternPool()
+		_, pooled = allocations(fn, [strings])
+		info = pool.info()
+		URI.__intern_pool__ = None
+		
+		print(f"{name:<28}{unpooled / COUNT:>14,.0f}{pooled / COUNT:>14,.0f}{1 - pooled / unpooled:>10.1%}"
+				f"  (pool of {info.currsize:,}, {info.ratio:.1%} hit rate)")
@@ -0,0 +1,29 @@
+"""Compare eager URI construction against LazyURI where only one or two components are examined.
+
+Run from the project root:
+
+	python bench/lazy.py
+"""
+
+from common import measure, report
+from corpus import generate
+
+from uri import LazyURI, URI
+
+if __name__ == '__main__':
+	corpus = generate()
+	
+	report(f"Construction and host access, {len(corpus):,} representative URIs:", {
+			'URI(s).host': measure(lambda s: URI(s).host, corpus),
+			'LazyURI(s).host': measure(lambda s: LazyURI(s).host, corpus),
+		}, 'URI(s).host')
+	
+	report("Construction and path access:", {
+			'URI(s).path': measure(lambda s: URI(s).path, corpus),
+			'LazyURI(s).path': measure(lambda s: LazyURI(s).path, corpus),
+		}, 'URI(s).path')
+	
+	report("Construction and serialization:", {
+			'str(URI(s))': measure(lambda s: str(URI(s)), corpus),
+			'str(LazyURI(s))': measure(lambda s: str(LazyURI(s)), corpus),
+		}, 'str(URI(s))')
@@ -0,0 +1,71 @@
+"""Measure the cost of parsing adversarial query strings with, and without, limits upon their size.
+
+Without limits each input is parsed in full; with limits it is rejected as soon as the excess is found, raising
+LimitExceeded.
+
+Run from the project root:
+
+	python bench/limit.py
+"""
+
+from time import perf_counter
+
+from uri import QSO, URI
+from uri.limit import LimitExceeded, Limits
+
+LIMITS = Limits(parameters=256, name=128, value=4096, length=65536)
+
+INPUTS = {
+		'100k parameters, 1 MB': '&'.join(f'p{i}=v' for i in range(100_000)),
+		'100k repeated names': '&'.join(['key=value'] * 100_000),
+		'one 1 MB value': 'key=' + 'v' * 1_000_000,
+		'1k parameters, 60 KB': '&'.join(f'param{i:04}=' + 'v' * 48 for i in range(1000)),
+	}
+
+
+def parse(text:str, limits) -> None:
+	try:
+		len(QSO(text, limits=limits))  # Force parsing of otherwise lazily parsed text.
+	except LimitExceeded:
+		pass
+
+
+def stream(text:str, limits) -> None:
+	content = text.encode('ascii')
+	
+	try:
+		QSO.from_stream((content[i:i + 4096] for i in range(0, len(content), 4096)), limits=limits)
+	except LimitExceeded:
+		pass
+
+
+def url(text:str, limits) -> None:
+	QSO.__limits__ = limits
+	
+	try:
+		len(URI('https://example.com/?' + text).query)
+	except LimitExceeded:
+		pass
+	finally:
+		QSO.__limits__ = None
+
+
+def timed(fn, text:str, limits, repeat:int=3) -> float:
+	"""The best observed time, in milliseconds."""
+	
+	best = float('inf')
+	
+	for _ in range(repeat):
+		start = perf_counter()
+		fn(text, limits)
+		best = min(best, perf_counter() - start)
+	
+	return best * 1e3
+
+
+if __name__ == '__main__':
+	print(f"{'input':<24}{'operation':<14}{'unlimited':>12}{'limited':>12}  (milliseconds)")
+	
+	for name, text in INPUTS.items():
+		for fn in (parse, stream, url):
+			print(f"{name:<24}{fn.__name__:<14}{timed(fn, text, None):>12,.2f}{timed(fn, text, LIMITS):>12,.2f}")
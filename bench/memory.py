@@ -0,0 +1,51 @@
+"""Measure the memory retained per parameter by parsed query strings, as held in bulk by analytics workloads.
+
+The query text itself is allocated beforehand and excluded; the figures are for the parsed structure, including the
+decoded names and values. The lists of tuples produced by `urllib.parse.parse_qsl` are measured for reference.
+
+Run from the project root:
+
+	python bench/memory.py
+"""
+
+from urllib.parse import parse_qsl
+
+from common import allocations
+
+from uri import FrozenQSO, QSO
+
+
+def query(size:int, index:int) -> str:
+	"""A query string with `size` parameters, a quarter of which repeat a single tracking key."""
+	
+	return '&'.join(f'utm=campaign{i}' if i % 4 == 0 else f'param{i}=value{index}' for i in range(size))
+
+
+def parsed(cls):
+	def parse(text):
+		instance = cls(text)
+		len(instance)  # Populate the parsed structure.
+		return instance
+	
+	return parse
+
+
+if __name__ == '__main__':
+	sizes = (4, 16, 64, 512)
+	operations = {
+			'QSO': parsed(QSO),
+			'FrozenQSO': parsed(FrozenQSO),
+			'parse_qsl': parse_qsl,
+		}
+	
+	print(f"{'retained bytes/param':<28}" + ''.join(f"{f'{size:,} params':>14}" for size in sizes))
+	
+	for name, fn in operations.items():
+		row = []
+		
+		for size in sizes:
+			texts = [query(size, i) for i in range(200)]
+			_, retained = allocations(fn, texts)
+			row.append(retained / size)
+		
+		print(f"{name:<28}" + ''.join(f"{value:>14,.0f}" for value in row))
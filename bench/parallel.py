@@ -0,0 +1,38 @@
+"""Measure how `parse_parallel` scales with the number of worker processes.
+
+Run from the project root, optionally specifying the corpus size:
+
+	python bench/parallel.py [count]
+"""
+
+from collections import deque
+from os import cpu_count
+from sys import argv
+from time import perf_counter
+
+from corpus import generate
+
+from uri.parallel import parse_parallel, process
+
+if __name__ == '__main__':
+	corpus = generate(int(argv[1]) if len(argv) > 1 else 200000)
+	exhaust = deque(maxlen=0).extend
+	
+	start = perf_counter()
+	process(corpus)
+	single = len(corpus) / (perf_counter() - start)
+	
+	print(f"Parse and normalize, {len(corpus):,} representative URIs, {cpu_count()} CPUs available:")
+	print(f"  {'in-process':<32} {single:>12,.0f} ops/s  {1:>6.2f}x")
+	
+	workers = 1
+	
+	while workers <= (cpu_count() or 1):
+		for ordered in (True, False):
+			start = perf_counter()
+			exhaust(parse_parallel(corpus, workers=workers, chunksize=5000, ordered=ordered))
+			rate = len(corpus) / (perf_counter() - start)
+			label = f"{workers} worker{'s' if workers > 1 else ''}, {'ordered' if ordered else 'unordered'}"
+			print(f"  {label:<32} {rate:>12,.0f} ops/s  {rate / single:>6.2f}x")
+		
+		workers *= 2
@@ -0,0 +1,58 @@
+"""Compare URI construction through the single-pass splitter against the prior `urlsplit` + `setattr` cascade.
+
+Run from the project root:
+
+	python bench/parse.py
+"""
+
+from urllib.parse import urlsplit
+
+from common import measure, report
+from corpus import generate
+
+from uri import URI
+from uri.parse.rfc3986 import split
+from uri.part.uri import URIPart
+
+_urlsplit = getattr(urlsplit, '__wrapped__', urlsplit)  # Measure parsing, not the `functools.lru_cache` on 3.11+.
+
+
+class LegacyURIPart(URIPart):
+	"""The whole-URI assignment as implemented prior to the introduction of `uri.parse.rfc3986`."""
+	
+	__slots__ = ()
+	
+	def __set__(self, obj, value):
+		for part in URI.__slots__:
+			setattr(obj, part, None)
+		
+		if not value:
+			return
+		
+		result = _urlsplit(str(value))
+		
+		obj._trailing = result.path.endswith('/')
+		
+		for part in ('scheme', 'username', 'password', 'hostname', 'port', 'path', 'query', 'fragment'):
+			pvalue = getattr(result, part)
+			if pvalue:
+				setattr(obj, part, pvalue)
+
+
+class LegacyURI(URI):
+	__slots__ = ()
+	
+	uri = LegacyURIPart(URI.__parts__)
+
+
+if __name__ == '__main__':
+	corpus = generate()
+	
+	assert all(str(URI(i)) == str(LegacyURI(i)) for i in corpus), "Parsers disagree."
+	
+	report(f"URI construction, {len(corpus):,} representative URIs:", {
+			'urlsplit (components only)': measure(_urlsplit, corpus),
+			'split (components only)': measure(split, corpus),
+			'URI, urlsplit + setattr': measure(LegacyURI, corpus),
+			'URI, single-pass': measure(URI, corpus),
+		}, 'URI, urlsplit + setattr')
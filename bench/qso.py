@@ -0,0 +1,58 @@
+"""Measure keyed removal and replacement within query strings of increasing size, as an API gateway rewriting them does.
+
+With indexed buckets the cost per operation should remain flat as the number of parameters grows.
+
+Run from the project root:
+
+	python bench/qso.py
+"""
+
+from time import perf_counter
+
+from uri import QSO
+
+
+def rewrite(size:int) -> QSO:
+	"""Construct a query string with `size` parameters, a quarter of which repeat a single tracking key."""
+	
+	return QSO('&'.join(f'utm={i}' if i % 4 == 0 else f'param{i}={i}' for i in range(size)))
+
+
+def timed(operation, size:int, repeat:int=5) -> float:
+	"""The best observed time, in microseconds, to apply the operation to a freshly constructed query string."""
+	
+	best = float('inf')
+	
+	for _ in range(repeat):
+		instance = rewrite(size)
+		start = perf_counter()
+		operation(instance, size)
+		best = min(best, perf_counter() - start)
+	
+	return best * 1e6
+
+
+def delete_repeated(instance, size):
+	del instance['utm']
+
+
+def replace_repeated(instance, size):
+	instance['utm'] = 'rewritten'
+
+
+def pop_each(instance, size):
+	for i in range(1, size // 2):
+		if i % 4: instance.pop(f'param{i}')
+
+
+def delete_buckets(instance, size):
+	for bucket in list(instance)[::3]:
+		del instance[bucket]
+
+
+if __name__ == '__main__':
+	sizes = (100, 1000, 10000)
+	print(f"{'operation':<28}" + ''.join(f"{f'{size:,} params':>16}" for size in sizes) + "  (microseconds)")
+	
+	for operation in (delete_repeated, replace_repeated, pop_each, delete_buckets):
+		print(f"{operation.__name__:<28}" + ''.join(f"{timed(operation, size):>16,.0f}" for size in sizes))
@@ -0,0 +1,58 @@
+"""Measure repeated rendering of the same URI, as request handlers commonly do, with and without the render cache.
+
+Run from the project root:
+
+	python bench/render.py
+"""
+
+from common import measure, report
+from corpus import generate
+
+from uri import URI
+from uri.part.uri import URIPart
+
+
+class UncachedURIPart(URIPart):
+	"""Whole-URI rendering as implemented prior to the introduction of the render cache."""
+	
+	__slots__ = ()
+	
+	def __get__(self, obj, cls=None):
+		components = []
+		
+		for part in self.parts:
+			value = getattr(obj, part)
+			part = getattr(cls, part)
+			
+			components.append(part.render(obj, value, self.raw))
+		
+		return "".join(components)
+
+
+class UncachedURI(URI):
+	__slots__ = ()
+	
+	uri = UncachedURIPart(URI.__parts__)
+
+
+def render(uri, times=8):
+	uri._cache = None  # Each measurement begins with a freshly parsed, never rendered, URI.
+	
+	for _ in range(times):
+		str(uri)
+
+
+if __name__ == '__main__':
+	corpus = generate()
+	uncached = [UncachedURI(i) for i in corpus]
+	cached = [URI(i) for i in corpus]
+	
+	report(f"Rendering each of {len(corpus):,} representative URIs once:", {
+			'uncached': measure(lambda u: render(u, 1), uncached),
+			'cached': measure(lambda u: render(u, 1), cached),
+		}, 'uncached')
+	
+	report("Rendering each eight times:", {
+			'uncached': measure(render, uncached),
+			'cached': measure(render, cached),
+		}, 'uncached')
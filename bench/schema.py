@@ -0,0 +1,49 @@
+"""Compare typed decoding of query strings by a compiled QSOSchema against manual conversion on top of QSO.
+
+Run from the project root:
+
+	python bench/schema.py
+"""
+
+from common import measure, report
+from corpus import KEYS, VALUES
+
+from uri import QSO, URI
+from uri.schema import QSOSchema
+
+SCHEMA = QSOSchema(page=(int, 1), tag=[str], debug=bool, limit=(int, 10))
+
+QUERIES = [
+		'&'.join([f'page={i % 7}', f'limit={i % 50}', *(f'tag=t{j}' for j in range(i % 4)), *(['debug=true'] * (i % 2)),
+				*(f'{KEYS[(i + j) % len(KEYS)]}x={VALUES[j % len(VALUES)]}' for j in range(i % 12))])
+		for i in range(1000)
+	]
+
+URIS = ['https://example.com/search?' + query for query in QUERIES]
+
+
+def manual(query) -> dict:
+	"""Conversion as typically scattered across request handlers."""
+	
+	instance = query if isinstance(query, QSO) else QSO(query)
+	tags = instance.get('tag', ())
+	
+	return {
+			'page': int(instance['page']) if 'page' in instance else 1,
+			'tag': [tags] if isinstance(tags, str) else list(tags),
+			'debug': instance.get('debug') == 'true',
+			'limit': int(instance['limit']) if 'limit' in instance else 10,
+		}
+
+
+if __name__ == '__main__':
+	report(f"Four typed arguments from {len(QUERIES):,} query strings:", {
+			'manual conversion of QSO': measure(manual, QUERIES),
+			'QSOSchema.decode': measure(SCHEMA.decode, QUERIES),
+			'QSOSchema.record': measure(SCHEMA.record, QUERIES),
+		}, 'manual conversion of QSO')
+	
+	report("From the query string of a URI:", {
+			'manual conversion of URI.query': measure(lambda s: manual(URI(s).query), URIS),
+			'QSOSchema.decode(URI)': measure(lambda s: SCHEMA.decode(URI(s)), URIS),
+		}, 'manual conversion of URI.query')
@@ -0,0 +1,51 @@
+"""Measure the cost of resolving scheme names not yet cached, and of reading the index of registered schemes.
+
+Previously each scheme name not yet cached examined the metadata of every installed distribution; the index is now
+read once, from installed metadata or from an on-disk snapshot. The cost of that examination grows with the number of
+distributions installed in the measuring environment.
+
+Run from the project root:
+
+	python bench/scheme.py
+"""
+
+from importlib.metadata import entry_points
+from os.path import join
+from tempfile import TemporaryDirectory
+
+from common import measure, report
+
+from uri import URI, registry
+from uri.scheme import Scheme
+
+NAMES = [f'x-scheme-{i}' for i in range(200)]
+
+
+def lookup(name:str) -> Scheme:
+	"""Scheme resolution as previously performed, for a name not yet cached."""
+	
+	try: return entry_points(group='uri.scheme')[name].load()(name)
+	except KeyError: return Scheme(name)
+
+
+def cold(name:str) -> Scheme:
+	"""Scheme resolution through the index, for a name not yet cached."""
+	
+	URI.scheme.generic.pop(name, None)
+	return URI.scheme.load(name)
+
+
+if __name__ == '__main__':
+	report("Resolution of an uncached scheme name:", {
+			'entry_points() per name': measure(lookup, NAMES),
+			'SchemePart.load': measure(cold, NAMES),
+		}, 'entry_points() per name')
+	
+	with TemporaryDirectory() as directory:
+		path = join(directory, 'schemes.json')
+		registry.write(path, registry.scan())
+		
+		report("Reading the index:", {
+				'installed metadata': measure(lambda _: registry.scan(), range(20)),
+				'snapshot': measure(registry.read, [path] * 20),
+			}, 'installed metadata')
@@ -0,0 +1,96 @@
+"""Compare the peak memory and time of decoding, and of encoding, a large form body whole, against doing so
+incrementally.
+
+Run from the project root:
+
+	python bench/stream.py
+"""
+
+from gc import collect
+from io import BytesIO
+from os import devnull
+from time import perf_counter
+from tracemalloc import get_traced_memory, reset_peak, start, stop
+from urllib.parse import parse_qsl
+
+from uri import QSO
+from uri.parse.form import FormDecoder
+
+
+def body(size:int) -> bytes:
+	"""A form body of `size` parameters, as might be submitted by a bulk export."""
+	
+	return '&'.join(f'field{i}=value+{i}+caf%C3%A9' for i in range(size)).encode('ascii')
+
+
+def build(size:int) -> QSO:
+	"""A modified query string of `size` parameters, lacking any retained text or rendering."""
+	
+	instance = QSO()
+	instance.extend(f'field{i}=value {i} café' for i in range(size))
+	return instance
+
+
+def consume(source):
+	for bucket in FormDecoder().decode(source): pass
+
+
+def profile(fn, content:bytes) -> tuple:
+	"""The elapsed time, in milliseconds, and peak memory allocated, in megabytes, of applying `fn`.
+	
+	Memory is traced in a separate run, as tracing slows allocation.
+	"""
+	
+	collect()
+	began = perf_counter()
+	fn(content)
+	elapsed = perf_counter() - began
+	
+	collect()
+	start()
+	before, _ = get_traced_memory()
+	reset_peak()
+	result = fn(content)
+	_, peak = get_traced_memory()
+	stop()
+	del result
+	
+	return elapsed * 1e3, (peak - before) / 1e6
+
+
+if __name__ == '__main__':
+	content = body(100_000)
+	operations = {
+			'QSO(body.decode())': lambda content: len(QSO(content.decode('utf-8'))),
+			'QSO.from_stream(file)': lambda content: len(QSO.from_stream(BytesIO(content))),
+			'parse_qsl(body.decode())': lambda content: parse_qsl(content.decode('utf-8'), keep_blank_values=True),
+			'FormDecoder().decode(file)': lambda content: consume(BytesIO(content)),
+		}
+	
+	print(f"Decoding a {len(content) / 1e6:.1f} MB form body; the body itself is excluded.")
+	
+	for name, fn in operations.items():
+		elapsed, peak = profile(fn, content)
+		print(f"  {name:<32} {elapsed:>8,.0f} ms  {peak:>8,.1f} MB peak")
+	
+	instance = build(100_000)
+	
+	with open(devnull, 'wb') as sink:
+		def whole(instance):
+			instance._canonical = None  # Measure encoding, not retrieval of the retained rendering.
+			return sink.write(str(instance).encode('utf-8'))
+		
+		def streamed(instance):
+			instance._canonical = None
+			return instance.write_to(sink)
+		
+		operations = {
+				'sink.write(str(qso).encode())': whole,
+				'qso.write_to(sink)': streamed,
+			}
+		
+		print(f"Encoding {len(instance):,} modified parameters to a file.")
+		
+		for name, fn in operations.items():
+			elapsed, peak = profile(fn, instance)
+			print(f"  {name:<32} {elapsed:>8,.0f} ms  {peak:>8,.1f} MB peak")
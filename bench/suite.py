@@ -0,0 +1,187 @@
+"""A micro-benchmark suite covering the hot paths of URI: parsing, rendering, resolution, comparison, and QSO use.
+
+Inputs are drawn from the correctness suite's own corpora (the examples of `test_uri`, `test_whatwg`,
+`test_url_normalize`, `test_rfc3986_5_4_1`, `test_qso`, and `test_bucket`) plus the representative generated corpus
+used by the other benchmarks. Where `urllib.parse` offers an equivalent operation, it is measured alongside.
+
+For each case the best observed throughput, in operations per second, and the mean peak and retained memory
+allocated per operation, in bytes, are reported. Results may be written as JSON, and compared against those of a prior
+run to identify regressions between releases.
+
+Run from the project root:
+
+	python bench/suite.py                             # Report all cases.
+	python bench/suite.py -k qso                      # Only cases whose names contain "qso".
+	python bench/suite.py --json results.json         # Also record the results.
+	python bench/suite.py --compare results.json      # Report the change relative to a recorded run.
+"""
+
+import sys
+from argparse import ArgumentParser
+from json import dump, load
+from pathlib import Path
+from platform import python_implementation, python_version
+from urllib.parse import parse_qsl, quote_plus, urlencode, urljoin, urlsplit, urlunsplit
+
+from common import allocations, measure
+from corpus import generate
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'test'))  # Reuse the correctness corpora.
+
+import test_bucket, test_qso, test_rfc3986_5_4_1, test_uri, test_url_normalize, test_whatwg  # noqa: E402
+
+import uri  # noqa: E402
+from uri import Bucket, QSO, URI  # noqa: E402
+
+_urlsplit = getattr(urlsplit, '__wrapped__', urlsplit)  # Measure parsing, not the `functools.lru_cache` on 3.11+.
+
+
+def corpora() -> dict:
+	"""Gather the named input corpora from the correctness suite and the generated representative corpus."""
+	
+	strings = [string for module in (test_uri, test_whatwg, test_url_normalize) for string, _ in module.URI_COMPONENTS]
+	references = [*test_rfc3986_5_4_1.TestNormalExamples.EXAMPLES, *test_rfc3986_5_4_1.TestAbnormalExamples.EXAMPLES]
+	queries = [string for string, _, _ in test_qso.EXAMPLES] + [string for string, _ in test_qso.MULTI_VALUE_EXAMPLES]
+	
+	return {
+			'strings': strings + generate(2000),
+			'base': str(test_rfc3986_5_4_1.ReferenceResolutionExample.BASE),
+			'references': references,
+			'queries': queries,
+			'buckets': [Bucket(*arguments) for _, arguments, _, _, valid in test_bucket.EXAMPLES if valid],
+		}
+
+
+def divisible(base:URI, reference:str) -> bool:
+	"""Path-like division rejects references that would escape the root of the path, or change the scheme."""
+	
+	try:
+		base / reference
+	except ValueError:
+		return False
+	
+	return True
+
+
+def cases(data:dict) -> list:
+	"""Define the benchmark cases as (name, items, function, baseline) tuples.
+	
+	The baseline, if any, is an (items, function) pair measuring the `urllib.parse` equivalent against its own
+	representation of the same inputs.
+	"""
+	
+	strings = data['strings']
+	uris = [URI(string) for string in strings]
+	others = [URI(string) for string in strings]
+	parts = [_urlsplit(string) for string in strings]
+	base = URI(data['base'])
+	references = data['references']
+	divisions = [reference for reference in references if divisible(base, reference)]
+	queries = data['queries']
+	qsos = [QSO(query) for query in queries]
+	pairs = [parse_qsl(query, keep_blank_values=True) for query in queries]
+	buckets = data['buckets']
+	
+	def render(instance):
+		instance._cache = None  # Measure rendering, not retrieval of the cached rendering.
+		return str(instance)
+	
+	def compare(pair):
+		pair[0]._cache = pair[1]._cache = None  # Measure comparison, not retrieval of cached comparison keys.
+		return pair[0] == pair[1]
+	
+	def canonical(instance):
+		instance._canonical = None  # Measure encoding, not retrieval of the cached canonical form.
+		return instance.canonical
+	
+	def encoded(bucket):
+		bucket._str = None  # Measure encoding, not retrieval of the cached encoded form.
+		return str(bucket)
+	
+	def mutate(query):
+		instance = QSO(query)
+		instance['key'] = 'value'
+		instance.append('foo=bar')
+		del instance['foo']
+		return str(instance)
+	
+	def resolve(reference):
+		return urljoin(data['base'], reference)
+	
+	def encode(bucket):
+		return '='.join(quote_plus(i) for i in bucket)
+	
+	return [
+			('uri.parse', strings, URI, (strings, _urlsplit)),
+			('uri.render', uris, render, (parts, urlunsplit)),
+			('uri.render.cached', uris, str, None),
+			('uri.resolve', references, base.resolve, (references, resolve)),
+			('uri.divide', divisions, lambda reference: base / reference, (divisions, resolve)),
+			('uri.compare.string', list(zip(uris, strings)), lambda pair: pair[0] == pair[1], None),
+			('uri.compare.uri', list(zip(uris, others)), compare, None),
+			('qso.parse', queries, QSO, (queries, lambda query: parse_qsl(query, keep_blank_values=True))),
+			('qso.render', qsos, str, (pairs, urlencode)),
+			('qso.canonical', qsos, canonical, (pairs, urlencode)),
+			('qso.mutate', queries, mutate, None),
+			('bucket.render', buckets, encoded, (buckets, encode)),
+			('bucket.compare', list(zip(buckets, reversed(buckets))), lambda pair: pair[0] == pair[1], None),
+		]
+
+
+def run(selection:str='', repeat:int=5) -> dict:
+	"""Execute the selected benchmark cases, returning their results keyed by case name."""
+	
+	results = {}
+	
+	for name, items, fn, baseline in cases(corpora()):
+		if selection not in name: continue
+		
+		peak, retained = allocations(fn, items)
+		result = results[name] = {'ops': measure(fn, items, repeat), 'peak': peak, 'retained': retained}
+		
+		if baseline:
+			result['urllib'] = measure(baseline[1], baseline[0], repeat)
+	
+	return results
+
+
+def display(results:dict, previous:dict=None) -> None:
+	"""Print a table of results, including the relative change from a previous run's results, if given."""
+	
+	change = f"  {'change':>7}" if previous else ''
+	print(f"{'case':<20} {'ops/s':>12} {'urllib ops/s':>14} {'peak B/op':>10} {'kept B/op':>10}{change}")
+	
+	for name, result in results.items():
+		urllib = f"{result['urllib']:>14,.0f}" if 'urllib' in result else f"{'-':>14}"
+		change = ''
+		
+		if previous and name in previous:
+			change = f"  {result['ops'] / previous[name]['ops'] - 1:>+7.1%}"
+		
+		print(f"{name:<20} {result['ops']:>12,.0f} {urllib} {result['peak']:>10,.0f} {result['retained']:>10,.0f}{change}")
+
+
+if __name__ == '__main__':
+	parser = ArgumentParser(description=__doc__.partition('\n')[0])
+	parser.add_argument('-k', dest='selection', default='', help="only run cases whose names contain this text")
+	parser.add_argument('-r', '--repeat', type=int, default=5, help="timing repetitions; the best is reported")
+	parser.add_argument('--json', metavar='PATH', help="write machine-readable results to this file")
+	parser.add_argument('--compare', metavar='PATH', help="report the change relative to previously written results")
+	options = parser.parse_args()
+	
+	results = run(options.selection, options.repeat)
+	previous = None
+	
+	if options.compare:
+		with open(options.compare) as fh:
+			previous = load(fh)['results']
+	
+	display(results, previous)
+	
+	if options.json:
+		with open(options.json, 'w') as fh:
+			dump({
+					'uri': uri.__version__,
+					'python': f"{python_implementation()} {python_version()}",
+					'results': results,
+				}, fh, indent='\t')
@@ -66,3 +66,53 @@ class TestBucketExamplesInvalid:
 	def test_strict_string_failure(self, string, args, name, value, valid):
 		with pytest.raises(ValueError):
 			Bucket(string, strict=True)
+
+
+class TestBucketEncoding:
+	def test_encoded_form_retained(self):
+		bucket = Bucket('name', 'a value')
+		assert str(bucket) is str(bucket)
+	
+	def test_name_reassignment_discards(self):
+		bucket = Bucket('name', 'value')
+		assert str(bucket) == 'name=value'
+		bucket.name = 'other name'
+		assert str(bucket) == 'other+name=value'
+	
+	def test_value_reassignment_discards(self):
+		bucket = Bucket('name', 'value')
+		assert str(bucket) == 'name=value'
+		bucket.value = 'a/b?c'
+		assert str(bucket) == 'name=a/b?c'
+	
+	def test_copy_retains(self):
+		bucket = Bucket('name', 'value')
+		encoded = str(bucket)
+		assert str(Bucket(bucket)) is encoded
+	
+	def test_copy_with_other_separator(self):
+		bucket = Bucket('name', 'value')
+		str(bucket)
+		assert str(Bucket(bucket, sep=':')) == 'name:value'
+
+
+class TestBucketStructure:
+	def test_equal_buckets(self):
+		assert Bucket('name', 'value') == Bucket('name', 'value')
+		assert Bucket('name', 'value') != Bucket('name', 'other')
+		assert Bucket('value') != Bucket('', 'value')
+	
+	def test_equivalent_encodings(self):
+		assert Bucket('name', 'a b') == 'name=a+b'
+		assert Bucket('name', 'a b') == 'name=a%20b'
+	
+	def test_tuple_comparison(self):
+		assert Bucket('name', 'value') == ('name', 'value')
+	
+	def test_incomparable(self):
+		assert Bucket('name', 'value') != 27
+		assert not (Bucket('name', 'value') == None)  # noqa: E711
+	
+	def test_hash(self):
+		assert hash(Bucket('name', 'value')) == hash(Bucket('name=value'))
+		assert len({Bucket('name', 'value'), Bucket('name=value'), Bucket('name', 'other')}) == 2
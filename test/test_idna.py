@@ -0,0 +1,105 @@
+import pytest
+
+from uri import URI
+from uri.idna import decode_label, encode_label, remap, to_ascii, to_unicode
+
+EXAMPLES = [
+		('bücher.example', 'xn--bcher-kva.example'),
+		('💩.la', 'xn--ls8h.la'),
+		('faß.de', 'xn--fa-hia.de'),  # Nontransitional; the IDNA 2003 codec produces "fass.de".
+		('σοφοσ.gr', 'xn--0xaakcn.gr'),
+		('例え.テスト', 'xn--r8jz45g.xn--zckzah'),
+		('example.com', 'example.com'),
+		('é.com.', 'xn--9ca.com.'),
+	]
+
+
+class TestIDNA:
+	@pytest.mark.parametrize('unicode,ascii', EXAMPLES)
+	def test_to_ascii(self, unicode, ascii):
+		assert to_ascii(unicode) == ascii
+	
+	@pytest.mark.parametrize('unicode,ascii', EXAMPLES)
+	def test_to_unicode(self, unicode, ascii):
+		assert to_unicode(ascii) == unicode
+	
+	@pytest.mark.parametrize('label,mapped', [
+			('Bücher', 'bücher'),  # Case folded.
+			('ＥＸＡＭＰＬＥ', 'example'),  # Compatibility normalized.
+			('ex\u00adample', 'example'),  # Soft hyphen, ignored.
+			('STRAẞE', 'straße'),  # Capital sharp S, a deviation, maps to sharp S rather than "ss".
+			('ΣΟΦΟΣ', 'σοφοσ'),
+			('a\u200db', 'a\u200db'),  # Zero-width joiner, a deviation, is retained.
+		])
+	def test_remap(self, label, mapped):
+		assert remap(label) == mapped
+	
+	def test_separators(self):
+		assert to_ascii('bücher。example') == 'xn--bcher-kva.example'
+		assert to_ascii('ｅｘａｍｐｌｅ．ｃｏｍ') == 'example.com'
+	
+	def test_invalid(self):
+		with pytest.raises(UnicodeError):
+			to_ascii('é..com')
+		
+		with pytest.raises(UnicodeError):
+			to_ascii('é' * 64 + '.com')
+		
+		with pytest.raises(UnicodeError):
+			to_unicode('xn--zz')
+	
+	@pytest.mark.parametrize('label', [
+			'xn--paypal-',  # Decodes to pure ASCII, "paypal".
+			'xn--',
+			'xn--bcher-kva-',  # Decodes to "bücher", which encodes without the trailing hyphen.
+			'xn--ü',
+		])
+	def test_malformed_label(self, label):
+		with pytest.raises(UnicodeError):
+			decode_label(label)
+	
+	def test_cached_per_label(self):
+		encode_label.cache_clear()
+		
+		to_ascii('ä.bücher.example')
+		to_ascii('ö.bücher.example')
+		
+		info = encode_label.cache_info()
+		assert info.misses == 4  # ä, ö, bücher, example
+		assert info.hits == 2
+	
+	def test_decode_cached(self):
+		decode_label.cache_clear()
+		
+		to_unicode('xn--4ca.xn--bcher-kva.example')
+		to_unicode('xn--4ca.xn--bcher-kva.example')
+		
+		assert decode_label.cache_info().hits == 3
+
+
+class TestURIHostIDNA:
+	def test_mapped(self):
+		instance = URI('http://BÜCHER。Example/')
+		
+		assert instance.host == 'bücher.example'
+		assert str(instance) == 'http://xn--bcher-kva.example/'
+	
+	def test_decoded(self):
+		instance = URI('http://www.xn--bcher-kva.example/')
+		
+		assert instance.host == 'www.bücher.example'
+		assert str(instance) == 'http://www.xn--bcher-kva.example/'
+	
+	def test_spoofed(self):
+		with pytest.raises(UnicodeError):
+			URI('http://xn--paypal-.com/login')
+	
+	def test_deviation(self):
+		assert str(URI('http://faß.de/')) == 'http://xn--fa-hia.de/'
+	
+	def test_invalid_deferred(self):
+		instance = URI('http://example.com/')
+		instance.host = 'é..com'  # Assignment succeeds; the error is raised upon rendering.
+		
+		with pytest.raises(UnicodeError):
+			str(instance)
@@ -0,0 +1,247 @@
+from itertools import repeat
+
+import pytest
+
+from uri import URI, FrozenURI, LazyURI, ParseCache
+from uri.limit import LimitExceeded, Limits
+from uri.qso import QSO, FrozenQSO
+
+LIMITS = Limits(parameters=4, name=8, value=16, length=64)
+
+EXCEEDING = [
+		('a&b&c&d&e', 'parameters'),
+		('toolongname=value', 'name'),
+		('name=' + 'v' * 17, 'value'),
+		('v' * 17, 'value'),
+		('&'.join(['name=' + 'v' * 16] * 3), 'length'),
+	]
+
+
+@pytest.fixture
+def limited():
+	QSO.__limits__ = LIMITS
+	
+	try:
+		yield LIMITS
+	finally:
+		QSO.__limits__ = None
+
+
+class TestLimits:
+	@pytest.mark.parametrize('string,limit', EXCEEDING)
+	def test_exceeded(self, string, limit):
+		with pytest.raises(LimitExceeded) as info:
+			QSO(string, limits=LIMITS)
+		
+		assert info.value.limit == limit
+		assert isinstance(info.value, ValueError)
+	
+	@pytest.mark.parametrize('string,limit', EXCEEDING)
+	def test_stream_exceeded(self, string, limit):
+		with pytest.raises(LimitExceeded) as info:
+			QSO.from_stream([string[i:i + 3].encode('ascii') for i in range(0, len(string), 3)], limits=LIMITS)
+		
+		assert info.value.limit == limit
+	
+	def test_within(self):
+		instance = QSO('a=b%20c&d&e=' + 'f' * 16 + '&g', limits=LIMITS)
+		
+		assert instance['a'] == 'b c'
+		assert str(instance) == 'a=b%20c&d&e=' + 'f' * 16 + '&g'
+		assert object.__getattribute__(instance, '_names')  # Parsed immediately.
+	
+	def test_unlimited(self):
+		assert len(QSO('&'.join(['a'] * 100), limits=Limits())) == 100
+	
+	def test_strict(self):
+		with pytest.raises(ValueError):
+			QSO('a=b=c', strict=True, limits=LIMITS)
+		
+		assert str(QSO('a=b%20c', strict=True, limits=LIMITS)) == 'a=b+c'
+	
+	def test_frozen(self):
+		with pytest.raises(LimitExceeded):
+			FrozenQSO('a&b&c&d&e', limits=LIMITS)
+	
+	def test_copy_exempt(self, limited):
+		instance = QSO('a&b&c&d', limits=Limits())
+		instance.append('e')
+		
+		assert len(QSO(instance)) == 5
+	
+	def test_copy_unparsed(self):
+		original = QSO('a&b&c&d&e')  # Retained as text, unchecked.
+		
+		with pytest.raises(LimitExceeded):
+			QSO(original, limits=LIMITS)
+		
+		with pytest.raises(LimitExceeded):
+			FrozenQSO(original, limits=LIMITS)
+		
+		copy = QSO(QSO('a&b&c&d', limits=Limits()))
+		assert copy._limits == Limits()
+		assert str(copy) == 'a&b&c&d'
+	
+	def test_copy_unparsed_global(self, limited):
+		original = QSO('a&b&c&d&e', limits=Limits())
+		
+		with pytest.raises(LimitExceeded):
+			QSO(original, limits=LIMITS)
+		
+		assert len(QSO(original)) == 5  # The limits of the original are carried over.
+	
+	def test_stream_early(self):
+		consumed = []
+		
+		def endless():
+			for chunk in repeat(b'a=1&'):
+				consumed.append(chunk)
+				yield chunk
+		
+		with pytest.raises(LimitExceeded):
+			QSO.from_stream(endless(), limits=Limits(parameters=1000))
+		
+		assert len(consumed) == 1000
+	
+	def test_stream_oversized_parameter(self):
+		consumed = []
+		
+		def endless():
+			yield b'name='
+			
+			for chunk in repeat(b'v' * 1024):
+				consumed.append(chunk)
+				yield chunk
+		
+		with pytest.raises(LimitExceeded) as info:
+			QSO.from_stream(endless(), limits=Limits(name=64, value=4096))
+		
+		assert info.value.limit == 'value'
+		assert len(consumed) == 5
+
+
+class TestMutationLimits:
+	@pytest.mark.parametrize('mutation', [
+			lambda instance: instance.append('e'),
+			lambda instance: instance.insert(0, 'e'),
+			lambda instance: instance.extend('e'),
+			lambda instance: instance.extend(['e']),
+			lambda instance: instance.__iadd__('e'),
+			lambda instance: instance.update('e=1'),
+			lambda instance: instance.update({'e': '1'}),
+			lambda instance: instance.__setitem__('e', '1'),
+		])
+	def test_parameters(self, mutation):
+		instance = QSO('a&b&c&d', limits=LIMITS)
+		
+		with pytest.raises(LimitExceeded) as info:
+			mutation(instance)
+		
+		assert info.value.limit == 'parameters'
+		assert str(instance) == 'a&b&c&d'
+	
+	@pytest.mark.parametrize('mutation', [
+			lambda instance: instance.append('toolongname=1'),
+			lambda instance: instance.insert(0, 'v' * 17),
+			lambda instance: instance.extend({'a': 'v' * 17}),
+			lambda instance: instance.__iadd__('toolongname=1'),
+			lambda instance: instance.update(a='v' * 17),
+			lambda instance: instance.__setitem__('a', 'v' * 17),
+			lambda instance: instance.__setitem__(0, 'v' * 17),
+		])
+	def test_pair(self, mutation):
+		instance = QSO('a=1', limits=LIMITS)
+		
+		with pytest.raises(LimitExceeded):
+			mutation(instance)
+		
+		assert str(instance) == 'a=1'
+	
+	def test_length(self):
+		instance = QSO(limits=LIMITS)
+		
+		with pytest.raises(LimitExceeded) as info:
+			instance.extend('&'.join(['name=' + 'v' * 16] * 3))
+		
+		assert info.value.limit == 'length'
+		assert not instance
+	
+	def test_constructed(self):
+		with pytest.raises(LimitExceeded):
+			QSO(['a', 'b', 'c', 'd', 'e'], limits=LIMITS)
+		
+		with pytest.raises(LimitExceeded):
+			QSO({'toolongname': 'value'}, limits=LIMITS)
+	
+	def test_global(self, limited):
+		instance = QSO()
+		instance.extend('a&b&c&d')
+		
+		with pytest.raises(LimitExceeded):
+			instance += 'e'
+	
+	def test_uri(self, limited):
+		target = URI('http://example.com/?a&b&c')
+		target.query.extend('d')
+		
+		with pytest.raises(LimitExceeded):
+			target.query.extend('e')
+		
+		assert str(target) == 'http://example.com/?a&b&c&d'
+
+
+class TestURILimits:
+	def test_global(self, limited):
+		with pytest.raises(LimitExceeded):
+			URI('http://example.com/?a&b&c&d&e')
+		
+		assert str(URI('http://example.com/?a=b&c')) == 'http://example.com/?a=b&c'
+	
+	def test_frozen(self, limited):
+		with pytest.raises(LimitExceeded):
+			FrozenURI('http://example.com/?a&b&c&d&e')
+	
+	def test_cached(self, limited):
+		URI.__parse_cache__ = cache = ParseCache()
+		
+		try:
+			with pytest.raises(LimitExceeded):
+				URI('http://example.com/?a&b&c&d&e')
+			
+			assert not cache
+		finally:
+			URI.__parse_cache__ = None
+	
+	def test_lazy(self, limited):
+		instance = LazyURI('http://example.com/?a&b&c&d&e')
+		assert instance.host == 'example.com'
+		
+		with pytest.raises(LimitExceeded):
+			instance.query
+
+
+class TestBatchLimits:
+	def test_lenient(self, limited):
+		from uri import parse_many
+		
+		results = list(parse_many(['http://example.com/?a', 'http://example.com/?a&b&c&d&e'], strict=False))
+		
+		assert str(results[0]) == 'http://example.com/?a'
+		assert results[1] is None
+	
+	def test_strict(self, limited):
+		from uri import parse_many
+		
+		with pytest.raises(LimitExceeded):
+			list(parse_many(['http://example.com/?a&b&c&d&e']))
+	
+	def test_record(self, limited):
+		from uri import parse_many
+		
+		with pytest.raises(LimitExceeded):
+			list(parse_many(['http://example.com/?a&b&c&d&e'], record=True))
+		
+		results = list(parse_many(['http://example.com/?a&b', 'http://example.com/?a&b&c&d&e'], True, False))
+		
+		assert results[0].query == 'a&b'
+		assert results[1] is None
@@ -0,0 +1,132 @@
+"""Validate incremental decoding of form content against parsing of the whole by QSO."""
+
+from io import BytesIO, StringIO
+
+import pytest
+
+from uri.bucket import Bucket
+from uri.parse.form import FormDecoder
+from uri.qso import QSO, FrozenQSO
+
+EXAMPLES = [
+		'',
+		'foo',
+		'foo=bar',
+		'foo=bar&',
+		'&foo=bar',
+		'foo=bar&&baz',
+		'name=ferret&color=purple',
+		'key=value1&foo&key=value2&bar&key=value3',
+		'argument1+argument2+argument3',
+		'objectClass?one',
+		'q=caf%C3%A9+au%20lait&tag=a%2fb&empty=',
+		'q=café&emoji=💩',
+		'=foo=bar&foo==bar=',
+	]
+
+
+def chunked(value, size):
+	return [value[i:i + size] for i in range(0, len(value), size)]
+
+
+@pytest.mark.parametrize('string', EXAMPLES)
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 4096])
+class TestFormDecoder:
+	def test_text_parity(self, string, size):
+		expect = QSO(string)
+		result = QSO.from_stream(chunked(string, size))
+		
+		assert list(result.items()) == list(expect.items())
+		assert str(result) == expect.canonical
+	
+	def test_binary_parity(self, string, size):
+		expect = QSO(string)
+		result = QSO.from_stream(chunked(string.encode('utf-8'), size))
+		
+		assert list(result.items()) == list(expect.items())
+		assert str(result) == expect.canonical
+	
+	def test_buckets(self, string, size):
+		decoder = FormDecoder()
+		buckets = [bucket for chunk in chunked(string.encode('utf-8'), size) for bucket in decoder.feed(chunk)]
+		buckets.extend(decoder.close())
+		
+		assert buckets == list(QSO(string))
+		assert [bucket.valid for bucket in buckets] == [bucket.valid for bucket in QSO(string)]
+
+
+class TestFormSources:
+	def test_binary_file(self):
+		assert QSO.from_stream(BytesIO(b'foo=bar&baz=diz'), size=4) == 'foo=bar&baz=diz'
+	
+	def test_text_file(self):
+		assert QSO.from_stream(StringIO('foo=bar&baz=diz'), size=4) == 'foo=bar&baz=diz'
+	
+	def test_buffers(self):
+		assert QSO.from_stream([bytearray(b'foo=b'), memoryview(b'ar&baz')]) == 'foo=bar&baz'
+	
+	def test_frozen(self):
+		result = FrozenQSO.from_stream([b'foo=bar&', b'baz=diz'])
+		
+		assert isinstance(result, FrozenQSO)
+		assert result == 'foo=bar&baz=diz'
+	
+	def test_alternate_symbols(self):
+		result = QSO.from_stream([b'foo:bar;b', b'az:diz'], assignment=':', separator=';')
+		assert result['baz'] == 'diz'
+		assert str(result) == 'foo:bar;baz:diz'
+	
+	def test_decode(self):
+		decoder = FormDecoder()
+		assert list(decoder.decode(BytesIO(b'foo=bar&baz'), size=3)) == [Bucket('foo', 'bar'), Bucket('baz')]
+		assert list(decoder.decode([b'diz'])) == [Bucket('diz')]  # Reusable once closed.
+
+
+class TestFormIncremental:
+	def test_completion(self):
+		decoder = FormDecoder()
+		
+		assert decoder.feed(b'foo=bar&ba') == [Bucket('foo', 'bar')]
+		assert decoder.feed(b'z=d') == []
+		assert decoder.feed(b'iz&') == [Bucket('baz', 'diz')]
+		assert decoder.close() == [Bucket('')]
+	
+	def test_split_character(self):
+		decoder = FormDecoder()
+		encoded = 'q=é'.encode('utf-8')
+		
+		assert decoder.feed(encoded[:-1]) == []
+		assert decoder.feed(encoded[-1:]) == []
+		assert decoder.close() == [Bucket('q', 'é')]
+	
+	def test_empty(self):
+		decoder = FormDecoder()
+		assert decoder.feed(b'') == []
+		assert decoder.close() == []
+	
+	def test_strict(self):
+		decoder = FormDecoder(strict=True)
+		
+		with pytest.raises(ValueError):
+			decoder.feed(b'foo=bar=baz&')
+		
+		with pytest.raises(ValueError):
+			QSO.from_stream([b'foo=bar=baz'], strict=True)
+	
+	@pytest.mark.parametrize('size', [1, 2, 3, 4, 5, 13])
+	@pytest.mark.parametrize('binary', [False, True])
+	def test_separator_spanning(self, size, binary):
+		string = 'x=1&amp;a=1&amp;b=2&amp;&amp;c'
+		decoder = FormDecoder(separator='&amp;')
+		chunks = chunked(string.encode('ascii') if binary else string, size)
+		buckets = [bucket for chunk in chunks for bucket in decoder.feed(chunk)] + decoder.close()
+		
+		assert buckets == list(QSO(string, separator='&amp;'))
+		assert buckets == [Bucket('x', '1'), Bucket('a', '1'), Bucket('b', '2'), Bucket(''), Bucket('c')]
+	
+	def test_mixed(self):
+		decoder = FormDecoder()
+		decoder.feed('foo=bar&ba')
+		
+		with pytest.raises(TypeError, match="mixed"):
+			decoder.feed(b'z')
@@ -1,6 +1,8 @@
+import pickle
+
 import pytest
 
-from uri.qso import QSO, SENTINEL, Bucket
+from uri.qso import QSO, SENTINEL, Bucket, extract
 
 EXAMPLES = [
 		# Abstract
@@ -324,3 +326,396 @@ class TestQSOMultiplePositional:
 		instance = QSO(string)
 		instance[1] = 'doz'
 		assert '&doz'
+
+
+class TestQSOIndex:
+	def test_interleaved_deletion(self):
+		instance = QSO('&'.join(f'key=value{i}&other{i}=x' for i in range(100)))
+		del instance['key']
+		
+		assert len(instance) == 100
+		assert str(instance) == '&'.join(f'other{i}=x' for i in range(100))
+		assert instance[1] == 'other1=x'
+		assert instance.index('other99=x') == 99
+	
+	def test_equal_bucket_deletion(self):
+		instance = QSO('foo=bar&baz=diz&foo=bar')
+		del instance[Bucket('foo', 'bar')]
+		
+		assert str(instance) == 'baz=diz&foo=bar'
+		assert len(instance.groups['foo']) == 1
+		
+		with pytest.raises(ValueError):
+			del instance[Bucket('foo', 'diz')]
+	
+	def test_renaming_replacement(self):
+		instance = QSO('key=value1&bar=baz&key=value2')
+		instance[2] = ('bar', 'diz')
+		
+		assert str(instance) == 'key=value1&bar=baz&bar=diz'
+		assert instance['key'] == 'value1'
+		assert tuple(instance['bar']) == ('baz', 'diz')
+		
+		instance[0] = ('bar', 'doz')
+		assert tuple(instance['bar']) == ('doz', 'baz', 'diz')
+		assert 'key' not in instance
+	
+	def test_insertion_grouping(self):
+		instance = QSO('key=value1&bar=baz&key=value3')
+		instance.insert(2, 'key=value2')
+		
+		assert str(instance) == 'key=value1&bar=baz&key=value2&key=value3'
+		assert tuple(instance['key']) == ('value1', 'value2', 'value3')
+		assert instance.index('key=value3') == 3
+	
+	def test_pop_after_deletion(self):
+		instance = QSO('a=1&b=2&c=3&d=4')
+		del instance['b']
+		
+		assert instance.pop() == Bucket('d', '4')
+		assert instance.pop('a') == '1'
+		assert instance.pop(0) == Bucket('c', '3')
+		assert not instance
+		assert not instance.groups
+	
+	def test_vacancies_reclaimed(self):
+		instance = QSO('&'.join(f'key{i}=value' for i in range(1000)))
+		
+		for i in range(600):
+			del instance[f'key{i}']
+		
+		assert len(instance) == 400
+		assert len(instance._names) < 1000
+		assert list(instance.keys()) == [f'key{i}' for i in range(600, 1000)]
+
+
+class TestQSOLazy:
+	def test_verbatim(self):
+		instance = QSO('q=caf%C3%A9+au%20lait&tag=a%2fb&empty=')
+		
+		assert str(instance) == 'q=caf%C3%A9+au%20lait&tag=a%2fb&empty='
+		assert instance.canonical == 'q=caf%C3%A9+au+lait&tag=a/b&empty='
+	
+	def test_deferred(self):
+		instance = QSO('foo=bar&baz=diz')
+		
+		with pytest.raises(AttributeError):
+			object.__getattribute__(instance, '_names')
+		
+		assert instance
+		assert instance['foo'] == 'bar'
+		assert object.__getattribute__(instance, '_names')
+	
+	def test_inspection_preserves(self):
+		instance = QSO('foo=b%61r&baz')
+		
+		assert instance['foo'] == 'bar'
+		assert len(instance) == 2
+		assert 'baz' not in instance
+		assert list(instance.keys()) == ['foo', None]
+		assert instance.count('baz') == 1
+		assert instance[0] == Bucket('foo', 'bar')
+		assert list(instance) == [Bucket('foo', 'bar'), Bucket('baz')]
+		assert str(instance) == 'foo=b%61r&baz'
+	
+	@pytest.mark.parametrize('mutation', [
+			lambda instance: instance.__setitem__('foo', 'bar'),
+			lambda instance: instance.append('diz'),
+			lambda instance: instance.pop(),
+			lambda instance: instance.reverse(),
+			lambda instance: setattr(instance[0], 'value', 'bar'),
+			lambda instance: setattr(next(iter(instance)), 'name', 'diz'),
+		])
+	def test_modification_discards(self, mutation):
+		instance = QSO('foo=b%61r&baz')
+		mutation(instance)
+		
+		assert str(instance) == instance.canonical
+	
+	def test_strict_validation(self):
+		with pytest.raises(ValueError):
+			QSO('foo=bar=baz', strict=True)
+	
+	def test_canonical_comparison(self):
+		assert QSO('q=a%20b') == 'q=a+b'
+		assert QSO('q=a%20b') == QSO('q=a+b')
+		assert QSO('q=a%20b') != 'q=a+c'
+	
+	@pytest.mark.parametrize('other', [b'q=a%20b', {'q': 'a b'}, [('q', 'a b')], ['q=a b'], Bucket('q', 'a b')])
+	def test_coerced_comparison(self, other):
+		assert QSO('q=a+b') == other
+		assert not QSO('q=a+b') != other
+	
+	@pytest.mark.parametrize('other', [None, 27, 2.7, object(), [1, 2], b'\xff'])
+	def test_incomparable(self, other):
+		assert not QSO('q=1') == other
+		assert QSO('q=1') != other
+		assert not QSO() == other
+		assert QSO().__eq__(other) is NotImplemented
+	
+	def test_copy(self):
+		original = QSO('foo=b%61r')
+		copy = QSO(original)
+		
+		assert str(copy) == 'foo=b%61r'
+		
+		copy['diz'] = 'doz'
+		assert str(original) == 'foo=b%61r'
+		assert str(copy) == 'foo=bar&diz=doz'
+
+
+class TestQSOCompact:
+	def test_view_write_through(self):
+		instance = QSO('foo=bar&baz=diz')
+		bucket = instance[1]
+		bucket.value = 'doz'
+		
+		assert str(instance) == 'foo=bar&baz=doz'
+		
+		bucket.name = 'foo'
+		assert tuple(instance['foo']) == ('bar', 'doz')
+		assert 'baz' not in instance
+	
+	def test_view_identity(self):
+		instance = QSO('foo=bar&baz=diz')
+		assert instance[0] is instance[0]
+		assert list(instance)[1] is instance[-1]
+	
+	def test_view_detached(self):
+		instance = QSO('foo=bar&baz=diz')
+		bucket = instance[0]
+		del instance['foo']
+		
+		assert bucket == Bucket('foo', 'bar')
+		
+		bucket.value = 'modified'
+		assert str(instance) == 'baz=diz'
+		assert str(bucket) == 'foo=modified'
+	
+	def test_view_pop(self):
+		instance = QSO('foo=bar&baz=diz')
+		bucket = instance[-1]
+		
+		assert instance.pop() is bucket
+		assert bucket.value == 'diz'
+	
+	def test_view_clear(self):
+		instance = QSO('foo=bar')
+		bucket = instance[0]
+		instance.clear()
+		
+		assert bucket == Bucket('foo', 'bar')
+	
+	def test_view_renumbered(self):
+		instance = QSO('&'.join(f'key{i}=value{i}' for i in range(100)))
+		last = instance[-1]
+		
+		for i in range(60):
+			del instance[f'key{i}']
+		
+		instance.insert(0, 'first=value')
+		instance.reverse()
+		
+		assert instance[0] is last
+		assert instance.index(last) == 0
+		
+		last.value = 'modified'
+		assert instance['key99'] == 'modified'
+	
+	def test_view_deletion(self):
+		instance = QSO('foo=bar&foo=bar&baz=diz')
+		del instance[instance[1]]
+		
+		assert str(instance) == 'foo=bar&baz=diz'
+		assert instance._groups['foo'] == [0]
+	
+	def test_view_encoding_retained(self):
+		instance = QSO('foo=a+b&baz=diz')
+		bucket = instance[0]
+		
+		assert str(bucket) is str(bucket)
+		
+		instance['foo'] = 'c d'  # Replaced through the query string, not the bucket.
+		assert str(bucket) == 'foo=c+d'
+	
+	def test_groups(self):
+		instance = QSO('foo=bar&baz=diz&foo=doz')
+		groups = instance.groups
+		
+		assert list(groups) == ['foo', 'baz']
+		assert groups['foo'] == [Bucket('foo', 'bar'), Bucket('foo', 'doz')]
+		assert groups['foo'][1] is instance[2]
+	
+	@pytest.mark.parametrize('protocol', range(2, pickle.HIGHEST_PROTOCOL + 1))
+	def test_pickle(self, protocol):
+		instance = QSO('foo=bar&baz=diz&foo=doz&odd=a=b')
+		views = list(instance)
+		del instance[views[1]]
+		instance.append('extra')
+		
+		restored = pickle.loads(pickle.dumps(instance, protocol))
+		
+		assert str(restored) == str(instance) == 'foo=bar&foo=doz&odd=a=b&extra'
+		assert not restored[2].valid
+		assert restored.groups == instance.groups
+		
+		restored['foo'] = 'modified'
+		assert str(instance) == 'foo=bar&foo=doz&odd=a=b&extra'
+	
+	def test_pickle_unparsed(self):
+		instance = QSO('foo=b%61r')
+		restored = pickle.loads(pickle.dumps(instance))
+		
+		with pytest.raises(AttributeError):
+			object.__getattribute__(restored, '_names')
+		
+		assert str(restored) == 'foo=b%61r'
+		assert restored['foo'] == 'bar'
+	
+	def test_pickle_uri(self):
+		from uri import URI
+		
+		target = URI('http://example.com/?foo=bar')
+		list(target.query)
+		restored = pickle.loads(pickle.dumps(target))
+		
+		assert restored == target
+		
+		restored.query[0].value = 'baz'
+		assert str(restored) == 'http://example.com/?foo=baz'
+	
+	def test_invalid_preserved(self):
+		instance = QSO('foo=bar=baz&diz=doz')
+		instance['diz'] = 'dez'
+		
+		assert str(instance) == 'foo=bar=baz&diz=dez'
+		assert not instance[0].valid
+		assert instance[1].valid
+	
+	def test_uri_invalidation(self):
+		from uri import URI
+		
+		target = URI('http://example.com/?foo=bar')
+		assert str(target) == 'http://example.com/?foo=bar'
+		
+		target.query[0].value = 'baz'
+		assert str(target) == 'http://example.com/?foo=baz'
+
+
+class TestQSOEncoding:
+	@pytest.mark.parametrize('size', [1, 5, 64, 65536])
+	@pytest.mark.parametrize('form', ['raw', 'rendered', 'modified'])
+	def test_parity(self, form, size):
+		instance = QSO('q=caf%C3%A9+au%20lait&tag=a%2fb&empty=&bare&odd=a=b&emoji=💩')
+		
+		if form != 'raw':
+			instance.append('diz=doz')
+		
+		if form == 'rendered':
+			str(instance)
+		
+		expect = str(instance).encode('utf-8')
+		chunks = list(instance.iter_encoded(size))
+		
+		assert b''.join(chunks) == expect
+		assert all(chunks)
+	
+	def test_modified_chunking(self):
+		instance = QSO()
+		instance.extend(f'key{i}=value' for i in range(100))
+		chunks = list(instance.iter_encoded(100))
+		
+		assert instance._canonical is None  # The whole was never rendered.
+		assert len(chunks) > 1
+		assert b''.join(chunks) == str(instance).encode('ascii')
+	
+	def test_empty(self):
+		assert list(QSO().iter_encoded()) == []
+		assert list(QSO('foo').iter_encoded()) == [b'foo']
+	
+	def test_write_to_file(self):
+		from io import BytesIO
+		
+		instance = QSO({'foo': 'bar', 'baz': 'a b'})
+		buffer = BytesIO()
+		
+		assert instance.write_to(buffer, 4) == 15
+		assert buffer.getvalue() == b'foo=bar&baz=a+b'
+	
+	def test_write_to_bytearray(self):
+		buffer = bytearray(b'?')
+		QSO('foo=bar&baz').write_to(buffer)
+		assert buffer == b'?foo=bar&baz'
+	
+	def test_write_to_socket(self):
+		from socket import socketpair
+		
+		left, right = socketpair()
+		
+		with left, right:
+			assert QSO('foo=bar&baz').write_to(left) == 11
+			assert right.recv(64) == b'foo=bar&baz'
+
+
+class TestQSOFirst:
+	def test_parsed(self):
+		instance = QSO('id=1&id=2&q=a+b')
+		instance.append('x=y')
+		
+		assert instance.first('id') == '1'
+		assert instance.first('x') == 'y'
+		assert instance.first('missing', 'default') == 'default'
+	
+	def test_unparsed(self):
+		instance = QSO('id=1&id=2&q=a+b')
+		
+		assert instance.first('q') == 'a b'
+		assert instance.first('missing') is None
+		
+		with pytest.raises(AttributeError):  # Remains unparsed.
+			object.__getattribute__(instance, '_groups')
+	
+	def test_limited(self, monkeypatch):
+		from uri.limit import LimitExceeded, Limits
+		
+		instance = QSO('id=' + 'v' * 17)
+		monkeypatch.setattr(QSO, '__limits__', Limits(value=16))
+		
+		with pytest.raises(LimitExceeded):
+			instance.first('id')
+
+
+class TestExtract:
+	def test_extract(self):
+		assert extract('id=27&page=2&sort=name', ('id', 'page')) == {'id': '27', 'page': '2'}
+	
+	def test_single_key(self):
+		assert extract('id=27&page=2', 'page') == {'page': '2'}
+	
+	def test_absent(self):
+		assert extract('id=27&page=2', ('id', 'missing')) == {'id': '27'}
+		assert extract('', ('id', )) == {}
+		assert extract('id=27', ()) == {}
+	
+	def test_first(self):
+		assert extract('id=1&id=2', 'id') == {'id': '1'}
+	
+	def test_decoded(self):
+		assert extract('a+b=c%20d&caf%C3%A9=1', ('a b', 'café')) == {'a b': 'c d', 'café': '1'}
+	
+	def test_unnamed(self):
+		assert extract('id&id=2', 'id') == {'id': '2'}
+	
+	def test_invalid(self):
+		assert extract('id=1=2', 'id') == {'id': '1=2'}
+	
+	def test_symbols(self):
+		assert extract('id:1;page:2', ('id', 'page'), ':', ';') == {'id': '1', 'page': '2'}
+	
+	@pytest.mark.parametrize('string,args,kw', EXAMPLES)
+	def test_matches_qso(self, string, args, kw):
+		instance = QSO(string)
+		expect = {name: instance[name] if instance.count(name) == 1 else next(iter(instance[name]))
+				for name in instance.groups if name is not None}
+		
+		assert extract(string, instance.groups) == expect
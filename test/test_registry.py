@@ -0,0 +1,124 @@
+"""Tests for the index of registered schemes and the bounded cache of generic schemes."""
+
+import os
+
+import pytest
+
+from uri import URI, registry
+from uri.part.scheme import SchemePart
+from uri.scheme import Scheme, URLScheme
+
+
+@pytest.fixture
+def scans(monkeypatch):
+	"""Record each examination of installed metadata."""
+	
+	scans = []
+	scan = registry.scan
+	
+	monkeypatch.setattr(registry, 'scan', lambda: scans.append(None) or scan())
+	return scans
+
+
+@pytest.fixture
+def part(monkeypatch):
+	"""The scheme part of URI, with empty caches, restored afterwards."""
+	
+	monkeypatch.setattr(SchemePart, 'registry', {'': None})
+	monkeypatch.setattr(SchemePart, 'generic', {})
+	monkeypatch.setattr(SchemePart, 'index', None)
+	
+	return URI.scheme
+
+
+class TestSchemeIndex:
+	def test_registered(self, part):
+		assert isinstance(part.load('http'), URLScheme)
+		assert part.load('http') is part.load('http')
+	
+	def test_scanned_once(self, part, scans):
+		for name in ('http', 'https', 'unknown', 'other', 'ftp'):
+			part.load(name)
+		
+		assert len(scans) == 1
+	
+	def test_generic(self, part):
+		scheme = part.load('unknown')
+		
+		assert type(scheme) is Scheme
+		assert part.load('unknown') is scheme
+		assert 'unknown' not in part.registry
+	
+	def test_generic_bounded(self, part, monkeypatch):
+		monkeypatch.setattr(SchemePart, 'limit', 2)
+		
+		for i in range(5):
+			part.load(f'hostile{i}')
+		
+		assert len(part.generic) == 2
+		assert part.load('hostile4') == part.load('hostile4')
+		assert part.load('hostile4') is not part.load('hostile4')
+		assert URI('hostile4:example') == URI('hostile4:example')
+
+
+class TestSnapshot:
+	def test_written_and_read(self, tmp_path, monkeypatch):
+		path = str(tmp_path / 'schemes.json')
+		schemes = registry.index(path)
+		
+		assert schemes['http'] == 'uri.scheme:HTTPScheme'
+		
+		monkeypatch.setattr(registry, 'scan', lambda: pytest.fail("Installed metadata examined."))
+		assert registry.index(path) == schemes
+	
+	def test_stale(self, tmp_path, monkeypatch):
+		path = str(tmp_path / 'schemes.json')
+		registry.write(path, {'stale': 'uri.scheme:URLScheme'})
+		
+		monkeypatch.setattr(registry, 'fingerprint', lambda: [['elsewhere', 0]])
+		assert registry.read(path) is None
+		assert 'stale' not in registry.index(path)
+		assert registry.read(path) is not None  # Replaced by the current index.
+	
+	def test_unrelated_writes(self, tmp_path, monkeypatch):
+		monkeypatch.setattr(registry, 'search', ['', str(tmp_path)])
+		monkeypatch.chdir(tmp_path)
+		path = str(tmp_path / 'schemes.json')  # Upon the import path itself.
+		registry.write(path, {'http': 'uri.scheme:HTTPScheme'})
+		
+		(tmp_path / 'unrelated.txt').write_text('')
+		assert registry.read(path) == {'http': 'uri.scheme:HTTPScheme'}
+		
+		(tmp_path / 'example-1.0.dist-info').mkdir()  # A distribution installed.
+		assert registry.read(path) is None
+	
+	def test_reinstalled(self, tmp_path, monkeypatch):
+		metadata = tmp_path / 'example-1.0.dist-info'
+		metadata.mkdir()
+		(metadata / 'entry_points.txt').write_text('')
+		monkeypatch.setattr(registry, 'search', [str(tmp_path)])
+		
+		before = registry.fingerprint()
+		os.utime(metadata / 'entry_points.txt', ns=(0, 0))
+		
+		assert before == [[str(tmp_path), 'example-1.0.dist-info', before[0][2]]]
+		assert registry.fingerprint() != before
+	
+	def test_corrupt(self, tmp_path):
+		path = tmp_path / 'schemes.json'
+		path.write_text('{"version": 1, "pa')
+		
+		assert registry.read(str(path)) is None
+		assert 'http' in registry.index(str(path))
+	
+	def test_unwritable(self, tmp_path):
+		path = str(tmp_path / 'missing' / 'schemes.json')
+		
+		assert 'http' in registry.index(path)
+		assert registry.read(path) is None
+	
+	def test_part(self, part, tmp_path, monkeypatch):
+		monkeypatch.setattr(SchemePart, 'snapshot', str(tmp_path / 'schemes.json'))
+		part.load('http')
+		
+		assert (tmp_path / 'schemes.json').exists()
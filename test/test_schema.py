@@ -0,0 +1,103 @@
+import pytest
+
+from uri import URI, FrozenURI, LazyURI, QSO
+from uri.limit import LimitExceeded, Limits
+from uri.schema import ParameterError, QSOSchema, boolean
+
+SCHEMA = QSOSchema(page=(int, 1), tags=[str], debug=bool, ratio=float)
+
+
+class TestSchema:
+	def test_decode(self):
+		assert SCHEMA.decode('page=2&tags=a&tags=b&debug=true&ratio=0.5') == \
+				{'page': 2, 'tags': ['a', 'b'], 'debug': True, 'ratio': 0.5}
+	
+	def test_defaults(self):
+		assert SCHEMA.decode('') == {'page': 1, 'tags': [], 'debug': None, 'ratio': None}
+		assert SCHEMA.decode('other=1') == {'page': 1, 'tags': [], 'debug': None, 'ratio': None}
+	
+	def test_default_list_independent(self):
+		first = SCHEMA.decode('')
+		first['tags'].append('a')
+		assert SCHEMA.decode('')['tags'] == []
+	
+	def test_first_occurrence(self):
+		assert SCHEMA.decode('page=2&page=invalid')['page'] == 2
+	
+	def test_decoded(self):
+		schema = QSOSchema({'filter[name]': str})
+		assert schema.decode('filter%5Bname%5D=caf%C3%A9+au+lait') == {'filter[name]': 'café au lait'}
+	
+	def test_flag(self):
+		assert SCHEMA.decode('debug')['debug'] is True
+		assert SCHEMA.decode('debug=off')['debug'] is False
+		assert SCHEMA.decode('ratio')['ratio'] is None  # Bare names only apply to boolean arguments.
+	
+	def test_error(self):
+		with pytest.raises(ParameterError) as info:
+			SCHEMA.decode('page=two')
+		
+		assert info.value.name == 'page'
+		assert info.value.value == 'two'
+		assert isinstance(info.value, ValueError)
+	
+	def test_boolean(self):
+		assert boolean('Yes') is True
+		assert boolean('0') is False
+		
+		with pytest.raises(ValueError):
+			boolean('maybe')
+	
+	def test_record(self):
+		record = SCHEMA.record('page=3&tags=x')
+		
+		assert record.page == 3
+		assert record.tags == ['x']
+		assert record.debug is None
+		assert record == (3, ['x'], None, None)
+	
+	def test_record_renamed(self):
+		assert QSOSchema({'filter[name]': str}).record('filter[name]=a')._0 == 'a'
+	
+	def test_symbols(self):
+		schema = QSOSchema(page=int, assignment=':', separator=';')
+		assert schema.decode('page:4;other:1') == {'page': 4}
+	
+	def test_limits(self):
+		schema = QSOSchema(page=int, limits=Limits(value=2))
+		
+		assert schema.decode('page=10&other=1234') == {'page': 10}
+		
+		with pytest.raises(LimitExceeded):
+			schema.decode('page=100')
+	
+	def test_repr(self):
+		assert repr(SCHEMA) == "QSOSchema(page, tags, debug, ratio)"
+
+
+class TestSchemaSources:
+	@pytest.mark.parametrize('cls', [URI, FrozenURI, LazyURI])
+	def test_uri(self, cls):
+		assert SCHEMA.decode(cls('http://example.com/?tags=a&debug&page=5&tags=b')) == \
+				{'tags': ['a', 'b'], 'debug': True, 'page': 5, 'ratio': None}
+	
+	def test_uri_without_query(self):
+		assert SCHEMA.decode(URI('http://example.com/'))['page'] == 1
+	
+	def test_qso_unparsed(self):
+		instance = QSO('page=2&debug')
+		assert SCHEMA.decode(instance)['page'] == 2
+		
+		with pytest.raises(AttributeError):  # The query string remains unparsed.
+			object.__getattribute__(instance, '_groups')
+	
+	def test_qso_modified(self):
+		instance = QSO('page=2&debug')
+		instance['page'] = '3'
+		instance.append('tags=a b')
+		
+		assert SCHEMA.decode(instance) == {'page': 3, 'debug': True, 'tags': ['a b'], 'ratio': None}
+	
+	def test_qso_constructed(self):
+		assert SCHEMA.decode(QSO({'page': '4', 'tags': 'x'})) == {'page': 4, 'tags': ['x'], 'debug': None,
+				'ratio': None}
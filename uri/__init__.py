@@ -9,8 +9,15 @@ __all__ = list(locals())  # Initial set of symbols to exclude from our module ex
 from pathlib import PurePosixPath as Path
 
 from .bucket import Bucket  # Query string fragment.
-from .qso import QSO  # An object representing a whole query string.
+from .qso import QSO, FrozenQSO  # An object representing a whole query string, and its immutable variant.
 from .uri import URI  # The primary class exposed by this package to represent a URL or URI.
+from .frozen import FrozenURI  # An immutable, hashable URI variant.
+from .lazy import LazyURI  # A URI variant deferring the decoding of each component until first accessed.
+from .batch import parse_many  # Bulk parsing of iterables of URI strings.
+from .cache import ParseCache  # An opt-in, bounded cache of parsed URI components.
+from .intern import InternPool  # An opt-in, bounded pool of component values shared between URI.
+from .limit import Limits, LimitExceeded  # Bounds upon the parsing of untrusted query strings.
+from .schema import QSOSchema  # Typed decoding of query string arguments declared once.
 
 try:  # Discover installed package metadata...
 	_package = _metadata('uri')
@@ -0,0 +1,117 @@
+"""Bulk parsing of many URI strings at once, such as those read from access logs or crawl frontiers."""
+
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from .parse.rfc3986 import split
+from .part.host import classify
+from .qso import QSO
+from .uri import URI
+
+
+class Components(NamedTuple):
+	"""A lightweight record of the components of a URI, as produced by `parse_many(..., record=True)`.
+	
+	The scheme name and host are normalized as they would be by URI; the path, query, and fragment are as found.
+	"""
+	
+	scheme: Optional[str]
+	user: Optional[str]
+	password: Optional[str]
+	host: Optional[str]
+	port: Optional[int]
+	path: str
+	query: Optional[str]
+	fragment: Optional[str]
+
+
+EMPTY = Components(None, None, None, None, None, '', None, None)
+
+
+def parse_many(strings:Iterable[str], record:bool=False, strict:bool=True, limit:int=4096) -> Iterator:
+	"""Lazily parse an iterable of URI strings, yielding one result for each, in order.
+	
+	Work is shared across the batch: scheme names are resolved against the plugin registry once per distinct scheme,
+	and host names are normalized (lowercased, IDNA decoded) once per distinct host, with the resulting string shared
+	by every result bearing that host. At most `limit` distinct schemes and hosts are remembered.
+	
+	URI instances are populated directly, bypassing the constructor. If `record` is truthy, `Components` tuples are
+	yielded instead, with the query string as text; it is nonetheless parsed, to validate, where limits are configured.
+	Unless `strict`, strings with malformed authorities or hosts, or query strings exceeding any configured limits,
+	yield None rather than raising ValueError.
+	"""
+	
+	schemes = {}  # Raw scheme to normalized scheme name.
+	hosts = {}  # Raw host to the classification of the normalized host; see `uri.part.host.classify`.
+	load = URI.scheme.load
+	cast_host = URI.host.cast
+	cast_path = URI.path.cast
+	cast_query = URI.query.cast
+	limits = QSO.__limits__  # Also enforced upon the query strings of records, which are otherwise not parsed.
+	pool = URI.__intern_pool__  # Shares equal hosts, user names, and paths; see uri.intern.
+	if pool is None: pool = lambda value: value
+	new = URI.__new__
+	
+	for string in strings:
+		if not string:
+			yield EMPTY if record else URI()
+			continue
+		
+		try:
+			scheme, user, password, host, port, path, query, fragment = split(string)
+		except ValueError:
+			if strict: raise
+			yield None
+			continue
+		
+		if scheme:
+			name = schemes.get(scheme)
+			
+			if name is None:
+				name = load(scheme).name
+				if len(schemes) < limit: schemes[scheme] = name
+			
+			scheme = name
+		
+		info = None
+		
+		if host:
+			info = hosts.get(host)
+			
+			if info is None:
+				try:
+					info = classify(cast_host(host))
+				except ValueError:  # Such as UnicodeError, for malformed Punycode encoded labels.
+					if strict: raise
+					yield None
+					continue
+				
+				if len(hosts) < limit: hosts[host] = info
+			
+			host = pool(info.name)
+		
+		try:
+			parsed = cast_query(query) if query and (limits or not record) else None
+		except ValueError:  # Such as LimitExceeded, where limits are configured; see `uri.limit`.
+			if strict: raise
+			yield None
+			continue
+		
+		if record:
+			yield Components(scheme or None, user or None, password or None, host or None, port or None, path,
+					query or None, fragment or None)
+			continue
+		
+		uri = new(URI)
+		uri._scheme = scheme or None
+		uri._user = pool(user) if user else None
+		uri._password = password or None
+		uri._host = host or None
+		uri._hostinfo = info
+		uri._port = port or None
+		uri._path = pool(cast_path(path)) if path else None
+		uri._trailing = path.endswith('/')
+		uri._query = parsed
+		uri._fragment = fragment or None
+		uri._cache = None
+		
+		yield uri
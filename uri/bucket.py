@@ -1,14 +1,34 @@
-from urllib.parse import quote_plus, unquote_plus
+from .codec import FORM
+
+
+def encode(name, value, sep="=", valid=True):
+	"""Encode an optionally named value as it appears within a query string.
+	
+	Invalid pairs, those whose original text contained the separator more than once, are joined as-is.
+	"""
+	
+	parts = (value, ) if name is None else (name, value)
+	
+	if not valid:
+		return sep.join(parts)
+	
+	# Certain symbols are explicitly allowed, ref: http://pretty-rfc.herokuapp.com/RFC3986#query
+	return sep.join(map(FORM.encode, parts))
 
 
 class Bucket:
-	"""A bucket is a mutable container for an optionally named scalar value."""
+	"""A bucket is a mutable container for an optionally named scalar value.
+	
+	The encoded form is retained once rendered, and discarded upon reassignment of the name or value. Equality and
+	hashing are structural, by name and value, and do not involve encoding.
+	"""
 	
-	__slots__ = ('name', 'value', 'sep', 'valid')
+	__slots__ = ('_name', '_value', 'sep', 'valid', '_str')
 	
 	def __init__(self, name, value='', sep="=", strict=False):
 		self.valid = True
 		self.sep = sep
+		encoded = None
 		
 		if not value:
 			if isinstance(name, str):
@@ -19,25 +39,52 @@ class Bucket:
 				name, value = self.split(name)
 			
 			elif isinstance(name, Bucket):
+				if not name.valid:
+					if strict: raise ValueError(f"Multiple occurrences of separator {sep!r} in: '{name}'")
+					self.valid = False
+				
+				if name.sep == sep: encoded = name._str  # The encoded form of the original remains applicable.
 				name, value = name.name, name.value
 			
 			else:
 				name, value = name
 		
-		self.name = name
-		self.value = value
+		self._name = name
+		self._value = value
+		self._str = encoded
+	
+	@property
+	def name(self):
+		return self._name
+	
+	@name.setter
+	def name(self, name):
+		self._name = name
+		self._str = None
+	
+	@property
+	def value(self):
+		return self._value
+	
+	@value.setter
+	def value(self, value):
+		self._value = value
+		self._str = None
 	
 	def __eq__(self, other):
-		return str(self) == str(other)
+		if not isinstance(other, Bucket):
+			try: other = Bucket(other, sep=self.sep)
+			except (TypeError, ValueError): return NotImplemented
+		
+		return self.name == other.name and self.value == other.value
 	
-	def __ne__(self, other):
-		return not str(self) == str(other)
+	def __hash__(self):
+		return hash((self.name, self.value))
 	
 	def split(self, string):
 		name, match, value = string.partition(self.sep)
 		
-		name = unquote_plus(name)
-		value = unquote_plus(value)
+		name, value = FORM.decode_many((name, value))
 		
 		return name if match else None, value if match else name
 	
@@ -57,7 +104,10 @@ class Bucket:
 		return 1 if self.name is None else 2
 	
 	def __str__(self):
-		# Certain symbols are explicitly allowed, ref: http://pretty-rfc.herokuapp.com/RFC3986#query
-		iterator = (quote_plus(i.encode('utf8')).replace('%3F', '?').replace('%2F', '/') for i in self) if self.valid else self
-		return self.sep.join(iterator)
+		encoded = self._str
+		
+		if encoded is None:
+			encoded = self._str = encode(self._name, self._value, self.sep, self.valid)
+		
+		return encoded
 
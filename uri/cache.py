@@ -0,0 +1,90 @@
+"""A bounded, least-recently-used cache of parsed URI components, keyed on the original string.
+
+Applications repeatedly handling the same few thousand URIs (static assets, API endpoints, redirect targets) may opt
+in to skip parsing of any string seen recently:
+
+	from uri import URI
+	from uri.cache import ParseCache
+	
+	URI.__parse_cache__ = ParseCache(4096)
+
+Subsequent whole-URI assignment of a cached string copies the already cast components into place. These components
+are immutable, with the exception of the query string, which is recorded in frozen form and copied by the URI upon
+first access, so mutation of a URI never affects the cache or other URI sharing the entry.
+"""
+
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+
+class CacheInfo(NamedTuple):
+	"""Statistics describing the effectiveness of a parse cache, in the manner of `functools.lru_cache`."""
+	
+	hits: int
+	misses: int
+	maxsize: int
+	currsize: int
+
+
+class ParseCache:
+	"""A size-bounded mapping of URI strings to their parsed components, evicting the least recently used first."""
+	
+	__slots__ = ('maxsize', 'hits', 'misses', '_entries')
+	
+	def __init__(self, maxsize:int=1024) -> None:
+		if maxsize < 1:
+			raise ValueError("Parse cache size must be positive.")
+		
+		self.maxsize = maxsize
+		self.hits = 0
+		self.misses = 0
+		self._entries = OrderedDict()
+	
+	def __repr__(self):
+		return "{}({})".format(self.__class__.__name__, self.maxsize)
+	
+	def __len__(self):
+		return len(self._entries)
+	
+	def __contains__(self, string:str) -> bool:
+		return string in self._entries
+	
+	def get(self, string:str) -> Optional[tuple]:
+		"""Retrieve the components recorded for the given string, marking them as most recently used, or None."""
+		
+		entries = self._entries
+		
+		try:
+			components = entries[string]
+		except KeyError:
+			self.misses += 1
+			return None
+		
+		try:
+			entries.move_to_end(string)
+		except KeyError:  # Evicted by another thread in the interim.
+			pass
+		
+		self.hits += 1
+		return components
+	
+	def put(self, string:str, components:tuple) -> None:
+		"""Record the components of a newly parsed string, evicting the least recently used entry if full."""
+		
+		entries = self._entries
+		entries[string] = components
+		
+		if len(entries) > self.maxsize:
+			try:
+				entries.popitem(last=False)
+			except KeyError:  # Emptied by another thread in the interim.
+				pass
+	
+	def clear(self) -> None:
+		"""Discard all entries and reset the statistics."""
+		
+		self._entries.clear()
+		self.hits = self.misses = 0
+	
+	def info(self) -> CacheInfo:
+		return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
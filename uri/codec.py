@@ -0,0 +1,144 @@
+"""Table-driven percent-encoding and decoding of URI components, per RFC 3986.
+
+Each component permits a different set of characters to appear literally; any other must be percent-encoded, as the
+octets of its UTF-8 encoding. The encoded form of every octet is precomputed per component, and a string consisting
+solely of permitted characters is returned unchanged, as is one lacking any percent-encoded sequences upon decoding.
+
+The path, user, password, and fragment of a URI are stored as given, possibly already percent-encoded, so their
+codecs permit the percent sign itself: existing sequences are preserved, and only characters not permitted are
+encoded. Names and values within query strings are stored decoded; `FORM` encodes the percent sign, and spaces as plus
+signs, per `application/x-www-form-urlencoded`.
+
+	>>> PATH.encode('/café au lait')
+	'/caf%C3%A9%20au%20lait'
+	>>> FORM.decode('caf%C3%A9+au+lait')
+	'café au lait'
+"""
+
+from re import compile as r, escape, Match
+from string import ascii_letters, digits
+from typing import Iterable, List
+
+UNRESERVED = ascii_letters + digits + '-._~'
+SUB_DELIMS = "!$&'()*+,;="
+PCHAR = UNRESERVED + SUB_DELIMS + ':@'
+
+ESCAPES = r('(?:%[0-9A-Fa-f]{2})+')  # Runs of percent-encoded octets.
+BINARY_ESCAPES = r(b'(?:%[0-9A-Fa-f]{2})+')
+
+
+def _octets(match:Match) -> bytes:
+	"""The octets represented by a run of percent-encoded sequences."""
+	
+	return bytes.fromhex(match.group().replace('%', ''))
+
+
+def _utf8(match:Match) -> str:
+	return _octets(match).decode('utf-8', 'replace')
+
+
+def _binary(match:Match) -> bytes:
+	return bytes.fromhex(match.group().replace(b'%', b'').decode('ascii'))
+
+
+class Escapes(dict):
+	"""A translation table from code points to their encoded forms, for use with `str.translate`.
+	
+	Every ASCII code point is present; the percent-encoded UTF-8 octets of others are calculated upon first use and
+	retained, up to a bounded number of distinct code points.
+	"""
+	
+	__slots__ = ()
+	
+	limit: int = 128 + 1024
+	
+	def __missing__(self, point:int) -> str:
+		encoded = ''.join(f'%{i:02X}' for i in chr(point).encode('utf-8'))
+		if len(self) < self.limit: self[point] = encoded
+		return encoded
+
+
+class Codec:
+	"""Percent-encoding and decoding of one URI component, given the characters permitted to appear literally.
+	
+	If `plus`, spaces are encoded as, and plus signs decoded to, spaces, as for form encoding. Invalid UTF-8 is
+	decoded with replacement characters, as by `urllib.parse.unquote`.
+	"""
+	
+	__slots__ = ('safe', 'plus', '_escapes', '_binary', '_unsafe', '_deletions')
+	
+	def __init__(self, safe:str, plus:bool=False):
+		self.safe = safe
+		self.plus = plus
+		
+		table = [chr(i) if chr(i) in safe else f'%{i:02X}' for i in range(256)]
+		if plus: table[0x20] = '+'
+		
+		self._escapes = Escapes(enumerate(table[:128]))  # The encoded form of each character.
+		self._binary = tuple(i.encode('ascii') for i in table)  # The encoded form of each octet.
+		self._unsafe = r('[^' + escape(safe) + ']')  # Any character requiring encoding.
+		self._deletions = safe.encode('ascii')
+	
+	def __repr__(self):
+		return f"{self.__class__.__name__}({self.safe!r}{', plus=True' if self.plus else ''})"
+	
+	def encode(self, string:str) -> str:
+		"""Percent-encode the characters of the given string not permitted within this component."""
+		
+		if self._unsafe.search(string) is None:
+			return string
+		
+		return string.translate(self._escapes)
+	
+	def decode(self, string:str, encoding:str='utf-8') -> str:
+		"""Decode any percent-encoded sequences within the given string, as the octets of text in `encoding`."""
+		
+		if self.plus and '+' in string:
+			string = string.replace('+', ' ')
+		
+		if '%' not in string:
+			return string
+		
+		if encoding == 'utf-8':
+			return ESCAPES.sub(_utf8, string)
+		
+		return ESCAPES.sub(lambda match: _octets(match).decode(encoding, 'replace'), string)
+	
+	def encode_bytes(self, data:bytes) -> bytes:
+		"""Percent-encode the octets of the given binary data not permitted within this component."""
+		
+		if not data.translate(None, self._deletions):
+			return bytes(data)
+		
+		return b''.join(map(self._binary.__getitem__, data))
+	
+	def decode_bytes(self, data:bytes) -> bytes:
+		"""Decode any percent-encoded sequences within the given binary data, producing the octets represented."""
+		
+		if self.plus and b'+' in data:
+			data = data.replace(b'+', b' ')
+		
+		if b'%' not in data:
+			return bytes(data)
+		
+		return BINARY_ESCAPES.sub(_binary, data)
+	
+	def encode_many(self, strings:Iterable[str]) -> List[str]:
+		"""Percent-encode each of the given strings."""
+		
+		encode = self.encode
+		return [encode(string) for string in strings]
+	
+	def decode_many(self, strings:Iterable[str], encoding:str='utf-8') -> List[str]:
+		"""Decode each of the given strings."""
+		
+		decode = self.decode
+		return [decode(string, encoding) for string in strings]
+
+
+PATH = Codec(PCHAR + '/%')
+USER = Codec(UNRESERVED + SUB_DELIMS + '%')
+PASSWORD = Codec(UNRESERVED + SUB_DELIMS + ':%')
+QUERY = Codec(PCHAR + '/?%')
+FRAGMENT = Codec(PCHAR + '/?%')
+FORM = Codec(UNRESERVED + '/?', plus=True)  # Names and values within query strings; as `quote_plus`, allowing / and ?.
@@ -0,0 +1,68 @@
+from .part.query import FrozenQueryPart
+from .qso import FROZEN_EMPTY, FrozenQSO
+from .uri import URI
+
+COMPONENTS = ('_scheme', '_user', '_password', '_host', '_hostinfo', '_port', '_path', '_trailing', '_fragment')
+
+
+class FrozenURI(URI):
+	"""An immutable, hashable URI, suitable for use as a dictionary key or set member.
+	
+	Constructed from anything acceptable to URI, including named parts. Assignment to, or deletion of, any attribute
+	raises AttributeError, and the query string is a FrozenQSO, rejecting in-place modification with TypeError. Methods
+	producing new URIs, such as division or `resolve`, return new frozen instances. Pass a FrozenURI to URI to obtain a
+	mutable copy.
+	
+	The hash is derived from the same normalized components examined by equality comparison, and computed only once.
+	"""
+	
+	__slots__ = ('_hash', )
+	
+	query = FrozenQueryPart()
+	
+	def __init__(self, _uri=None, **parts) -> None:
+		if parts or not isinstance(_uri, URI):
+			_uri = URI(_uri, **parts)
+		
+		assign = object.__setattr__
+		
+		for slot in COMPONENTS:
+			assign(self, slot, getattr(_uri, slot))
+		
+		query = _uri._query
+		
+		if not query:
+			query = FROZEN_EMPTY
+		elif not isinstance(query, FrozenQSO):
+			query = FrozenQSO(query, query.assignment, query.separator, query.strict)
+		
+		assign(self, '_query', query)
+		assign(self, '_cache', None)
+		assign(self, '_hash', None)
+	
+	def __setattr__(self, name, value):
+		if name in ('_cache', '_hash'):  # Memoization of renderings and the hash is still permitted.
+			return object.__setattr__(self, name, value)
+		
+		raise AttributeError(f"'{self.__class__.__name__}' object is immutable; can not assign '{name}'")
+	
+	def __delattr__(self, name):
+		raise AttributeError(f"'{self.__class__.__name__}' object is immutable; can not delete '{name}'")
+	
+	def __copy__(self):
+		return self  # Immutable; a copy would be indistinguishable.
+	
+	def __deepcopy__(self, memo):
+		return self
+	
+	def __reduce__(self):
+		return self.__class__, (str(self), )  # Reconstructed by parsing, as slots may not be assigned in place.
+	
+	def __hash__(self):
+		value = self._hash
+		
+		if value is None:
+			value = hash(self._key)
+			object.__setattr__(self, '_hash', value)
+		
+		return value
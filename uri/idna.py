@@ -0,0 +1,107 @@
+"""Conversion of internationalized host names between their Unicode and ASCII (Punycode) forms.
+
+Unicode names are first mapped in the manner of UTS #46 nontransitional processing, as used by current browsers:
+characters are case folded and normalized to their compatibility forms, those commonly mapped to nothing are removed,
+and the full stops of other scripts become label separators. The four "deviation" characters, ß, ς, and the zero-width
+joiner and non-joiner, are retained rather than mapped, unlike the IDNA 2003 `idna` codec of the standard library,
+which maps ß to "ss".
+
+This is not UTS #46 processing. The mapping is only an approximation of the published UTS #46 mapping table, derived
+from the Unicode Character Database bundled with Python (NFKC normalization, case folding, and table B.1 of RFC 3454
+via `stringprep`), requiring neither network access nor any additional dependency. No validity criteria are applied:
+characters disallowed by UTS #46 or IDNA 2008, and the bidirectional and contextual rules, are not checked, in
+keeping with the leniency of the remainder of this package. Where validation is required, use the `idna` package.
+
+Encoded labels are decoded only if they are well formed: Punycode decoding to characters outside ASCII, and
+re-encoding to exactly the label given. Others, such as "xn--paypal-", which would otherwise decode to an unrelated
+ASCII label, raise UnicodeError.
+
+Conversion is performed, and cached, a label at a time, so that hosts sharing a suffix, such as the many subdomains
+of one site, share the work of converting it. Each cache is a bounded LRU.
+
+	>>> to_ascii('Bücher.example')
+	'xn--bcher-kva.example'
+	>>> to_unicode('xn--bcher-kva.example')
+	'bücher.example'
+"""
+
+from functools import lru_cache
+from stringprep import in_table_b1
+from unicodedata import normalize
+
+LIMIT = 4096  # The maximum number of labels cached, in each direction.
+PREFIX = 'xn--'  # The ACE prefix, marking an encoded label.
+
+DEVIATIONS = frozenset('ßς\u200c\u200d')  # Valid under nontransitional processing; retained as-is.
+SEPARATORS = str.maketrans('\u3002\uff0e\uff61', '...')  # Ideographic, fullwidth, and halfwidth full stops.
+
+
+def remap(label:str) -> str:
+	"""Map a label as by UTS #46: case folded, compatibility normalized, and with ignored characters removed."""
+	
+	if label.isascii(): return label.lower()
+	
+	mapped = []
+	
+	for character in normalize('NFKC', label):
+		if character in DEVIATIONS:
+			mapped.append(character)
+		elif character == '\u1e9e':  # Capital sharp S; case folding would produce "ss".
+			mapped.append('ß')
+		elif not in_table_b1(character):  # Table B.1 of RFC 3454: characters commonly mapped to nothing.
+			mapped.append(character.casefold())
+	
+	return normalize('NFC', normalize('NFKC', ''.join(mapped)))
+
+
+@lru_cache(maxsize=LIMIT)
+def encode_label(label:str) -> str:
+	"""Convert a single label to its ASCII form, Punycode encoding any that are not already ASCII once mapped."""
+	
+	label = remap(label)
+	
+	if not label.isascii():
+		label = PREFIX + label.encode('punycode').decode('ascii')
+	
+	if not 0 < len(label) < 64:
+		raise UnicodeError("label empty or too long")
+	
+	return label
+
+
+@lru_cache(maxsize=LIMIT)
+def decode_label(label:str) -> str:
+	"""Convert a single label to its Unicode form, decoding any Punycode encoded label.
+	
+	Raises UnicodeError if the encoded label is malformed, or decodes to text which is pure ASCII, or which does not
+	encode to exactly the same label.
+	"""
+	
+	label = label.lower()
+	
+	if label.startswith(PREFIX):
+		encoded = label[len(PREFIX):]
+		decoded = encoded.encode('ascii').decode('punycode')
+		
+		if decoded.isascii() or decoded.encode('punycode').decode('ascii') != encoded:
+			raise UnicodeError(f"invalid encoded label: {label!r}")
+		
+		label = decoded
+	
+	return label
+
+
+def to_ascii(host:str) -> str:
+	"""Convert a host name to its ASCII form, as it appears within a URI. Raises UnicodeError if invalid."""
+	
+	labels = host.translate(SEPARATORS).split('.')
+	root = '.' if len(labels) > 1 and not labels[-1] else ''  # A trailing full stop, the DNS root, is preserved.
+	if root: labels.pop()
+	
+	return '.'.join([encode_label(label) for label in labels]) + root
+
+
+def to_unicode(host:str) -> str:
+	"""Convert a host name to its Unicode form, decoding Punycode encoded labels. Raises UnicodeError if invalid."""
+	
+	return '.'.join([decode_label(label) for label in host.split('.')])
@@ -0,0 +1,85 @@
+"""A bounded pool of canonical component values, shared by every URI bearing an equal one.
+
+Applications retaining many URI, such as crawlers, log processors, or link graphs, see the same few hosts, user names,
+and paths repeated across most of them. Each parsed URI otherwise holds its own copy of each. Opting in to a pool
+substitutes the first equal value seen for each one assigned:
+
+	from uri import URI
+	from uri.intern import InternPool
+	
+	URI.__intern_pool__ = InternPool(65536)
+
+Hosts, user names, and paths are interned upon assignment, whether whole-URI or piecemeal, by `URI`, `LazyURI`, and
+`uri.batch.parse_many`. Every pooled value is immutable, so sharing is never observable other than by identity.
+
+Python strings can not be weakly referenced, so the pool is bounded instead: once full, values not already pooled are
+returned unchanged, rather than evicting those already shared. Frequently repeated values, seen early, are retained.
+"""
+
+from typing import Hashable, NamedTuple, TypeVar
+
+T = TypeVar('T', bound=Hashable)
+
+
+class PoolInfo(NamedTuple):
+	"""Statistics describing the effectiveness of an intern pool, in the manner of `uri.cache.CacheInfo`."""
+	
+	hits: int
+	misses: int
+	maxsize: int
+	currsize: int
+	
+	@property
+	def ratio(self) -> float:
+		"""The proportion of values interned which were already pooled, and so shared."""
+		
+		total = self.hits + self.misses
+		return self.hits / total if total else 0.0
+
+
+class InternPool:
+	"""A size-bounded mapping of immutable values to the canonical, shared, instance of each."""
+	
+	__slots__ = ('maxsize', 'hits', 'misses', '_entries')
+	
+	def __init__(self, maxsize:int=65536) -> None:
+		if maxsize < 1:
+			raise ValueError("Intern pool size must be positive.")
+		
+		self.maxsize = maxsize
+		self.hits = 0
+		self.misses = 0
+		self._entries = {}
+	
+	def __repr__(self):
+		return "{}({})".format(self.__class__.__name__, self.maxsize)
+	
+	def __len__(self):
+		return len(self._entries)
+	
+	def __contains__(self, value:Hashable) -> bool:
+		return value in self._entries
+	
+	def __call__(self, value:T) -> T:
+		"""Return the pooled instance equal to the given value, pooling the value itself if not yet full."""
+		
+		entries = self._entries
+		pooled = entries.get(value)
+		
+		if pooled is not None:
+			self.hits += 1
+			return pooled
+		
+		self.misses += 1
+		if len(entries) < self.maxsize: entries[value] = value
+		
+		return value
+	
+	def clear(self) -> None:
+		"""Discard all entries and reset the statistics."""
+		
+		self._entries.clear()
+		self.hits = self.misses = 0
+	
+	def info(self) -> PoolInfo:
+		return PoolInfo(self.hits, self.misses, self.maxsize, len(self._entries))
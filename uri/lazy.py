@@ -0,0 +1,125 @@
+from .parse.rfc3986 import BINARY_PATTERN, BUFFERS, URI_PATTERN, WHITESPACE, decode, sanitize, split_authority
+from .part.host import classify
+from .part.uri import URIPart
+from .uri import URI
+
+COMPONENTS = ('_scheme', '_user', '_password', '_host', '_hostinfo', '_port', '_path', '_trailing', '_query',
+		'_fragment')
+
+
+class LazyURIPart(URIPart):
+	"""Whole-URI storage for LazyURI instances.
+	
+	Assignment only locates the boundaries of the top-level components, deferring all decoding and casting. The
+	original text is recorded as the cached rendering of the whole URI, returned verbatim until a modification of any
+	component discards it.
+	
+	Binary buffers are scanned in place and retained; components are sliced from the buffer and decoded on access.
+	"""
+	
+	__slots__ = ()
+	
+	def __set__(self, obj, value):
+		try: obj._cache
+		except AttributeError: pass  # Newly constructed; there is nothing to discard.
+		else:
+			for part in COMPONENTS:  # Discard any previously materialized components.
+				try: delattr(obj, part)
+				except AttributeError: pass
+		
+		if not value:
+			for part in COMPONENTS:
+				setattr(obj, part, None)
+			
+			obj._match = obj._cache = None
+			return
+		
+		if isinstance(value, BUFFERS):  # There is no original text to preserve without decoding the whole.
+			obj._match = BINARY_PATTERN.match(sanitize(value))
+			obj._cache = None
+			return
+		
+		value = sanitize(str(value))
+		obj._match = URI_PATTERN.match(value.lstrip(WHITESPACE))
+		obj._cache = {self: value}
+
+
+class LazyURI(URI):
+	"""A URI which records where each component lies within the original string, decoding each upon first access.
+	
+	Ideal where only one or two components of a URI will be examined, for example, just the host or path. Until
+	modified, the original string is preserved exactly and returned when cast to a string, without normalization,
+	other than the removal of any tab, carriage return, or line feed characters, as by `URI`.
+	
+	As a consequence, validation of the authority (user, password, host, and port) is deferred until one of those
+	components is accessed; a malformed port number will not raise ValueError at construction time.
+	
+	A bytes, bytearray, or memoryview buffer may be given in place of a string, such as a request target sliced from
+	a socket buffer, and is used in place. Only the components accessed are copied out and decoded. When cast to a
+	string, the URI is rendered from its components rather than preserved verbatim. A mutable buffer must not be
+	modified while the URI may still need to read from it.
+	"""
+	
+	__slots__ = ('_match', )
+	
+	uri = LazyURIPart(URI.__parts__)
+	
+	def __copy__(self):
+		return self.__class__(str(self))  # Located anew within the text, rather than materializing every component.
+	
+	def __deepcopy__(self, memo):
+		return self.__class__(str(self))
+	
+	def __reduce__(self):
+		return self.__class__, (str(self), )  # The match located within the original text can not be pickled.
+	
+	def __getattr__(self, name:str):
+		"""Materialize a scalar component upon first access, typically from a part descriptor."""
+		
+		cls = self.__class__
+		
+		if name not in COMPONENTS:
+			raise AttributeError(f"'{cls.__name__}' object has no attribute '{name}'")
+		
+		match = self._match
+		group = match.group if isinstance(match.string, str) else lambda i: decode(match.group(i))
+		pool = cls.__intern_pool__
+		if pool is None: pool = lambda value: value
+		
+		if name == '_scheme':
+			scheme = group(1)
+			values = {'_scheme': cls.scheme.load(scheme.lower()).name if scheme else None}
+		
+		elif name in ('_user', '_password', '_host', '_hostinfo', '_port'):
+			authority = group(2)
+			user = password = host = port = None
+			
+			if authority is not None:
+				user, password, host, port = split_authority(authority)
+			
+			host = pool(cls.host.cast(host)) if host else None
+			
+			values = {
+					'_user': pool(user) if user else None,
+					'_password': password or None,
+					'_host': host,
+					'_hostinfo': classify(host) if host else None,
+					'_port': port or None,
+				}
+		
+		elif name in ('_path', '_trailing'):
+			path = group(3)
+			values = {'_path': pool(cls.path.cast(path)) if path else None, '_trailing': path.endswith('/')}
+		
+		elif name == '_query':
+			query = group(4)
+			values = {'_query': cls.query.cast(query) if query else None}
+		
+		else:  # _fragment
+			values = {'_fragment': group(5) or None}
+		
+		for slot, value in values.items():  # Components sharing a span may have been individually assigned already.
+			try: object.__getattribute__(self, slot)
+			except AttributeError: setattr(self, slot, value)
+		
+		return object.__getattribute__(self, name)
@@ -0,0 +1,57 @@
+"""Bounds upon the parsing of untrusted query strings, rejecting oversized input before the work of parsing it.
+
+Limits apply wherever query strings are parsed from text, including those of URI, and to parameters later added or
+assigned, and may be configured globally:
+
+	from uri import QSO
+	from uri.limit import Limits
+	
+	QSO.__limits__ = Limits(parameters=256, name=128, value=4096, length=65536)
+
+Or for individual query strings, by passing `limits` to `QSO`, or to `QSO.from_stream`. Input exceeding a limit
+raises `LimitExceeded`, a ValueError, as soon as the excess is found, leaving any query string being extended
+unmodified by the parameter found in excess. The total length applies to each text given whole, whether to parse or
+to extend a query string, rather than to the accumulated result; the number of parameters applies to the result.
+"""
+
+from typing import NamedTuple, Optional
+
+
+class LimitExceeded(ValueError):
+	"""Raised upon parsing or extending a query string beyond a configured limit."""
+	
+	def __init__(self, limit:str, maximum:int):
+		super().__init__(f"Query string exceeds the limit of {maximum} on {limit}.")
+		self.limit = limit
+		self.maximum = maximum
+
+
+class Limits(NamedTuple):
+	"""Bounds upon a query string parsed from text. Each may be None, to leave that aspect unbounded.
+	
+	Name and value lengths are measured prior to percent-decoding; as decoding never lengthens them, these are
+	conservative.
+	"""
+	
+	parameters: Optional[int] = None  # The number of parameters.
+	name: Optional[int] = None  # The length of any one name.
+	value: Optional[int] = None  # The length of any one value.
+	length: Optional[int] = None  # The length of the whole.
+	
+	def check(self, text, separator) -> None:
+		"""Check the whole of a query string prior to parsing it; cheap, and without dividing it."""
+		
+		if self.length is not None and len(text) > self.length:
+			raise LimitExceeded('length', self.length)
+		
+		if self.parameters is not None and text.count(separator) >= self.parameters:
+			raise LimitExceeded('parameters', self.parameters)
+	
+	def check_pair(self, name, value) -> None:
+		"""Check the name, which may be None, and value of one parameter."""
+		
+		if self.name is not None and name is not None and len(name) > self.name:
+			raise LimitExceeded('name', self.name)
+		
+		if self.value is not None and len(value) > self.value:
+			raise LimitExceeded('value', self.value)
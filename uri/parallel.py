@@ -0,0 +1,101 @@
+"""Parallel parsing, normalization, and projection of large URI corpora across a pool of worker processes.
+
+Parsing is CPU-bound pure Python, so threads do not help; instead, chunks of input strings are distributed to a
+`ProcessPoolExecutor`. Workers return compact, picklable projections (strings, integers, and None) of the fields
+requested, never URI instances, keeping inter-process traffic to a minimum.
+
+	from uri.parallel import parse_parallel
+	
+	with open('access.log') as lines:
+		unique = set(parse_parallel(line.rstrip('\n') for line in lines))
+"""
+
+from collections import deque
+from concurrent.futures import Executor, FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from os import cpu_count
+from pathlib import PurePath
+from typing import Iterable, Iterator, Optional, Sequence, Union
+
+from .batch import parse_many
+
+Fields = Union[str, Sequence[str]]
+
+
+def _project(uri, field:str):
+	"""Retrieve a field of the URI, reduced to a plain string, integer, or None, if absent or empty."""
+	
+	value = getattr(uri, field)
+	
+	if value is None or isinstance(value, (str, int)):
+		return value
+	
+	if isinstance(value, PurePath) and not value.parts:  # An absent path, otherwise rendered as ".".
+		return None
+	
+	return str(value) or None  # Scheme, PurePosixPath, or QSO instances.
+
+
+def process(chunk:Sequence[str], fields:Fields='uri', strict:bool=True) -> list:
+	"""Parse and project a chunk of URI strings within a worker process.
+	
+	If `fields` is a single field name the projected value for each URI is returned, otherwise a tuple of values.
+	"""
+	
+	results = []
+	
+	for uri in parse_many(chunk, strict=strict):
+		if uri is None:
+			results.append(None)
+		elif isinstance(fields, str):
+			results.append(_project(uri, fields))
+		else:
+			results.append(tuple(_project(uri, field) for field in fields))
+	
+	return results
+
+
+def parse_parallel(strings:Iterable[str], fields:Fields='uri', workers:Optional[int]=None, chunksize:int=10000,
+		ordered:bool=True, strict:bool=True, executor:Optional[Executor]=None) -> Iterator:
+	"""Parse and project an iterable of URI strings across a pool of worker processes, yielding the projections.
+	
+	The default field, `uri`, is the normalized form of the URI, suitable for de-duplication. Any URI attribute may be
+	named, e.g. `('scheme', 'host', 'path')`, to receive tuples instead. The input is consumed lazily, `chunksize`
+	strings at a time, with at most two chunks per worker outstanding at any moment, bounding memory use regardless of
+	the size of the input.
+	
+	If `ordered`, results are yielded in the order of the input; otherwise, chunks are yielded as they complete. Unless
+	`strict`, malformed URIs are projected as None rather than raising ValueError. A running executor may be supplied
+	to amortize pool startup across calls, otherwise one with `workers` processes (default: one per CPU) is used.
+	"""
+	
+	owned = executor is None
+	if owned: executor = ProcessPoolExecutor(workers)
+	
+	limit = 2 * (workers or cpu_count() or 1)
+	strings = iter(strings)
+	pending = deque()
+	
+	try:
+		while True:
+			while len(pending) < limit:
+				chunk = list(islice(strings, chunksize))
+				if not chunk: break
+				pending.append(executor.submit(process, chunk, fields, strict))
+			
+			if not pending:
+				return
+			
+			if ordered:
+				yield from pending.popleft().result()
+				continue
+			
+			done, _ = wait(pending, return_when=FIRST_COMPLETED)
+			
+			for future in done:
+				pending.remove(future)
+				yield from future.result()
+	
+	finally:
+		for future in pending: future.cancel()
+		if owned: executor.shutdown()
@@ -0,0 +1,207 @@
+"""Incremental decoding of `application/x-www-form-urlencoded` content, such as large form submissions or bulk query
+string exports, without first reading the whole into memory.
+
+	from uri import QSO
+	
+	with open('export.txt', 'rb') as body:
+		query = QSO.from_stream(body)
+
+Alternatively, each parameter may be processed as it completes, and discarded, by feeding chunks to a decoder:
+
+	decoder = FormDecoder()
+	
+	for chunk in chunks:
+		for bucket in decoder.feed(chunk): ...
+	
+	for bucket in decoder.close(): ...
+"""
+
+from typing import Iterator, List, Optional, Tuple, Union
+
+from ..bucket import Bucket
+from ..codec import FORM
+from ..limit import LimitExceeded, Limits
+
+Chunk = Union[str, bytes, bytearray, memoryview]
+Pair = Tuple[Optional[str], str, bool]  # Name, value, and validity.
+
+
+def _unquote_binary(string:bytes, encoding:str) -> str:
+	"""Decode percent-encoded binary content, in the manner of `FORM.decode` for text."""
+	
+	return FORM.decode_bytes(string).decode(encoding, 'replace')
+
+
+def read(source, size:int=65536) -> Iterator[Chunk]:
+	"""Iterate chunks of at most `size` from a file-like object, or the chunks of any other iterable as given."""
+	
+	read = getattr(source, 'read', None)
+	
+	if read is None:
+		yield from source
+		return
+	
+	while True:
+		chunk = read(size)
+		if not chunk: return
+		yield chunk
+
+
+class FormDecoder:
+	"""An incremental decoder, accepting chunks of text or binary data and producing buckets as parameters complete.
+	
+	Only the incomplete final parameter of each chunk is held between calls, bounding memory use by the size of the
+	chunks and of the largest single parameter, rather than the whole. Binary content is percent-decoded to bytes
+	before decoding text as `encoding`, so multibyte characters may freely span chunks. The results are those of
+	`QSO` parsing of the concatenated content.
+	
+	Any `limits` are enforced as content arrives: the total length as each chunk is accepted, and the number of
+	parameters and their lengths as each completes. Where both name and value lengths are limited, an incomplete
+	parameter is also rejected as soon as it grows beyond any permissible parameter.
+	"""
+	
+	__slots__ = ('assignment', 'separator', 'strict', 'encoding', 'limits', '_pending', '_held', '_length', '_count')
+	
+	def __init__(self, assignment:str="=", separator:str="&", strict:bool=False, encoding:str='utf-8',
+			limits:Optional[Limits]=None):
+		self.assignment = assignment
+		self.separator = separator
+		self.strict = strict
+		self.encoding = encoding
+		self.limits = limits
+		self._pending = None  # The fragments of the incomplete final parameter, or None prior to any content.
+		self._held = 0  # The combined length of those fragments.
+		self._length = self._count = 0  # Content accepted, and parameters completed, for the enforcement of limits.
+	
+	def feed(self, chunk:Chunk) -> List[Bucket]:
+		"""Accept the next chunk of content, returning the buckets of any parameters completed by it."""
+		
+		return [self._bucket(*pair) for pair in self._split(chunk)]
+	
+	def close(self) -> List[Bucket]:
+		"""Conclude the content, returning the bucket of the final parameter, if there was any content at all."""
+		
+		return [self._bucket(*pair) for pair in self._finish()]
+	
+	def decode(self, source, size:int=65536) -> Iterator[Bucket]:
+		"""Iterate the buckets of the content of a file-like object, or iterable of chunks, as each completes."""
+		
+		for chunk in read(source, size):
+			yield from self.feed(chunk)
+		
+		yield from self.close()
+	
+	def _bucket(self, name:Optional[str], value:str, valid:bool) -> Bucket:
+		bucket = Bucket.__new__(Bucket)
+		bucket.sep = self.assignment
+		bucket.valid = valid
+		bucket.name = name
+		bucket.value = value
+		
+		return bucket
+	
+	def _split(self, chunk:Chunk) -> List[Pair]:
+		"""Decode the parameters completed by the given chunk, retaining the remainder."""
+		
+		if not chunk:
+			return []
+		
+		if not isinstance(chunk, (str, bytes)):
+			chunk = bytes(chunk)
+		
+		limits = self.limits
+		
+		if limits and limits.length is not None:
+			self._length += len(chunk)
+			if self._length > limits.length: raise LimitExceeded('length', limits.length)
+		
+		separator = self.separator if isinstance(chunk, str) else self.separator.encode('ascii')
+		pending = self._pending
+		
+		if pending and type(pending[0]) is not type(chunk):
+			raise TypeError(f"Text and binary content may not be mixed; expected {type(pending[0]).__name__} chunks, "
+					f"not {type(chunk).__name__}.")
+		
+		if separator not in chunk and not (pending and self._spans(separator, chunk)):
+			# The final parameter continues; its fragments are joined once it completes.
+			if pending is None: pending = self._pending = []
+			pending.append(chunk)
+			self._held += len(chunk)
+			
+			if limits: self._bound()
+			return []
+		
+		if pending: chunk = chunk[:0].join((*pending, chunk))
+		
+		parts = chunk.split(separator)
+		remainder = parts.pop()
+		self._pending = [remainder]
+		self._held = len(remainder)
+		
+		if limits:
+			self._count += len(parts)
+			
+			if limits.parameters is not None and self._count >= limits.parameters:  # Including the one pending.
+				raise LimitExceeded('parameters', limits.parameters)
+			
+			self._bound()
+		
+		return [self._decode(part) for part in parts]
+	
+	def _spans(self, separator:Union[str, bytes], chunk:Union[str, bytes]) -> bool:
+		"""Determine if a separator of more than one character begins within the fragments pending and ends within the
+		given chunk."""
+		
+		width = len(separator) - 1
+		if not width: return False
+		
+		pending = self._pending
+		tail = pending[-1][-width:]
+		index = len(pending) - 1
+		
+		while len(tail) < width and index:  # Fragments may be shorter than the separator.
+			index -= 1
+			tail = pending[index][len(tail) - width:] + tail
+		
+		return separator in tail + chunk[:width]
+	
+	def _bound(self) -> None:
+		"""Reject the incomplete final parameter once longer than any permissible parameter, if that is bounded."""
+		
+		limits = self.limits
+		
+		if limits.name is None or limits.value is None:
+			return
+		
+		if self._held > limits.name + len(self.assignment) + limits.value:
+			pending = self._pending
+			self._decode(pending[0][:0].join(pending))  # Necessarily exceeds one limit or the other.
+	
+	def _finish(self) -> List[Pair]:
+		"""Decode the final parameter, resetting the decoder for reuse."""
+		
+		pending, self._pending = self._pending, None
+		self._held = self._length = self._count = 0
+		
+		return [] if pending is None else [self._decode(pending[0][:0].join(pending))]
+	
+	def _decode(self, part:Union[str, bytes]) -> Pair:
+		if isinstance(part, str):
+			unquote, assignment = FORM.decode, self.assignment
+		else:
+			unquote, assignment = _unquote_binary, self.assignment.encode('ascii')
+		
+		name, match, value = part.partition(assignment)
+		limits = self.limits
+		
+		if not match:
+			if limits: limits.check_pair(None, name)
+			return None, unquote(name, self.encoding), True
+		
+		if limits: limits.check_pair(name, value)
+		valid = assignment not in value
+		
+		if not valid and self.strict:
+			raise ValueError(f"Multiple occurrences of separator {self.assignment!r} in: {part!r}")
+		
+		return unquote(name, self.encoding), unquote(value, self.encoding), valid
@@ -0,0 +1,138 @@
+"""Single-pass splitting of RFC 3986 URI references into their component parts.
+
+The general form is that given by the regular expression in RFC 3986 Appendix B, with the scheme only recognized where
+it is syntactically valid:
+
+	scheme:[//[user[:password]@]host[:port]][/path][?query][#fragment]
+
+One match against the reference identifies the boundaries of every top-level component; the authority, if present, is
+then divided into user information, host, and port. Values are returned as found, without any decoding or casting.
+Results are compatible with those of `urllib.parse.urlsplit`, including its ValueError on malformed authorities.
+
+Binary buffers (bytes, bytearray, or memoryview) are scanned in place, without first decoding the whole; only the
+slice of each component found is copied out and decoded as UTF-8.
+
+As by `urlsplit`, tab, carriage return, and line feed characters are removed wherever they appear, before splitting.
+"""
+
+from re import compile as r, DOTALL
+from socket import inet_pton, AF_INET6, error as SocketError
+from typing import Optional, Tuple, Union
+from unicodedata import normalize
+
+WHITESPACE = ''.join(chr(i) for i in range(0x21))  # C0 control characters and space; stripped from the left.
+UNSAFE = str.maketrans('', '', '\t\r\n')  # Removed wherever found, as by urlsplit and the WHATWG URL standard.
+UNSAFE_BINARY = r(rb'[\t\r\n]')
+
+URI_PATTERN = r(r'(?:([a-zA-Z][a-zA-Z0-9+.-]*):)?(?://([^/?#]*))?([^?#]*)(?:\?([^#]*))?(?:#(.*))?', DOTALL)
+BINARY_PATTERN = r(rb'[\x00-\x20]*' + URI_PATTERN.pattern.encode('ascii'), DOTALL)  # Skips leading whitespace itself.
+
+BUFFERS = (bytes, bytearray, memoryview)  # Binary types scanned in place by BINARY_PATTERN.
+
+
+Authority = Tuple[Optional[str], Optional[str], Optional[str], Optional[int]]
+Components = Tuple[Optional[str], Optional[str], Optional[str], Optional[str], Optional[int], str, Optional[str],
+		Optional[str]]
+
+
+def decode(value:Optional[bytes]) -> Optional[str]:
+	"""Decode a component matched within a binary buffer, preserving None for those not present."""
+	
+	return None if value is None else str(value, 'utf-8')
+
+
+def sanitize(value:Union[str, bytes, bytearray, memoryview]) -> Union[str, bytes, bytearray, memoryview]:
+	"""Remove tab, carriage return, and line feed characters, wherever found, returning the value itself if none are."""
+	
+	if isinstance(value, str):
+		if '\t' in value or '\r' in value or '\n' in value: return value.translate(UNSAFE)
+		return value
+	
+	if UNSAFE_BINARY.search(value): return UNSAFE_BINARY.sub(b'', value)
+	return value
+
+
+def _check_netloc(authority:str) -> None:
+	"""Reject authorities containing characters which expand to delimiters under NFKC normalization.
+	
+	This mirrors the protection `urlsplit` applies against characters such as U+2100 (℀) expanding to "a/c" once IDNA
+	encoded.
+	"""
+	
+	n = authority.replace('@', '').replace(':', '').replace('#', '').replace('?', '')
+	normalized = normalize('NFKC', n)
+	if n == normalized: return
+	
+	for c in '/?#@:':
+		if c in normalized:
+			raise ValueError(f"netloc '{authority}' contains invalid characters under NFKC normalization")
+
+
+def split_authority(authority:str) -> Authority:
+	"""Divide an authority into its user, password, host, and port components.
+	
+	Absent components are returned as None. The port, if present, is cast to an integer and range checked.
+	"""
+	
+	if ('[' in authority) != (']' in authority):
+		raise ValueError("Invalid IPv6 URL")
+	
+	if not authority.isascii():
+		_check_netloc(authority)
+	
+	userinfo, delimited, hostinfo = authority.rpartition('@')
+	user = password = port = None
+	
+	if delimited:
+		user, delimited, password = userinfo.partition(':')
+		if not delimited: password = None
+	
+	_, bracketed, host = hostinfo.partition('[')
+	
+	if bracketed:  # IP-literal, such as an IPv6 address; the port, if any, follows the closing bracket.
+		host, _, port = host.partition(']')
+		_, _, port = port.partition(':')
+		
+		if not host.startswith('v'):  # IPvFuture is passed through untouched.
+			try: inet_pton(AF_INET6, host.partition('%')[0])
+			except (SocketError, ValueError): raise ValueError(f"Invalid IPv6 address: {host!r}")
+	
+	else:
+		host, _, port = hostinfo.partition(':')
+	
+	if not port:
+		return user, password, host, None
+	
+	if not (port.isdigit() and port.isascii()):
+		raise ValueError(f"Port could not be cast to integer value as {port!r}")
+	
+	port = int(port)
+	if port > 65535: raise ValueError("Port out of range 0-65535")
+	
+	return user, password, host, port
+
+
+def split(value:Union[str, bytes, bytearray, memoryview]) -> Components:
+	"""Split a URI reference into (scheme, user, password, host, port, path, query, fragment) in a single pass.
+	
+	Components which are not present are returned as None, distinguishing them from those present, but empty. The path
+	is always present, though possibly empty. The scheme is lowercased; nothing else is altered. Components of binary
+	buffers are decoded individually; invalid UTF-8 raises UnicodeDecodeError, a ValueError.
+	"""
+	
+	value = sanitize(value)
+	
+	if isinstance(value, str):
+		scheme, authority, path, query, fragment = URI_PATTERN.match(value.lstrip(WHITESPACE)).groups()
+	else:
+		scheme, authority, path, query, fragment = map(decode, BINARY_PATTERN.match(value).groups())
+	
+	if authority is None:
+		user = password = host = port = None
+	else:
+		user, password, host, port = split_authority(authority)
+	
+	if scheme is not None:
+		scheme = scheme.lower()
+	
+	return scheme, user, password, host, port, path, query, fragment
@@ -1,3 +1,4 @@
+from ..codec import USER
 from .base import ProxyPart, GroupPart
 
 
@@ -13,3 +14,4 @@ class SafeAuthenticationPart(ProxyPart):
 	
 	attribute = 'user'
 	suffix = '@'
+	codec = USER
@@ -2,9 +2,17 @@ from operator import attrgetter
 from re import compile as r, Pattern
 from typing import Any, Callable, Optional, Tuple, TypeVar, Union, Iterable, abstractmethod
 
+from ..codec import Codec
 from ..typing import Stringy
 
 
+def invalidate(obj) -> None:
+	"""Discard any renderings of compound parts cached by the given URI, following a change to one of its components."""
+	
+	cache = obj._cache
+	if cache: cache.clear()
+
+
 class Part:
 	"""Descriptor protocol objects for combinatorial string parts with validation."""
 	
@@ -14,10 +22,15 @@ class Part:
 	prefix: str = ''
 	suffix: str = ''
 	empty: str = ''
+	codec: Optional[Codec] = None  # Percent-encodes characters not permitted within the component, if requested.
 	
-	def render(self, obj, value:Optional[Stringy], raw:bool=False) -> str:
+	def render(self, obj, value:Optional[Stringy], raw:bool=False, encode:bool=False) -> str:
 		if not value: return self.empty
-		return self.prefix + str(value) + self.suffix
+		
+		value = str(value)
+		if encode and self.codec: value = self.codec.encode(value)
+		
+		return self.prefix + value + self.suffix
 	
 	@abstractmethod
 	def __get__(self, obj, cls:Optional[type]=None):
@@ -33,6 +46,7 @@ class ProxyPart(Part):
 	
 	attribute: str
 	cast: Callable[[Any], str] = str
+	interned: bool = False  # Share equal values through the intern pool of the URI class, if any; see uri.intern.
 	
 	def __get__(self, obj, cls=None) -> Union[str, 'ProxyPart']:
 		if obj is None: return self
@@ -44,26 +58,50 @@ class ProxyPart(Part):
 		
 		if value is not None:
 			value = self.cast(value)
+			
+			if self.interned:
+				pool = obj.__intern_pool__
+				if pool is not None: value = pool(value)
 		
 		setattr(obj, self.attribute, value)
+		invalidate(obj)
 
 
 class GroupPart(Part):
 	__slots__: Tuple[str, ...] = ()
 	
-	attributes: Iterable[str, ...] = ()
+	attributes: Iterable[str] = ()
 	sep: str = ''
 	
 	def __get__(self, obj, cls:Optional[type]=None) -> Union[str, 'GroupPart']:
 		if obj is None: return self
 		
+		cache = obj._cache
+		
+		if cache is None:
+			cache = obj._cache = {}
+		elif self in cache:
+			return cache[self]
+		
+		result = cache[self] = self.join(obj)
+		return result
+	
+	def join(self, obj, encode:bool=False) -> str:
+		"""Render and join the parts composing this one."""
+		
 		cls = obj.__class__
 		attrs = (getattr(cls, attr).render for attr in self.attributes)
 		values = (getattr(obj, attr) for attr in self.attributes)
-		pipeline = (attr(obj, value) for attr, value in zip(attrs, values))
+		pipeline = (attr(obj, value, False, encode) for attr, value in zip(attrs, values))
 		
 		return self.sep.join(i for i in pipeline if i)
 	
+	def render(self, obj, value:Optional[Stringy], raw:bool=False, encode:bool=False) -> str:
+		if encode and obj is not None:  # The cached rendering is verbatim; the composing parts must be encoded.
+			value = self.join(obj, True)
+		
+		return super().render(obj, value, raw)
+	
 	def __set__(self, obj, value):
 		raise TypeError("{0.__class__.__name__} is not assignable.".format(self))
 
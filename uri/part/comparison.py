@@ -0,0 +1,74 @@
+from typing import Optional, Tuple
+
+from ..parse.rfc3986 import split
+from .base import Part
+from .port import default
+
+Key = Tuple[Optional[str], str, str, str, Optional[str]]
+
+
+class ComparisonPart(Part):
+	"""The normalized form of a URI examined by equality comparison and hashing.
+	
+	A tuple of the scheme name, rendered authority, path, rendered query string, and fragment. Cached alongside the
+	renderings of compound parts, and discarded with them upon modification. The default port of the scheme, if given
+	explicitly, is omitted from the authority, as by the scheme-based normalization of RFC 3986 section 6.2.3.
+	"""
+	
+	__slots__ = ()
+	
+	def __get__(self, obj, cls=None) -> Key:
+		if obj is None: return self
+		
+		cache = obj._cache
+		
+		if cache is None:
+			cache = obj._cache = {}
+		elif self in cache:
+			return cache[self]
+		
+		authority = obj.authority
+		port = obj._port
+		if port is not None and port == default(obj): authority = authority[:-len(str(port)) - 1]  # Always last.
+		
+		query = obj.query  # Through the descriptor, attaching the query string to the cache before the key is recorded.
+		result = cache[self] = (obj._scheme, authority, str(obj.path), query.canonical if query else '',
+				obj._fragment)
+		return result
+	
+	def __set__(self, obj, value):
+		raise TypeError("{0.__class__.__name__} is not assignable.".format(self))
+	
+	def matches(self, obj, value:str) -> bool:
+		"""Determine if the given URI string would compare equal to the given URI, without constructing another.
+		
+		Each component of the string is cast and rendered by the parts of the URI's class, cheapest first, stopping
+		at the first difference. Components found verbatim in the cached key are accepted without normalization.
+		"""
+		
+		cls = obj.__class__
+		ours = self.__get__(obj, cls)
+		scheme, user, password, host, port, path, query, fragment = split(value)
+		
+		if (fragment or None) != ours[4]:
+			return False
+		
+		scheme = cls.scheme.load(scheme) if scheme else None
+		
+		if (scheme.name if scheme else None) != ours[0]:
+			return False
+		
+		if path != ours[2] and (str(cls.path.cast(path)) if path else '.') != ours[2]:
+			return False
+		
+		auth = (cls.user.render(None, user or None), cls.password.render(None, password or None))
+		auth = ''.join(i for i in auth if i)
+		host = cls.host.cast(host) if host else None
+		if scheme and port == scheme.port: port = None
+		authority = (cls.auth.render(None, auth), cls.host.render(None, host), cls.port.render(None, port or None))
+		
+		if ''.join(i for i in authority if i) != ours[1]:
+			return False
+		
+		query = query or ''
+		return query == ours[3] or cls.query.cast(query).canonical == ours[3]
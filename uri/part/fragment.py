@@ -1,3 +1,4 @@
+from ..codec import FRAGMENT
 from .base import ProxyPart
 
 
@@ -6,3 +7,4 @@ class FragmentPart(ProxyPart):
 	
 	attribute = '_fragment'
 	prefix = '#'
+	codec = FRAGMENT
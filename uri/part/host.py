@@ -1,48 +1,110 @@
-from functools import partial
-from socket import inet_pton, AF_INET6, error as SocketError
-from typing import Any, Optional, Union
+from socket import inet_ntop, inet_pton, AF_INET, AF_INET6, error as SocketError
+from typing import NamedTuple, Optional, Union
 
+from ..idna import to_ascii, to_unicode
 from .base import ProxyPart
 
+IPV4 = 'ipv4'  # An IPv4 address literal.
+IPV6 = 'ipv6'  # An IPv6 address literal, optionally with zone identifier, rendered within brackets.
+NAME = 'name'  # A registered name consisting only of ASCII characters.
+IDN = 'idn'  # An internationalized registered name, rendered IDNA encoded.
+
+
+class Host(NamedTuple):
+	"""The classification of a normalized host, and its renderings."""
+	
+	kind: str  # One of IPV4, IPV6, NAME, or IDN.
+	name: str  # The host, with address literals in canonical form.
+	ascii: Optional[str]  # The rendering within a URI; None if the name can not be IDNA encoded.
+	text: str  # The rendering within a URI, without IDNA encoding.
+
+
+HOSTS = {}  # Previously classified hosts, by name.
+LIMIT = 4096  # The maximum number of hosts retained.
+
+
+def classify(name:str) -> Host:
+	"""Identify the kind of a normalized host, canonicalizing address literals and precomputing its renderings.
+	
+	Results are retained for reuse, up to a bounded number of distinct hosts.
+	"""
+	
+	host = HOSTS.get(name)
+	if host is not None: return host
+	
+	address, zoned, zone = name.partition('%')
+	
+	try:
+		address = inet_ntop(AF_INET6, inet_pton(AF_INET6, address))
+	except (SocketError, ValueError):
+		try:
+			address = inet_ntop(AF_INET, inet_pton(AF_INET, name))
+		except (SocketError, ValueError):
+			if name.isascii():
+				host = Host(NAME, name, name, name)
+			else:
+				try: encoded = to_ascii(name)
+				except UnicodeError: encoded = None  # Raised again upon rendering, rather than upon assignment.
+				
+				host = Host(IDN, name, encoded, name)
+		else:
+			host = Host(IPV4, address, address, address)
+	else:
+		address = address + zoned + zone
+		host = Host(IPV6, address, '[' + address + ']', '[' + address + ']')
+	
+	if host.name != name:  # Share the classification of the canonical form, if known.
+		host = HOSTS.get(host.name, host)
+	
+	if len(HOSTS) < LIMIT:
+		HOSTS[name] = host
+		HOSTS.setdefault(host.name, host)
+	
+	return host
+
 
 class HostPart(ProxyPart):
+	"""The host component, classified once upon assignment.
+	
+	The classification, recorded alongside the host, selects the rendering, without examining the host again; see
+	`classify`.
+	"""
+	
 	__slots__ = ()
 	
 	attribute = '_host'
+	interned = True
 	
-	def cast(self, value:str) -> str:
-		value = value.rstrip('.')  # Remove extraneous "DNS root authority" notation.
+	def cast(self, value:Union[str, bytes]) -> str:
+		if isinstance(value, bytes):
+			value = value.decode('ascii')
 		
-		if value.startswith('xn--'):  # Process IDNA - internationalized domain names.
-			value = value.encode('ascii').decode('idna')
+		value = value.lower().rstrip('.')  # Remove extraneous "DNS root authority" notation.
 		
-		return value
-	
-	def render(self, obj, value, raw:bool=False) -> str:
-		result = super().render(obj, value)
+		if not value.isascii():  # Map internationalized domain names, approximating UTS #46; see `uri.idna`.
+			try: value = to_unicode(to_ascii(value))
+			except UnicodeError: pass  # Raised again upon rendering, rather than upon assignment.
 		
-		if result:
-			try:
-				if not raw:
-					result.encode('ascii')
-			except UnicodeEncodeError:
-				result = result.encode('idna').decode('ascii')
-			
-			try:  # Identify and armour IPv6 address literals.
-				inet_pton(AF_INET6, value)
-			except SocketError:
-				pass
-			else:
-				result = '[' + result + ']'
+		elif 'xn--' in value:  # Decode Punycode encoded labels, raising UnicodeError for any malformed.
+			value = to_unicode(value)
 		
-		return result
+		return classify(value).name if value else value
 	
-	def __set__(self, obj, value):
-		if isinstance(value, bytes):
-			value = value.decode('idna')
-		elif value.startswith('xn--'):
-			value = value.encode('ascii').decode('idna')
+	def __set__(self, obj, value) -> None:
+		super().__set__(obj, value)
+		
+		host = obj._host
+		obj._hostinfo = classify(host) if host else None
+	
+	def render(self, obj, value, raw:bool=False, encode:bool=False) -> str:
+		if not value: return self.empty
 		
-		value = value.lower().rstrip('.')
+		host = None if obj is None else obj._hostinfo
+		if host is None or host.name != value: host = classify(value)  # Such as when rendering a foreign value.
 		
-		super().__set__(obj, value)
+		if raw: return host.text
+		
+		result = host.ascii
+		if result is None: result = to_ascii(value)
+		
+		return result
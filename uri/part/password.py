@@ -1,3 +1,4 @@
+from ..codec import PASSWORD
 from .base import ProxyPart
 
 
@@ -6,3 +7,4 @@ class PasswordPart(ProxyPart):
 	
 	attribute = '_password'
 	prefix = ':'
+	codec = PASSWORD
@@ -1,6 +1,7 @@
 from pathlib import PurePosixPath as Path
 from re import compile as r
 
+from ..codec import PATH
 from .base import ProxyPart
 
 
@@ -9,14 +10,15 @@ class PathPart(ProxyPart):
 	
 	attribute = '_path'
 	cast = Path
+	codec = PATH
 	empty = '/'
+	interned = True
 	
 	def __get__(self, obj, cls=None):
 		value = super(PathPart, self).__get__(obj, cls)
 		
-		if value is None:
-			value = Path()
-			obj._trailing = False
+		if value is None:  # The trailing slash flag is already False for an absent path; see URIPart.__set__.
+			return Path()
 		
 		return value
 	
@@ -29,8 +31,8 @@ class PathPart(ProxyPart):
 		
 		super(PathPart, self).__set__(obj, value)
 	
-	def render(self, obj, value, raw=False):
-		result = super(PathPart, self).render(obj, value, raw)
+	def render(self, obj, value, raw=False, encode=False):
+		result = super(PathPart, self).render(obj, value, raw, encode)
 		
 		if result is None or result == '.':
 			if not obj._host:
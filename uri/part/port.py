@@ -1,9 +1,32 @@
+from typing import Optional
+
 from .base import ProxyPart
 
 
+def default(obj) -> Optional[int]:
+	"""The port implied by the scheme of the given URI, if any; see `uri.scheme.Scheme.port`."""
+	
+	return obj.scheme.port if obj._scheme else None
+
+
 class PortPart(ProxyPart):
 	__slots__ = ()
 	
 	attribute = '_port'
 	prefix = ':'
 	cast = int
+	elide: bool = False  # Omit the port when rendering, if the default of the scheme.
+	
+	def render(self, obj, value, raw:bool=False, encode:bool=False) -> str:
+		if self.elide and value is not None and obj is not None and value == default(obj):
+			return self.empty
+		
+		return super().render(obj, value, raw, encode)
+
+
+class OriginPortPart(PortPart):
+	"""The port component as serialized within an origin, omitted if the default of the scheme, per RFC 6454."""
+	
+	__slots__ = ()
+	
+	elide = True
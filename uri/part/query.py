@@ -1,6 +1,7 @@
 from ..typing import Iterable, Mapping, Union
 
-from ..qso import QSO
+from ..codec import QUERY
+from ..qso import QSO, FrozenQSO
 from .base import ProxyPart
 
 
@@ -15,13 +16,23 @@ class QueryPart(ProxyPart):
 	prefix = '?'
 	terminator = '#'
 	cast = QSO
+	codec = QUERY
 	
 	def __get__(self, obj, cls=None) -> QSO:
+		if obj is None: return self
+		
 		result = super(QueryPart, self).__get__(obj, cls)
 		
 		if result is None:
 			result = obj._query = QSO()
 		
+		elif result.__class__ is FrozenQSO:  # Shared with a parse cache entry or another URI; copy on first access.
+			result = obj._query = QSO(result, result.assignment, result.separator, result.strict)
+		
+		cache = obj._cache
+		if cache is None: cache = obj._cache = {}  # Allocated now, so that renderings cached later are invalidated.
+		result._owner_cache = cache  # Mutation in-place must also invalidate any cached renderings.
+		
 		return result
 	
 	def __set__(self, obj, value:QSOLike):
@@ -29,3 +40,13 @@ class QueryPart(ProxyPart):
 			value = ''
 		
 		super(QueryPart, self).__set__(obj, value)
+
+
+class FrozenQueryPart(QueryPart):
+	"""Query string access for immutable URI, returning the FrozenQSO held without copying."""
+	
+	__slots__ = ()
+	
+	def __get__(self, obj, cls=None) -> QSO:
+		if obj is None: return self
+		return obj._query
@@ -1,39 +1,60 @@
-from importlib.metadata import entry_points
+from importlib.metadata import EntryPoint
 from typing import Any, ClassVar, Dict, Optional, Union  #, Self
 from re import compile as r, Pattern
 
-from .base import Part
+from .base import Part, invalidate
+from ..registry import GROUP, index
 from ..scheme import Scheme
 
 
 class SchemePart(Part):
 	__slots__: tuple = ()  # Do not populate a __dict__ dictionary attribute; only allocate space for these.
 	
-	registry: ClassVar[Dict[str, Optional[Scheme]]] = {'': None}  # Singleton cache of Scheme instances, by name.
+	registry: ClassVar[Dict[str, Optional[Scheme]]] = {'': None}  # Singleton cache of registered Schemes, by name.
+	generic: ClassVar[Dict[str, Scheme]] = {}  # Bounded cache of Scheme instances for unregistered names.
+	index: ClassVar[Optional[Dict[str, str]]] = None  # Registered scheme names to entry point object references.
+	limit: ClassVar[int] = 1024  # The maximum number of unregistered names cached.
+	snapshot: ClassVar[Optional[str]] = None  # Optionally, the path of an on-disk copy of the index; see uri.registry.
 	suffix: str = ':'  # Protocol suffix when utilized as part of a complete URI; e.g. ':' or '://'.
 	valid: Pattern = r(r'[a-z][a-z0-9+.+-]*')  # Protocol/scheme name validated when run without optimization.
 	
 	def load(self, plugin:str) -> Scheme:
 		"""Attempt to retrieve a Scheme for the given named protocol.
 		
-		Utilizes a cache, which results in URI utilizing singletons of each named protocol.
+		Utilizes a cache, which results in URI utilizing singletons of each named protocol. Registered entry points are
+		read once, upon the first name not already cached, rather than per name. Unregistered names, which untrusted
+		input may supply without limit, are cached only up to `limit` distinct names; beyond, each lookup produces a
+		new, equal, generic Scheme.
 		"""
 		
 		assert self.valid.match(plugin), f"Invalid plugin name: {plugin!r}"
-		if plugin in self.registry: return self.registry[plugin]  # Short circuit if we've seen this before.
 		
-		# If we haven't, attempt to load the explicit Scheme subclass to utilize for this named scheme.
-		try: result = entry_points(group='uri.scheme')[plugin].load()
-		except KeyError: result = Scheme(plugin)  # Can't look up by registered name? It's generic.
-		else: result = result(plugin)  # Otherwise, instantiate the subclass, informing it of its name.
+		registry = self.registry
+		if plugin in registry: return registry[plugin]  # Short circuit if we've seen this before.
 		
-		self.registry[plugin] = result  # Record the instance in a local registry / cache and return it.
+		generic = self.generic
+		result = generic.get(plugin)
+		if result is not None: return result
+		
+		known = SchemePart.index
+		if known is None: known = SchemePart.index = index(self.snapshot)  # Examine installed metadata only once.
+		
+		reference = known.get(plugin)
+		
+		if reference is None:  # Can't look up by registered name? It's generic.
+			result = Scheme(plugin)
+			if len(generic) < self.limit: generic[plugin] = result
+			return result
+		
+		# Otherwise, instantiate the registered Scheme subclass for this named scheme, informing it of its name.
+		result = EntryPoint(plugin, reference, GROUP).load()(plugin)
+		registry[plugin] = result  # Record the instance in a local registry / cache and return it.
 		
 		return result
 	
-	def render(self, obj, value, raw=False):
+	def render(self, obj, value, raw=False, encode=False):
 		"""Render the scheme component of a whole URI."""
-		result = super(SchemePart, self).render(obj, value, raw)
+		result = super(SchemePart, self).render(obj, value, raw, encode)
 		
 		if obj._scheme and obj.scheme.slashed:
 			result = result + '//'
@@ -57,6 +78,7 @@ class SchemePart(Part):
 		
 		if not value:
 			obj._scheme = None
-			return
+		else:  # This gives the plugin registry a chance to normalize the recorded name.
+			obj._scheme = self.load(value).name
 		
-		obj._scheme = self.load(value).name  # This gives the plugin registry a chance to normalize the recorded name.
+		invalidate(obj)
@@ -1,42 +1,106 @@
 from collections.abc import MutableMapping
 from re import compile as r
-from urllib.parse import urlsplit
+
+from ..parse.rfc3986 import BUFFERS, split
+from ..qso import FrozenQSO
+from .host import classify
 
 
 class URIPart:
-	__slots__ = ('parts', 'writeable', 'raw')
+	__slots__ = ('parts', 'writeable', 'raw', 'encode')
 	
-	def __init__(self, parts, writeable=True, raw=False):
+	def __init__(self, parts, writeable=True, raw=False, encode=False):
 		self.parts = parts
 		self.writeable = writeable
 		self.raw = raw
+		self.encode = encode  # Percent-encode characters not permitted within each component; see uri.codec.
 	
 	def __get__(self, obj, cls=None):
+		cache = obj._cache
+		
+		if cache is None:
+			cache = obj._cache = {}
+		elif self in cache:
+			return cache[self]
+		
 		components = []
 		
 		for part in self.parts:
 			value = getattr(obj, part)
 			part = getattr(cls, part)
 			
-			components.append(part.render(obj, value, self.raw))
+			components.append(part.render(obj, value, self.raw, self.encode))
 		
-		return "".join(components)
+		result = cache[self] = "".join(components)
+		return result
 	
 	def __set__(self, obj, value):
+		"""Parse a whole URI, populating the scalar slots of the target directly.
+		
+		The string is split in a single pass; each component is then cast exactly as its part would on assignment,
+		without the per-part validation a piecemeal assignment requires, as the split has already assured it. Any
+		cached renderings are discarded.
+		
+		Binary buffers (bytes, bytearray, or memoryview) are scanned in place, decoding only the components found.
+		
+		If the class has a parse cache (see `uri.cache.ParseCache`) the cast components are recorded there, and
+		subsequent assignment of the same string copies them into place without parsing. The query string is shared
+		in frozen form, and copied by the query part upon first access. Binary buffers bypass the cache.
+		
+		If the class has an intern pool (see `uri.intern.InternPool`) the user name, host, and path are drawn from it.
+		"""
+		
 		if not self.writeable:
 			raise AttributeError("Can not assign to read-only URI views.")
 		
-		for part in obj.__slots__:
-			setattr(obj, part, None)
+		cls = obj.__class__
+		cache = cls.__parse_cache__
 		
-		if not value:
-			return
+		if isinstance(value, BUFFERS):
+			cache = None  # Buffers may be mutable or unhashable, and are never decoded in whole.
+		elif value:
+			value = str(value)
+		
+		if cache is not None and value:
+			components = cache.get(value)
+			
+			if components is not None:
+				obj._scheme, obj._user, obj._password, obj._host, obj._hostinfo, obj._port, obj._path, obj._trailing, \
+						obj._query, obj._fragment = components
+				obj._cache = None
+				return
+		
+		if value:
+			scheme, user, password, host, port, path, query, fragment = split(value)
+		else:
+			scheme = user = password = host = port = query = fragment = None
+			path = ''
 		
-		result = urlsplit(str(value))
+		user = user or None
+		host = cls.host.cast(host) if host else None
+		cast = cls.path.cast(path) if path else None
+		pool = cls.__intern_pool__
 		
-		obj._trailing = result.path.endswith('/')
+		if pool is not None:  # Share equal values amongst instances; see uri.intern.
+			if user: user = pool(user)
+			if host: host = pool(host)
+			if cast: cast = pool(cast)
+		
+		obj._scheme = cls.scheme.load(scheme).name if scheme else None
+		obj._user = user
+		obj._password = password or None
+		obj._host = host
+		obj._hostinfo = classify(host) if host else None
+		obj._port = port or None
+		obj._path = cast
+		obj._trailing = path.endswith('/')
+		obj._fragment = fragment or None
+		obj._cache = None
+		
+		if cache is None or not value:
+			obj._query = cls.query.cast(query) if query else None
+			return
 		
-		for part in ('scheme', 'username', 'password', 'hostname', 'port', 'path', 'query', 'fragment'):
-			pvalue = getattr(result, part)
-			if pvalue:
-				setattr(obj, part, pvalue)
+		obj._query = FrozenQSO(query) if query else None
+		cache.put(value, (obj._scheme, obj._user, obj._password, obj._host, obj._hostinfo, obj._port, obj._path,
+				obj._trailing, obj._query, obj._fragment))
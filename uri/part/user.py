@@ -1,3 +1,4 @@
+from ..codec import USER
 from .base import ProxyPart
 
 
@@ -5,3 +6,5 @@ class UserPart(ProxyPart):
 	__slots__ = ()
 	
 	attribute = '_user'
+	codec = USER
+	interned = True
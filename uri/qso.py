@@ -1,10 +1,87 @@
+from bisect import bisect_left, insort
 from collections import namedtuple
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Iterable, Mapping, MutableMapping
+from weakref import WeakValueDictionary
 
-from .bucket import Bucket
+from .bucket import Bucket, encode
+from .codec import FORM
+from .limit import LimitExceeded
+from .parse.form import FormDecoder, read
 
 
 SENTINEL = object()
+VACANT = object()  # Marks the position of a removed parameter, distinct from None, the name of unnamed values.
+STATE = ('_names', '_values', '_invalid', '_vacant', '_views', '_groups')  # Populated upon parsing.
+
+
+class Parameter(Bucket):
+	"""A bucket presenting one parameter of a query string, reading from and writing through to that query string.
+	
+	Produced on demand by iteration or numeric indexing. Should the parameter be removed from the query string, the
+	bucket is detached, retaining its last name and value as an independent bucket.
+	
+	As with any bucket, the encoded form is retained once rendered; as the name and value may be replaced through the
+	query string itself, it is recorded alongside the exact name and value encoded, and reused only while both remain.
+	"""
+	
+	__slots__ = ('_owner', '_index', '_encoded', '__weakref__')
+	
+	def __init__(self, owner, index):
+		self._owner = owner
+		self._index = index
+		self.sep = owner.assignment
+		self.valid = owner._valid(index)
+		self._str = None
+		self._encoded = None  # The name, value, and validity last encoded, and the result.
+	
+	@property
+	def name(self):
+		owner = self._owner
+		return self._name if owner is None else owner._names[self._index]
+	
+	@name.setter
+	def name(self, name):
+		owner = self._owner
+		
+		if owner is None:
+			self._name = name
+			return
+		
+		owner._rename(self._index, name)
+		owner._changed()
+	
+	@property
+	def value(self):
+		owner = self._owner
+		return self._value if owner is None else owner._values[self._index]
+	
+	@value.setter
+	def value(self, value):
+		owner = self._owner
+		
+		if owner is None:
+			self._value = value
+			return
+		
+		owner._values[self._index] = value
+		owner._changed()
+	
+	def __str__(self):
+		name, value, valid = self.name, self.value, self.valid
+		encoded = self._encoded
+		
+		if encoded is None or encoded[0] is not name or encoded[1] is not value or encoded[2] is not valid:
+			encoded = self._encoded = (name, value, valid, encode(name, value, self.sep, valid))
+		
+		return encoded[3]
+	
+	def _detach(self):
+		"""Take a private copy of the name and value, prior to their removal from the query string."""
+		
+		owner = self._owner
+		self._name = owner._names[self._index]
+		self._value = owner._values[self._index]
+		self._owner = None
 
 
 class QSO:
@@ -18,13 +95,30 @@ class QSO:
 	unit of communication. This helps to preserve the original position if values are updated, as one benefit.
 	Dictionary-like view methods are provided if you want to "break it down", however, again to preserve order,
 	values are iterated in their original order and keys may be repeated.
+	
+	Names and values are stored in parallel lists, with the positions of each name recorded in ascending order,
+	so that removal or replacement, by key or by bucket, takes constant or logarithmic time. Removal leaves
+	a vacancy, reclaimed when positional access next requires it. Buckets are created only when requested, through
+	iteration or numeric indexing, as views which read from and write through to the query string.
+	
+	A query string given as text is retained as-is, and only parsed upon first access to its contents. Until modified,
+	the original text is returned verbatim when cast to a string, preserving its exact encoding; `canonical` provides
+	the re-encoded form, as used for comparison. Strict instances, and those subject to limits, are parsed immediately,
+	to validate.
+	
+	When attached to a URI, mutation through the methods of this object, or through the buckets it has produced,
+	invalidates the URI's cached renderings. The list returned by `buckets`, and those of buckets by name within the
+	mapping returned by `groups`, are snapshots of such views; modifying the lists themselves has no effect.
 	"""
 	
-	__slots__ = ('buckets', 'groups', 'assignment', 'separator', 'strict')
+	__slots__ = ('_raw', '_canonical', '_names', '_values', '_invalid', '_vacant', '_views', '_groups', 'assignment',
+			'separator', 'strict', '_owner_cache', '_limits')
+	
+	__limits__ = None  # Bounds upon query strings parsed or extended, as a `Limits` instance; see `uri.limit`.
 	
 	def _parts(self, thing):
 		if isinstance(thing, QSO):
-			return (str(part) for part in thing.buckets)
+			return (str(part) for part in thing)
 		
 		if isinstance(thing, Bucket):
 			return (str(thing), )
@@ -33,6 +127,9 @@ class QSO:
 			return thing.items()
 		
 		if isinstance(thing, str):
+			limits = self._limited()
+			if limits: limits.check(thing, self.separator)
+			
 			if self.separator in thing:
 				return thing.split(self.separator)
 			else:
@@ -40,15 +137,433 @@ class QSO:
 		
 		return iter(thing)
 	
-	def __init__(self, q=None, assignment="=", separator="&", strict=False):
-		self.buckets = []
-		self.groups = {}
+	def __init__(self, q=None, assignment="=", separator="&", strict=False, limits=None):
 		self.assignment = assignment
 		self.separator = separator
 		self.strict = strict
+		self._owner_cache = None  # The rendering cache of the URI this query string is attached to, if any.
+		self._raw = None  # The original text, while unmodified.
+		self._canonical = None  # The encoded form, once rendered, while unmodified.
+		self._limits = limits  # Bounds specific to this query string, otherwise those of the class apply.
+		
+		if isinstance(q, QSO) and q.assignment == assignment and q.separator == separator and q._raw and not strict:
+			if limits is None: limits = self._limits = q._limits  # Those of the original, if not given.
+			
+			if not (self.__limits__ if limits is None else limits):
+				self._raw = q._raw  # An unmodified query string may be copied by its text alone.
+				return
+			
+			q = q._raw  # Subject to limits, so validated, and parsed, as text.
+		
+		if q and isinstance(q, str):
+			if limits is None: limits = self.__limits__
+			
+			if limits:
+				limits.check(q, separator)  # Reject oversized input before any further work.
+			
+			elif not strict:
+				self._raw = q
+				return  # The remaining attributes are populated by __getattr__ upon first access.
+			
+			if not strict: self._raw = q
+			self._parse(q, limits)
+			return
+		
+		self._reset()
+		
+		if isinstance(q, QSO) and q.assignment == assignment and not strict:
+			self._copy(q)  # Copy names and values directly, without encoding and decoding them.
+			return
 		
 		if q:
-			self.extend(q)
+			for part in self._parts(q):
+				bucket = Bucket(part, sep=assignment, strict=strict)
+				self._admit(bucket.name, bucket.value)
+				self._append(bucket.name, bucket.value, bucket.valid)
+	
+	@classmethod
+	def from_stream(cls, source, assignment="=", separator="&", strict=False, encoding='utf-8', size=65536,
+			limits=None):
+		"""Construct from a binary or text file-like object, or iterable of chunks, decoding incrementally.
+		
+		Content is read `size` at a time, and is never held whole, nor split into a list of parts; see `FormDecoder`.
+		"""
+		
+		decoder = FormDecoder(assignment, separator, strict, encoding, cls.__limits__ if limits is None else limits)
+		instance = QSO(None, assignment, separator, strict, limits)
+		
+		for chunk in read(source, size):
+			for pair in decoder._split(chunk):
+				instance._append(*pair)
+		
+		for pair in decoder._finish():
+			instance._append(*pair)
+		
+		return instance if cls is QSO else cls(instance, assignment, separator, strict, limits)
+	
+	def __getattr__(self, name):
+		"""Parse the original text upon first access to the contents of this query string."""
+		
+		if name not in STATE or self._raw is None:
+			raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+		
+		self._parse()
+		return object.__getattribute__(self, name)
+	
+	def _parse(self, text=None, limits=None):
+		"""Populate the names and values of this query string from text, by default the original text, without
+		producing buckets.
+		
+		The parsed state is assembled aside, then published, so that threads concurrently accessing an unmodified
+		instance shared between them, such as the FrozenQSO of a parse cache entry, never observe it partially
+		populated. Each may parse it; all publish equal state.
+		"""
+		
+		parsed = QSO.__new__(QSO)
+		parsed.assignment, parsed.separator, parsed.strict = self.assignment, self.separator, self.strict
+		parsed._owner_cache = parsed._raw = parsed._canonical = None
+		parsed._reset()
+		
+		assignment = self.assignment
+		append = parsed._append
+		
+		for part in (self._raw if text is None else text).split(self.separator):
+			name, match, value = part.partition(assignment)
+			
+			if not match:
+				if limits: limits.check_pair(None, name)
+				append(None, FORM.decode(name))
+				continue
+			
+			if limits: limits.check_pair(name, value)
+			valid = assignment not in value
+			
+			if not valid and self.strict:
+				raise ValueError(f"Multiple occurrences of separator {assignment!r} in: '{part}'")
+			
+			append(FORM.decode(name), FORM.decode(value), valid)
+		
+		self._publish(parsed)
+	
+	def _publish(self, parsed):
+		"""Adopt the complete state of another instance; each attribute is assigned once, and in whole."""
+		
+		for name in STATE:
+			setattr(self, name, getattr(parsed, name))
+	
+	def _reset(self):
+		self._names = []  # In order, with VACANT marking the vacancies left by removal.
+		self._values = []
+		self._invalid = None  # The positions of any parameters which may not be re-encoded.
+		self._vacant = 0
+		self._views = None  # Buckets produced and still referenced, by position.
+		self._groups = {}  # The positions of each name, in ascending order.
+	
+	def _copy(self, other):
+		"""Populate from another query string sharing the same assignment symbol."""
+		
+		names, values = other._names, other._values
+		
+		for i in other._occupied():
+			self._append(names[i], values[i], other._valid(i))
+	
+	def _changed(self):
+		"""Discard the original text and encoded form, and the cached renderings of any URI this is attached to."""
+		
+		self._raw = self._canonical = None
+		
+		cache = self._owner_cache
+		if cache: cache.clear()
+	
+	# Index Maintenance
+	
+	@property
+	def buckets(self):
+		"""The buckets of this query string, in order, as views upon it."""
+		
+		if self._vacant:
+			self._compact()
+		
+		return [self._view(i) for i in range(len(self._names))]
+	
+	@property
+	def groups(self):
+		"""The buckets of this query string by name, each a list in order, as views upon it."""
+		
+		return {name: [self._view(i) for i in group] for name, group in self._groups.items()}
+	
+	@property
+	def canonical(self):
+		"""The query string as encoded from its names and values, regardless of the original text."""
+		
+		canonical = self._canonical
+		if canonical is not None: return canonical
+		
+		names, values, invalid, sep = self._names, self._values, self._invalid, self.assignment
+		
+		canonical = self._canonical = self.separator.join(
+				encode(names[i], values[i], sep, invalid is None or i not in invalid) for i in self._occupied()
+			)
+		
+		return canonical
+	
+	def iter_encoded(self, size=65536, encoding='utf-8'):
+		"""Iterate the query string, as cast to a string, encoded as chunks of approximately `size` bytes.
+		
+		Any retained text or rendering is encoded a slice at a time; otherwise parameters are encoded as they are
+		reached. The whole is never held in memory as one string.
+		"""
+		
+		text = self._raw
+		if text is None: text = self._canonical
+		
+		if text is not None:
+			for i in range(0, len(text), size):
+				yield text[i:i + size].encode(encoding)
+			
+			return
+		
+		names, values, invalid, sep = self._names, self._values, self._invalid, self.assignment
+		separator = self.separator
+		parts, length = [], 0
+		
+		for count, i in enumerate(self._occupied()):
+			part = encode(names[i], values[i], sep, invalid is None or i not in invalid)
+			if count: part = separator + part
+			
+			parts.append(part)
+			length += len(part)
+			
+			if length >= size:
+				yield ''.join(parts).encode(encoding)
+				parts, length = [], 0
+		
+		if parts:
+			yield ''.join(parts).encode(encoding)
+	
+	def write_to(self, writer, size=65536, encoding='utf-8'):
+		"""Write the encoded query string to a binary file-like object, bytearray, or socket, a chunk at a time.
+		
+		Returns the number of bytes written.
+		"""
+		
+		if isinstance(writer, bytearray):
+			write = writer.extend
+		else:
+			write = getattr(writer, 'write', None) or writer.sendall
+		
+		written = 0
+		
+		for chunk in self.iter_encoded(size, encoding):
+			write(chunk)
+			written += len(chunk)
+		
+		return written
+	
+	def _occupied(self):
+		"""The positions of the parameters present, skipping vacancies."""
+		
+		if not self._vacant:
+			return range(len(self._names))
+		
+		return (i for i, name in enumerate(self._names) if name is not VACANT)
+	
+	def _valid(self, index):
+		invalid = self._invalid
+		return invalid is None or index not in invalid
+	
+	def _view(self, index):
+		"""Produce the bucket presenting the parameter at the given position, reusing any still referenced."""
+		
+		views = self._views
+		
+		if views is None:
+			views = self._views = WeakValueDictionary()
+		
+		view = views.get(index)
+		
+		if view is None:
+			view = views[index] = Parameter(self, index)
+		
+		return view
+	
+	def _bucket(self, index):
+		"""Produce an independent bucket bearing the name and value at the given position."""
+		
+		views = self._views
+		view = views.get(index) if views else None
+		if view is not None: return view  # Detached upon removal of the parameter.
+		
+		bucket = Bucket.__new__(Bucket)
+		bucket.sep = self.assignment
+		bucket.valid = self._valid(index)
+		bucket.name = self._names[index]
+		bucket.value = self._values[index]
+		
+		return bucket
+	
+	def _locate(self, index):
+		"""Translate a numeric index, possibly negative, into a position, reclaiming any vacancies first."""
+		
+		if self._vacant:
+			self._compact()
+		
+		length = len(self._names)
+		position = index + length if index < 0 else index
+		
+		if not 0 <= position < length:
+			raise IndexError("query string index out of range")
+		
+		return position
+	
+	def _renumber(self, mapping):
+		"""Update the records of position kept in groups, validity, and views, given a list from old to new."""
+		
+		self._groups = {name: sorted(mapping[i] for i in group) for name, group in self._groups.items()}
+		
+		if self._invalid:
+			self._invalid = {mapping[i] for i in self._invalid}
+		
+		views = self._views
+		
+		if views:
+			moved = [(mapping[i], view) for i, view in views.items()]
+			views.clear()
+			
+			for i, view in moved:
+				view._index = i
+				views[i] = view
+	
+	def _compact(self):
+		"""Reclaim vacancies left by removal, renumbering the positions of the remaining parameters."""
+		
+		names = self._names
+		occupied = [i for i, name in enumerate(names) if name is not VACANT]
+		mapping = [0] * len(names)
+		
+		for new, old in enumerate(occupied):
+			mapping[old] = new
+		
+		self._names = [names[i] for i in occupied]
+		self._values = [self._values[i] for i in occupied]
+		self._vacant = 0
+		self._renumber(mapping)
+	
+	def _reclaim(self):
+		"""Bound the space consumed by vacancies."""
+		
+		if self._vacant > 32 and self._vacant * 2 > len(self._names):
+			self._compact()
+	
+	def _limited(self):
+		"""The limits applicable to this query string, if any."""
+		
+		limits = self._limits
+		return self.__limits__ if limits is None else limits
+	
+	def _admit(self, name, value, added=1):
+		"""Enforce any limits upon a parameter about to be added, or, if `added` is zero, assigned in place."""
+		
+		limits = self._limited()
+		if not limits: return
+		
+		limits.check_pair(name, value)
+		
+		if added and limits.parameters is not None and len(self) + added > limits.parameters:
+			raise LimitExceeded('parameters', limits.parameters)
+	
+	def _append(self, name, value, valid=True):
+		"""Record a new parameter at the end."""
+		
+		position = len(self._names)
+		self._names.append(name)
+		self._values.append(value)
+		
+		if not valid:
+			if self._invalid is None: self._invalid = set()
+			self._invalid.add(position)
+		
+		group = self._groups.get(name)
+		
+		if group is None:
+			self._groups[name] = [position]
+		else:
+			group.append(position)
+	
+	def _place(self, index, name):
+		"""Add a position to the group for the given name, preserving ascending order."""
+		
+		group = self._groups.get(name)
+		
+		if group is None:
+			self._groups[name] = [index]
+		elif index > group[-1]:
+			group.append(index)
+		else:
+			insort(group, index)
+	
+	def _unplace(self, index, name):
+		"""Remove a position from the group for the given name, removing the group if emptied."""
+		
+		group = self._groups[name]
+		
+		if group[-1] == index:
+			group.pop()
+		else:
+			del group[bisect_left(group, index)]
+		
+		if not group:  # Clean up after ourselves.
+			del self._groups[name]
+	
+	def _discard(self, index):
+		"""Remove the parameter at the given position, detaching any bucket presenting it."""
+		
+		names, values = self._names, self._values
+		views = self._views
+		
+		if views:
+			view = views.pop(index, None)
+			if view is not None: view._detach()
+		
+		self._unplace(index, names[index])
+		if self._invalid: self._invalid.discard(index)
+		
+		if index == len(names) - 1:
+			names.pop()
+			values.pop()
+			
+			while names and names[-1] is VACANT:  # Trailing vacancies are simply dropped.
+				names.pop()
+				values.pop()
+				self._vacant -= 1
+		
+		else:
+			names[index] = VACANT
+			values[index] = None
+			self._vacant += 1
+	
+	def _find(self, bucket):
+		"""Return the position of the given bucket if it presents a parameter of this query string, otherwise that of
+		the first parameter equal to it, or None."""
+		
+		if isinstance(bucket, Parameter) and bucket._owner is self:
+			return bucket._index
+		
+		group = self._groups.get(bucket.name)
+		if not group: return None
+		
+		values, value = self._values, bucket.value
+		
+		for i in group:
+			if values[i] == value:
+				return i
+	
+	def _rename(self, index, name):
+		"""Change the name of the parameter at the given position, moving it between groups."""
+		
+		self._unplace(index, self._names[index])
+		self._names[index] = name
+		self._place(index, name)
 	
 	# Core Python Protocols
 	
@@ -56,7 +571,40 @@ class QSO:
 		return '{}("{}")'.format(self.__class__.__name__, str(self))
 	
 	def __str__(self):
-		return self.separator.join(str(bucket) for bucket in self.buckets)
+		raw = self._raw
+		if raw is not None: return raw
+		
+		return self.canonical
+	
+	def __bool__(self):
+		return bool(self._raw) or len(self) > 0
+	
+	def __getstate__(self):
+		"""Retain the original text, or otherwise the names and values, compacted; buckets produced are not retained,
+		nor is the association with any URI."""
+		
+		state = {name: getattr(self, name) for name in ('assignment', 'separator', 'strict', '_limits', '_raw',
+				'_canonical')}
+		
+		if self._raw is None:
+			if self._vacant: self._compact()
+			
+			state['_names'] = self._names[:]
+			state['_values'] = self._values[:]
+			state['_invalid'] = set(self._invalid) if self._invalid else None
+			state['_groups'] = {name: group[:] for name, group in self._groups.items()}
+		
+		return state
+	
+	def __setstate__(self, state):
+		self._owner_cache = None
+		
+		for name, value in state.items():
+			setattr(self, name, value)
+		
+		if self._raw is None:
+			self._vacant = 0
+			self._views = None
 	
 	# ABC Protocol Methods
 	
@@ -64,37 +612,44 @@ class QSO:
 		"""Test if a given key is set."""
 		
 		if isinstance(value, int):
-			return 0 <= value < len(self.buckets)
+			return 0 <= value < len(self)
 		
-		return value in self.groups
+		return value in self._groups
 	
 	def __iter__(self):  # Iterable, Collection
 		"""Iterate the individual buckets."""
 		
-		return iter(self.buckets)
+		if self._vacant:
+			self._compact()
+		
+		return (self._view(i) for i in range(len(self._names)))
 	
 	def __len__(self):  # Sized, Collection
 		"""The number of assigned buckets."""
 		
-		return len(self.buckets)
+		return len(self._names) - self._vacant
 	
 	def __reversed__(self):  # Reversible
 		"""Iterate individual buckets, backwards."""
 		
-		return reversed(self.buckets)
+		if self._vacant:
+			self._compact()
+		
+		return (self._view(i) for i in reversed(range(len(self._names))))
 	
 	def __getitem__(self, index):  # Sequence
 		"""Look up a bucket or buckets by numeric index or key."""
 		
 		if isinstance(index, int):
-			return self.buckets[index]
+			return self._view(self._locate(index))
 		
-		group = self.groups[index]
+		group = self._groups[index]
+		values = self._values
 		
 		if len(group) == 1:
-			return group[0].value
+			return values[group[0]]
 		
-		return (bucket.value for bucket in group)
+		return (values[i] for i in group)
 	
 	def __setitem__(self, index, value):  # MutableSequence
 		"""Assign a value or bucket to a given index, or set a value by key.
@@ -105,25 +660,32 @@ class QSO:
 		value = Bucket(value, sep=self.assignment, strict=self.strict)
 		
 		if isinstance(index, int):
-			bucket = self.buckets[index]
+			position = self._locate(index)
+			self._admit(value.name, value.value, 0)
 			
-			if value.name is not None:
-				bucket.name = value.name
+			if value.name is not None and value.name != self._names[position]:
+				self._rename(position, value.name)
 			
-			bucket.value = value.value
+			self._values[position] = value.value
+			self._changed()
 			return
 		
 		value.name = value.name or index
-		buckets = self.groups.get(index)
+		self._admit(value.name, value.value, 0)  # Any addition is subject to the number of parameters upon appending.
+		group = self._groups.get(index)
 		
-		if buckets:
-			if len(buckets) == 1:
-				buckets[0].name = value.name
-				buckets[0].value = value.value
+		if group:
+			if len(group) == 1:
+				position = group[0]
+				if value.name != index: self._rename(position, value.name)
+				self._values[position] = value.value
+				self._changed()
 				return
 			
-			for bucket in list(buckets):
-				self.remove(bucket)
+			for position in reversed(group[:]):
+				self._discard(position)
+			
+			self._reclaim()
 		
 		self.append(value)
 	
@@ -149,19 +711,19 @@ class QSO:
 		"""
 		
 		if isinstance(item, int):
-			item = self.buckets[item]
+			self._discard(self._locate(item))
 		
-		if isinstance(item, Bucket):
-			self.buckets.remove(item)
-			self.groups[item.name].remove(item)
-			
-			if not self.groups[item.name]:  # Clean up after ourselves.
-				del self.groups[item.name]
-			
-			return
+		elif isinstance(item, Bucket):
+			position = self._find(item)
+			if position is None: raise ValueError(f"{item!r} is not present.")
+			self._discard(position)
+		
+		else:
+			for position in reversed(self._groups[item][:]):
+				self._discard(position)
 		
-		for bucket in list(self.groups[item]):
-			del self[bucket]
+		self._reclaim()
+		self._changed()
 	
 	def __iadd__(self, other):  # MutableSequence
 		"""Extend a current set of arguments with another set.
@@ -181,46 +743,82 @@ class QSO:
 		return self
 	
 	def __eq__(self, other):  # Mapping
-		return str(self) == str(other)
+		"""Compare canonical forms, coercing text, bytes, mappings, buckets, and iterables of parameters."""
+		
+		if isinstance(other, bytes):
+			try: other = other.decode('utf-8')
+			except UnicodeDecodeError: return NotImplemented
+		
+		elif not isinstance(other, (QSO, str, Mapping, Bucket, Iterable)):
+			return NotImplemented
+		
+		if isinstance(other, str) and str(self) == other:
+			return True
+		
+		if not isinstance(other, QSO):
+			try:
+				other = self.__class__(other, self.assignment, self.separator)
+			except (TypeError, ValueError):
+				return NotImplemented  # Not an iterable of parameters.
+		
+		return self.canonical == other.canonical
 	
 	def __ne__(self, other):  # Mapping
-		return not (self == other)
+		result = self.__eq__(other)
+		return result if result is NotImplemented else not result
 	
 	# ABC Public Methods
 	
 	def index(self, bucket, start=None, stop=None):  # Sequence
 		bucket = Bucket(bucket, sep=self.assignment, strict=self.strict)
-		return self.buckets.index(bucket)
+		if self._vacant: self._compact()  # Positions are only contiguous once compacted.
+		
+		position = self._find(bucket)
+		if position is None: raise ValueError(f"{bucket!r} is not present.")
+		
+		return position
 	
 	def count(self, thing):  # Sequence
-		if not self.buckets:
-			return 0
+		if thing in self._groups:
+			return len(self._groups[thing])
 		
-		if thing in self.groups:
-			return len(self.groups[thing])
+		thing = Bucket(thing, sep=self.assignment, strict=self.strict)
+		if thing.name is not None: return 0
 		
-		return self.groups.get(None, []).count(Bucket(thing, sep=self.assignment, strict=self.strict))
+		values, value = self._values, thing.value
+		return sum(1 for i in self._groups.get(None, ()) if values[i] == value)
 	
 	def append(self, bucket):  # MutableSequence
 		bucket = Bucket(bucket, sep=self.assignment, strict=self.strict)
-		self.buckets.append(bucket)
-		self.groups.setdefault(bucket.name, []).append(bucket)
+		self._admit(bucket.name, bucket.value)
+		self._append(bucket.name, bucket.value, bucket.valid)
+		self._changed()
 	
 	def insert(self, index, value):  # MutableSequence
+		if self._vacant: self._compact()
+		
+		names = self._names
+		length = len(names)
+		
 		if index < 0:  # Allow insertions at end-relative positions.
-			index = len(self.buckets) + index
-		index = min(len(self.buckets), index)
+			index = length + index
+		index = max(0, min(length, index))
 		
 		bucket = Bucket(value, sep=self.assignment, strict=self.strict)
+		self._admit(bucket.name, bucket.value)
+		
+		if index < length:
+			self._renumber([i if i < index else i + 1 for i in range(length)])
+		
+		names.insert(index, bucket.name)
+		self._values.insert(index, bucket.value)
+		self._place(index, bucket.name)
 		
-		count = 0
-		for i, b in enumerate(self.buckets):
-			if i >= index: break
-			if b.name == bucket.name:
-				count += 1
+		if not bucket.valid:
+			if self._invalid is None: self._invalid = set()
+			self._invalid.add(index)
 		
-		self.buckets.insert(index, bucket)
-		self.groups.setdefault(b.name, []).insert(count, bucket)
+		self._changed()
 	
 	def extend(self, *args):  # MutableSequence
 		for parts in args:
@@ -236,39 +834,52 @@ class QSO:
 		
 		if isinstance(key, int):
 			try:
-				bucket = self.buckets[key]
+				position = self._locate(key)
 			except IndexError:
 				if default is SENTINEL:
 					raise KeyError()
 				return default
 			
-			del self[bucket]
+			bucket = self._bucket(position)
+			self._discard(position)
+			self._reclaim()
+			self._changed()
 			return bucket
 		
 		try:
-			bucket = self.groups[key].pop()
+			position = self._groups[key][-1]
 		except KeyError:
 			if default is SENTINEL:
 				raise
 			return default
 		
-		self.buckets.remove(bucket)
-		return bucket.value
+		value = self._values[position]
+		self._discard(position)
+		self._reclaim()
+		self._changed()
+		return value
 	
 	def reverse(self):  # MutableSequence
-		self.buckets.reverse()
+		if self._vacant: self._compact()
 		
-		for group in self.groups.values():
-			group.reverse()
+		self._names.reverse()
+		self._values.reverse()
+		
+		last = len(self._names) - 1
+		self._renumber([last - i for i in range(last + 1)])
+		
+		self._changed()
 	
 	def keys(self):  # Mapping
-		return (bucket.name for bucket in self.buckets)
+		return (name for name in self._names if name is not VACANT)
 	
 	def items(self):  # Mapping
-		return (tuple(bucket) for bucket in self.buckets)
+		names, values = self._names, self._values
+		return ((values[i], ) if names[i] is None else (names[i], values[i]) for i in self._occupied())
 	
 	def values(self):  # Mapping
-		return (bucket.value for bucket in self.buckets)
+		values = self._values
+		return (values[i] for i in self._occupied())
 	
 	def get(self, bucket, default=None):  # Mapping
 		if bucket in self:
@@ -276,11 +887,32 @@ class QSO:
 		
 		return default
 	
+	def first(self, name, default=None):
+		"""Retrieve the first value of the named argument, or the default if absent.
+		
+		Where the original text has not yet been parsed, it is scanned only as far as the first occurrence of the name,
+		decoding no other values, and remains unparsed; see `extract`. Any limits applicable are enforced.
+		"""
+		
+		try:
+			groups = object.__getattribute__(self, '_groups')
+		except AttributeError:  # Retained text, not yet parsed.
+			return extract(self._raw, (name, ), self.assignment, self.separator, self._limited()).get(name, default)
+		
+		group = groups.get(name)
+		return self._values[group[0]] if group else default
+	
 	def clear(self):  # MutableMapping
 		"""Clear all values from this query string object."""
 		
-		del self.buckets[:]
-		self.groups.clear()
+		views = self._views
+		
+		if views:
+			for view in list(views.values()):
+				view._detach()
+		
+		self._reset()
+		self._changed()
 	
 	def update(self, *args, **kw):  # MutableMapping
 		for parts in args:
@@ -293,3 +925,119 @@ class QSO:
 
 
 MutableMapping.register(QSO)
+
+
+class FrozenQSO(QSO):
+	"""An immutable, hashable query string object, as used by FrozenURI.
+	
+	All methods which would mutate the query string raise TypeError. Iteration or numeric indexing produces
+	independent buckets, rather than views, so that the frozen value may not be altered through them; the original
+	text, if any, is therefore always retained. Two frozen query strings hash alike if their canonical forms are alike,
+	consistent with QSO equality.
+	"""
+	
+	__slots__ = ('_hash', )
+	
+	def __init__(self, q=None, assignment="=", separator="&", strict=False, limits=None):
+		super(FrozenQSO, self).__init__(q, assignment, separator, strict, limits)
+		self._hash = None
+		
+		if self._raw is None:
+			self._freeze(self)
+	
+	def _publish(self, parsed):
+		self._freeze(parsed)  # Frozen before publication, so the mutable forms are never observed.
+		super(FrozenQSO, self)._publish(parsed)
+	
+	@staticmethod
+	def _freeze(qso):
+		qso._names = tuple(qso._names)
+		qso._values = tuple(qso._values)
+		qso._groups = {name: tuple(group) for name, group in qso._groups.items()}
+	
+	def __setstate__(self, state):
+		super(FrozenQSO, self).__setstate__(state)
+		self._hash = None
+	
+	@property
+	def buckets(self):
+		return tuple(self)
+	
+	@property
+	def groups(self):
+		return {name: tuple(self._bucket(i) for i in group) for name, group in self._groups.items()}
+	
+	def __hash__(self):
+		value = self._hash
+		
+		if value is None:
+			value = self._hash = hash(self.canonical)
+		
+		return value
+	
+	def __iter__(self):
+		return (self._bucket(i) for i in range(len(self._names)))
+	
+	def __reversed__(self):
+		return (self._bucket(i) for i in reversed(range(len(self._names))))
+	
+	def __getitem__(self, index):
+		if isinstance(index, int):
+			return self._bucket(self._locate(index))
+		
+		return super(FrozenQSO, self).__getitem__(index)
+	
+	def _immutable(self, *args, **kw):
+		raise TypeError(f"'{self.__class__.__name__}' object is immutable")
+	
+	__setitem__ = __delitem__ = __iadd__ = _immutable
+	append = insert = extend = remove = pop = reverse = clear = update = _immutable
+
+
+FROZEN_EMPTY = FrozenQSO()  # Shared by every FrozenURI lacking a query string.
+
+
+def extract(query, keys, assignment="=", separator="&", limits=None):
+	"""Retrieve the first value of each of the given keys from query string text, without constructing a QSO.
+	
+	The text is scanned once, from the start, stopping as soon as every key has been found. Only names are decoded
+	until one matches; only the values of matching names are decoded at all. Keys not present are absent from the
+	result. Limits, by default those of QSO, are applied to the whole and to each pair extracted.
+	
+		>>> extract('id=27&page=2&sort=name', ('id', 'page'))
+		{'id': '27', 'page': '2'}
+	"""
+	
+	if isinstance(keys, str): keys = (keys, )
+	if limits is None: limits = QSO.__limits__
+	
+	found = {}
+	remaining = set(keys)
+	if not query or not remaining: return found
+	if limits: limits.check(query, separator)
+	
+	decode = FORM.decode
+	length, step, skip = len(query), len(separator), len(assignment)
+	start = 0
+	
+	while start <= length:
+		end = query.find(separator, start)
+		if end < 0: end = length
+		
+		middle = query.find(assignment, start, end)
+		
+		if middle >= 0:  # Unnamed values are never matched.
+			name = raw = query[start:middle]
+			if '%' in name or '+' in name: name = decode(name)
+			
+			if name in remaining:
+				value = query[middle + skip:end]
+				if limits: limits.check_pair(raw, value)
+				
+				found[name] = decode(value)
+				remaining.discard(name)
+				if not remaining: break
+		
+		start = end + step
+	
+	return found
@@ -0,0 +1,115 @@
+"""The index of named schemes registered by installed distributions through the `uri.scheme` entry point group.
+
+Entry points are discovered by examining the metadata of every installed distribution, which is slow where many are
+installed. The index is read once, upon the first lookup of a scheme not yet loaded, and records only the name and
+object reference of each; the referenced Scheme subclasses are imported individually, as they are used.
+
+Optionally, the index may be recorded on disk, to be reused by later processes, such as the workers of an application
+server, rather than each examining installed metadata again:
+
+	from uri.part.scheme import SchemePart
+	
+	SchemePart.snapshot = '/var/cache/myapp/uri-schemes.json'
+
+The snapshot is qualified by the installed distribution metadata found upon the import path: the name of each
+metadata directory, which changes as distributions are installed, upgraded, or removed, and the modification time of
+its entry points, which changes as any is reinstalled. Other files upon the import path, including the snapshot itself,
+are disregarded. A snapshot not matching the running interpreter is replaced. Failure to read or write the snapshot
+is not an error; the index is read from installed metadata instead.
+"""
+
+from importlib.metadata import entry_points
+from json import dump, load
+from os import replace, scandir, stat, unlink
+from os.path import dirname, join
+from sys import path as search
+from tempfile import NamedTemporaryFile
+from typing import Dict, Optional
+
+GROUP = 'uri.scheme'  # The entry point group naming Scheme subclasses.
+VERSION = 2  # The format of snapshots written.
+METADATA = ('.dist-info', '.egg-info')  # The suffixes of installed distribution metadata directories.
+
+
+def fingerprint() -> list:
+	"""Identify the installed distributions upon the import path: each metadata directory found within each entry,
+	with the modification time of its entry points, if any. Archives upon the path are identified by their own."""
+	
+	result = []
+	
+	for entry in search:
+		try:
+			with scandir(entry or '.') as found:
+				names = sorted(item.name for item in found if item.name.endswith(METADATA))
+		
+		except NotADirectoryError:  # An archive, such as an egg or zip file.
+			result.append([entry, None, mtime(entry)])
+			continue
+		
+		except OSError:
+			continue
+		
+		for name in names:
+			result.append([entry, name, mtime(join(entry, name, 'entry_points.txt'))])
+	
+	return result
+
+
+def mtime(path:str) -> Optional[int]:
+	"""The modification time of the given file, or None if it does not exist."""
+	
+	try: return stat(path).st_mtime_ns
+	except OSError: return None
+
+
+def scan() -> Dict[str, str]:
+	"""Read the registered schemes from installed metadata, mapping each name to its object reference."""
+	
+	return {point.name: point.value for point in entry_points(group=GROUP)}
+
+
+def read(path:str) -> Optional[Dict[str, str]]:
+	"""Retrieve the index recorded within a snapshot, or None if absent, unreadable, or not current."""
+	
+	try:
+		with open(path, encoding='utf-8') as fh:
+			snapshot = load(fh)
+		
+		if snapshot['version'] != VERSION or snapshot['path'] != fingerprint(): return None
+		return dict(snapshot['schemes'])
+	
+	except (OSError, ValueError, KeyError, TypeError):
+		return None
+
+
+def write(path:str, schemes:Dict[str, str]) -> None:
+	"""Record an index as a snapshot, replacing any existing one atomically, so that concurrent readers never see a
+	partial file."""
+	
+	snapshot = {'version': VERSION, 'path': fingerprint(), 'schemes': schemes}
+	name = None
+	
+	try:
+		with NamedTemporaryFile('w', encoding='utf-8', dir=dirname(path) or '.', delete=False) as fh:
+			name = fh.name
+			dump(snapshot, fh)
+		
+		replace(name, path)
+	
+	except OSError:
+		if name:
+			try: unlink(name)
+			except OSError: pass
+
+
+def index(snapshot:Optional[str]=None) -> Dict[str, str]:
+	"""Read the registered schemes, from the given snapshot if current, otherwise from installed metadata, recording
+	them to the snapshot for reuse."""
+	
+	schemes = read(snapshot) if snapshot else None
+	
+	if schemes is None:
+		schemes = scan()
+		if snapshot: write(snapshot, schemes)
+	
+	return schemes
@@ -0,0 +1,189 @@
+"""Typed decoding of query strings against a schema declared once, in place of conversion scattered across handlers.
+
+	from uri.schema import QSOSchema
+	
+	schema = QSOSchema(page=(int, 1), tags=[str], debug=bool)
+	
+	schema.decode('page=2&tags=a&tags=b')  # {'page': 2, 'tags': ['a', 'b'], 'debug': None}
+	schema.record(URI('http://example.com/?debug')).debug  # True
+
+Each argument is declared by a converter, a callable accepting the decoded string value and returning the typed value
+or raising ValueError. A converter within a list, such as `[str]`, collects every occurrence, in order; otherwise the
+first occurrence is used. A `(converter, default)` pair supplies the value used when the argument is absent; lacking
+one, absent arguments are None, or an empty list. Arguments whose names are not Python identifiers may be declared by
+mapping.
+
+Query strings given as text, including those retained unparsed by QSO or URI, are walked once, decoding only the names
+and values of declared arguments. Values which fail conversion raise `ParameterError`, a ValueError.
+"""
+
+from collections import namedtuple
+from typing import Any, Callable, Mapping, NamedTuple, Optional, Union
+
+from .codec import FORM
+from .qso import QSO
+from .uri import URI
+
+TRUE = frozenset(('1', 'true', 'yes', 'on', 't', 'y'))
+FALSE = frozenset(('', '0', 'false', 'no', 'off', 'f', 'n'))
+
+
+class ParameterError(ValueError):
+	"""Raised upon decoding a query string argument which could not be converted to its declared type."""
+	
+	def __init__(self, name:str, value:str):
+		super().__init__(f"Invalid value for query string argument {name!r}: {value!r}")
+		self.name = name
+		self.value = value
+
+
+def boolean(value:str) -> bool:
+	"""Convert common textual representations of truth, such as "true", "on", or "1", case-insensitively."""
+	
+	value = value.lower()
+	if value in TRUE: return True
+	if value in FALSE: return False
+	
+	raise ValueError(f"Not a boolean value: {value!r}")
+
+
+class Field(NamedTuple):
+	"""The compiled declaration of one query string argument."""
+	
+	convert: Callable[[str], Any]
+	repeated: bool
+	default: Any
+
+
+class QSOSchema:
+	"""A declaration of the arguments expected within a query string, compiled to decode and convert them in one pass.
+	
+	See the module documentation for the forms of declaration. The builtin `bool` is replaced by `boolean`, as bool of
+	any non-empty string is True; a boolean argument given without a value, such as `?debug`, is true.
+	"""
+	
+	__slots__ = ('fields', 'assignment', 'separator', 'limits', 'Record')
+	
+	def __init__(self, fields:Optional[Mapping[str, Any]]=None, *, assignment:str="=", separator:str="&",
+			limits=None, **kw):
+		self.assignment = assignment
+		self.separator = separator
+		self.limits = limits  # By default, those of QSO; see `uri.limit`.
+		self.fields = {name: self._compile(spec) for name, spec in dict(fields or (), **kw).items()}
+		self.Record = namedtuple('Record', self.fields, rename=True)  # Invalid identifiers are renamed _0, _1, ...
+	
+	@staticmethod
+	def _compile(spec) -> Field:
+		if isinstance(spec, tuple):
+			spec, default = spec
+		else:
+			default = None
+		
+		repeated = isinstance(spec, list)
+		
+		if repeated:
+			spec, = spec
+			if default is None: default = ()
+		
+		if spec is bool: spec = boolean
+		
+		return Field(spec, repeated, default)
+	
+	def __repr__(self):
+		return f"{self.__class__.__name__}({', '.join(self.fields)})"
+	
+	def decode(self, query:Union[str, QSO, URI]) -> dict:
+		"""Decode the declared arguments of a query string, or the query string of a URI, to a dictionary.
+		
+		Every declared argument is present in the result, in order of first appearance, followed by those absent.
+		"""
+		
+		if isinstance(query, URI):
+			query = query._query
+		
+		if query is None:
+			result = {}
+		
+		elif isinstance(query, QSO):
+			text = query._raw
+			
+			if text is None:  # Already parsed, or constructed other than from text; examine the values directly.
+				names, values = query._names, query._values
+				result = self._pairs((names[i], values[i]) for i in query._occupied())
+			else:
+				result = self._text(text)
+		
+		else:
+			result = self._text(query)
+		
+		for name, field in self.fields.items():
+			if name not in result:
+				result[name] = list(field.default) if field.repeated else field.default
+		
+		return result
+	
+	def record(self, query:Union[str, QSO, URI]) -> tuple:
+		"""Decode the declared arguments of a query string to an instance of `Record`, a named tuple."""
+		
+		result = self.decode(query)
+		return self.Record._make(result[name] for name in self.fields)
+	
+	def _text(self, text:str) -> dict:
+		limits = QSO.__limits__ if self.limits is None else self.limits
+		fields, assignment, decode = self.fields, self.assignment, FORM.decode
+		result = {}
+		
+		if not text: return result
+		if limits: limits.check(text, self.separator)
+		
+		for part in text.split(self.separator):
+			raw, match, value = part.partition(assignment)
+			name = decode(raw) if '%' in raw or '+' in raw else raw
+			
+			field = fields.get(name)
+			if field is None: continue
+			
+			if not match:  # A bare name is only meaningful as a boolean flag.
+				if field.convert is boolean: self._store(result, name, field, 'true')
+				continue
+			
+			if limits: limits.check_pair(raw, value)
+			self._store(result, name, field, value, decode)
+		
+		return result
+	
+	def _pairs(self, pairs) -> dict:
+		fields = self.fields
+		result = {}
+		
+		for name, value in pairs:
+			if name is None:  # An unnamed value, possibly a boolean flag.
+				field = fields.get(value)
+				if field is not None and field.convert is boolean: self._store(result, value, field, 'true')
+				continue
+			
+			field = fields.get(name)
+			if field is not None: self._store(result, name, field, value)
+		
+		return result
+	
+	@staticmethod
+	def _store(result:dict, name:str, field:Field, value:str, decode:Optional[Callable[[str], str]]=None) -> None:
+		"""Decode and convert a value, recording it unless it is a later occurrence of a singular argument."""
+		
+		repeated = field.repeated
+		if not repeated and name in result: return
+		
+		if decode: value = decode(value)
+		
+		try:
+			value = field.convert(value)
+		except (ValueError, TypeError) as e:
+			raise ParameterError(name, value) from e
+		
+		if not repeated:
+			result[name] = value
+		elif name in result:
+			result[name].append(value)
+		else:
+			result[name] = [value]
@@ -1,10 +1,11 @@
-from .typing import Union, Stringy
+from .typing import Optional, Union, Stringy
 
 
 class Scheme:
 	__slots__ = ('name', )
 	
 	slashed = False  # Do NOT include // separator between scheme and remainder.
+	port: Optional[int] = None  # The port implied when none is given, omitted where the URI is normalized.
 	
 	def __init__(self, name:Stringy):
 		self.name = str(name).strip().lower()
@@ -13,8 +14,8 @@ class Scheme:
 		if isinstance(other, str):
 			return self.name == other
 		
-		if isinstance(other, self.__class__):
-			return self is other
+		if isinstance(other, self.__class__):  # Generic schemes beyond the bound of their cache are not singletons.
+			return self is other or self.name == other.name
 	
 	def __hash__(self) -> int:
 		return hash(self.name)
@@ -44,4 +45,56 @@ class URLScheme(Scheme):
 		return not uri._host or not uri._path.is_absolute()
 
 
+# URL schemes with a well-known default port, declared by registering the appropriate subclass as the entry point.
+
+class FTPScheme(URLScheme):
+	__slots__ = ()
+	port = 21
+
+
+class SFTPScheme(URLScheme):
+	__slots__ = ()
+	port = 22
+
+
+class TelnetScheme(URLScheme):
+	__slots__ = ()
+	port = 23
+
+
+class HTTPScheme(URLScheme):
+	__slots__ = ()
+	port = 80
+
+
+class LDAPScheme(URLScheme):
+	__slots__ = ()
+	port = 389
+
+
+class HTTPSScheme(URLScheme):
+	__slots__ = ()
+	port = 443
+
+
+class MySQLScheme(URLScheme):
+	__slots__ = ()
+	port = 3306
+
+
+class PostgreSQLScheme(URLScheme):
+	__slots__ = ()
+	port = 5432
+
+
+class RedisScheme(URLScheme):
+	__slots__ = ()
+	port = 6379
+
+
+class MongoDBScheme(URLScheme):
+	__slots__ = ()
+	port = 27017
+
+
 SchemeLike = Union[Stringy,Scheme]
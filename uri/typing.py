@@ -39,5 +39,5 @@ class LinkableMethod(Protocol):
 		pass
 
 
-# Any object that may in some way provide a URI.
-URILike = Union[Stringy, PathURI, Linkable, LinkableMethod]
+# Any object that may in some way provide a URI, including binary buffers containing one.
+URILike = Union[Stringy, PathURI, Linkable, LinkableMethod, bytes, bytearray, memoryview]
@@ -1,23 +1,24 @@
 from collections.abc import Mapping, MutableMapping
 from pathlib import PurePosixPath as Path
 from re import compile as r
-from socket import getservbyname
 from urllib.parse import urljoin
 
 from .typing import Union, URILike, Optional
 from .part.auth import AuthenticationPart, SafeAuthenticationPart
 from .part.authority import AuthorityPart
 from .part.base import BasePart
+from .part.comparison import ComparisonPart
 from .part.fragment import FragmentPart
 from .part.heir import HeirarchicalPart
 from .part.host import HostPart
 from .part.password import PasswordPart
 from .part.path import PathPart
-from .part.port import PortPart
+from .part.port import OriginPortPart, PortPart
 from .part.query import QueryPart
 from .part.scheme import SchemePart
 from .part.uri import URIPart
 from .part.user import UserPart
+from .qso import FrozenQSO
 from .scheme import Scheme, SchemeLike
 
 
@@ -30,11 +31,14 @@ class URI:
 	"""
 	
 	# Skip allocation of a dictionary per instance by pre-defining available slots.
-	__slots__ = ('_scheme', '_user', '_password', '_host', '_port', '_path', '_trailing', '_query', '_fragment')
+	__slots__ = ('_scheme', '_user', '_password', '_host', '_hostinfo', '_port', '_path', '_trailing', '_query',
+			'_fragment', '_cache')
 	
 	__parts__ = ('scheme', 'authority', 'path', 'query', 'fragment')
 	__origin_parts__ = ('scheme', 'authority')
 	__safe_parts__ = ('scheme', '_safe_auth', 'host', 'port', 'path', 'query', 'fragment')
+	__parse_cache__ = None  # Optionally, a uri.cache.ParseCache instance consulted upon whole-URI assignment.
+	__intern_pool__ = None  # Optionally, a uri.intern.InternPool instance sharing equal hosts, user names, and paths.
 	__all_parts__ = {'scheme', 'user', 'password', 'host', 'port', 'path', 'query', 'fragment', 'auth', 'authority',
 			'heirarchical', 'uri', 'username', 'hostname', 'authentication'}
 	
@@ -53,13 +57,16 @@ class URI:
 	_safe_auth = SafeAuthenticationPart()
 	authority = netloc = AuthorityPart()
 	heirarchical = HeirarchicalPart()
+	_key = ComparisonPart()  # The normalized form examined by comparison.
+	_origin_port = OriginPortPart()
 	
 	# Additional Compound Interfaces
 	uri = URIPart(__parts__)  # Whole-URI retrieval or storage as string.
+	encoded = URIPart(__parts__, False, False, True)  # Whole-URI retrieval, percent-encoding disallowed characters.
 	origin = URIPart(__origin_parts__)  # The top-level "origin" for this URL.
 	safe = safe_uri = URIPart(__safe_parts__, False)  # URI retrieval without password component, useful for logging.
 	base = BasePart()
-	origin = URIPart(('scheme', 'host', 'port'), False)
+	origin = URIPart(('scheme', 'host', '_origin_port'), False)
 	summary = URIPart(('host', 'path'), False, True)
 	resource = URIPart(('path', 'query', 'fragment'), False)
 	defrag = URIPart(tuple([i for i in __all_parts__ if i != 'fragment']))  # Fragments are not sent to web servers.
@@ -79,19 +86,17 @@ class URI:
 		
 		scheme = environ['wsgi.url_scheme']
 		
-		uri = URI(
+		# Handled this way to automatically elide default port numbers.
+		port = int(environ['SERVER_PORT'])
+		if port == URI.scheme.load(scheme).port: port = None
+		
+		return URI(
 				scheme = scheme,
 				host = environ['SERVER_NAME'],
+				port = port,
 				path = environ['SCRIPT_NAME'] + environ['PATH_INFO'],
 				query = environ['QUERY_STRING']
 			)
-		
-		# Handled this way to automatically elide default port numbers.
-		service = getservbyname(scheme)
-		port = int(environ['SERVER_PORT'])
-		if not service or service != port: uri.port = port
-		
-		return uri
 	
 	# Shortcuts
 	
@@ -112,16 +117,35 @@ class URI:
 		If both a base URI and parts are supplied than the parts will override those present in the URI.
 		"""
 		
-		if hasattr(_uri, '__link__'):  # We utilize a custom object protocol to retrieve links to things.
-			_uri = _uri.__link__
+		if isinstance(_uri, URI):  # Copy the components of another URI directly, rather than rendering and re-parsing.
+			query = _uri._query
 			
-			# To allow for simpler cases, this attribute does not need to be callable.
-			if callable(_uri): _uri = _uri()
-		
-		if hasattr(_uri, 'as_uri'):  # Support pathlib method protocol.
-			_uri = _uri.as_uri()
+			if query and query.__class__ is not FrozenQSO:  # Frozen query strings are shared, and copied on write.
+				query = self.__class__.query.cast(query)
+			
+			self._scheme = _uri._scheme
+			self._user = _uri._user
+			self._password = _uri._password
+			self._host = _uri._host
+			self._hostinfo = _uri._hostinfo
+			self._port = _uri._port
+			self._path = _uri._path
+			self._trailing = _uri._trailing
+			self._query = query or None
+			self._fragment = _uri._fragment
+			self._cache = None
 		
-		self.uri = _uri  # If None, this will also handle setting defaults.
+		else:
+			if hasattr(_uri, '__link__'):  # We utilize a custom object protocol to retrieve links to things.
+				_uri = _uri.__link__
+				
+				# To allow for simpler cases, this attribute does not need to be callable.
+				if callable(_uri): _uri = _uri()
+			
+			if hasattr(_uri, 'as_uri'):  # Support pathlib method protocol.
+				_uri = _uri.as_uri()
+			
+			self.uri = _uri  # If None, this will also handle setting defaults.
 		
 		if parts:  # If not given a base URI, defines a new URI, otherwise update the given URI.
 			for part, value in parts.items():
@@ -147,23 +171,49 @@ class URI:
 		
 		return self.uri.encode('utf-8')
 	
+	def __copy__(self):
+		"""Copy the components, including a distinct query string, but not the cached renderings."""
+		
+		return self.__class__(self)
+	
+	def __deepcopy__(self, memo):
+		return self.__class__(self)  # The remaining components are immutable.
+	
+	def __getstate__(self):
+		"""Pickle the components present, omitting the cached renderings."""
+		
+		state = {}
+		
+		for slot in URI.__slots__:
+			if slot == '_cache': continue
+			
+			try: state[slot] = object.__getattribute__(self, slot)
+			except AttributeError: pass
+		
+		return state
+	
+	def __setstate__(self, state):
+		for slot, value in state.items():
+			object.__setattr__(self, slot, value)
+		
+		object.__setattr__(self, '_cache', None)
+	
 	# Python Comparison Protocol
 	
 	def __eq__(self, other):
-		"""Compare this URI against another value."""
+		"""Compare this URI against another value.
 		
-		if not isinstance(other, self.__class__):
-			other = self.__class__(other)
+		The normalized components of each are compared, as cached by the `_key` part. Strings are compared without
+		constructing a URI to represent them; other values are first passed to the URI constructor.
+		"""
 		
-		# Because things like query string argument order may differ, but still be equivalent...
-		for part in self.__parts__:
-			ours = getattr(self, part, None)
-			theirs = getattr(other, part, None)
-			
-			if ours != theirs:
-				return False
+		if isinstance(other, str):
+			return self.__class__._key.matches(self, other)
 		
-		return True
+		if not isinstance(other, URI):
+			other = self.__class__(other)
+		
+		return self._key == other._key
 	
 	def __ne__(self, other):
 		"""Inverse comparison support."""
@@ -191,13 +241,21 @@ class URI:
 			authd_url = url['username':'password']
 		"""
 		
-		if isinstance(name, slice):
-			self = self.__class__(str(self))  # We do not mutate ourselves; instead, mutate a clone.
-			self.user, self.password = name.start, name.stop
-			return self
+		if isinstance(name, slice):  # We do not mutate ourselves; instead, produce a modified clone.
+			return self.__class__(self, user=name.start, password=name.stop)
 		
 		return self.query[name]
 	
+	def query_get(self, name, default=None):
+		"""Retrieve the first value of a query string argument, or the default if absent.
+		
+		Where the query string has not yet been parsed, its text is scanned only as far as the first occurrence of the
+		argument, decoding no other values, and the query string remains unparsed; see `QSO.first`.
+		"""
+		
+		query = self._query
+		return default if query is None else query.first(name, default)
+	
 	def __setitem__(self, name, value):
 		"""Shortcut for (re)assignment of query string arguments."""
 		
@@ -215,7 +273,7 @@ class URI:
 	
 	def __len__(self):
 		"""The length of the URI as a string."""
-		return len(str(self.uri))
+		return len(self.uri)
 	
 	# Path-like behaviours.
 	
@@ -296,17 +354,9 @@ class URI:
 		"""Attempt to resolve a new URI given an updated URI, partial or complete."""
 		
 		if uri:
-			result = self.__class__(urljoin(str(self), str(uri)))
-		else:
-			result = self.__class__(self)
-		
-		for part, value in parts.items():
-			if part not in self.__all_parts__:
-				raise TypeError("Unknown URI component: " + part)
-			
-			setattr(result, part, value)
+			return self.__class__(urljoin(str(self), str(uri)), **parts)
 		
-		return result
+		return self.__class__(self, **parts)
 
 
 MutableMapping.register(URI)